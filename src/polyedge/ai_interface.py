@@ -18,11 +18,18 @@ import json
 import logging
 import math
 import os
-import statistics
+import re
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import aiohttp
+import orjson
+
+try:  # optional: vectorized aggregation for wide result sets
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None
 
 logger = logging.getLogger(__name__)
 
@@ -71,104 +78,200 @@ SWARM_RETRY_TOTAL = 1
 # OpenRouter API
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 
+# Per-call request invariants
+_BASE_PAYLOAD = {"temperature": 0.1, "max_tokens": 2000}  # type: Dict[str, Any]
+_PER_MODEL_TIMEOUT = aiohttp.ClientTimeout(total=PER_MODEL_TIMEOUT_SEC)
+
+
+def _auth_headers(api_key: str) -> Dict[str, str]:
+    return {
+        "Authorization": "Bearer {}".format(api_key),
+        "Content-Type": "application/json",
+    }
+
+
+# Shared HTTP session connection pool
+SESSION_CONN_LIMIT = 16
+SESSION_CONN_LIMIT_PER_HOST = 8
+SESSION_DNS_CACHE_TTL_SEC = 300
+
+# Max in-flight OpenRouter requests per swarm (across concurrent analyses)
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
+# Validated-response LRU, keyed on (prompt_hash, model_key)
+RESPONSE_CACHE_MAX = 1024
+
 
 class AINotImplementedError(Exception):
     """Raised when AI analysis is attempted but disabled."""
 
 
-def validate_ai_response(response: Dict[str, Any]) -> Tuple[bool, List[str]]:
+# Markdown code fence around model JSON: opening ```/```json line, body up to
+# the closing fence line (or end of text if the model never closed it)
+_FENCE_RE = re.compile(r"```[^\n]*\n(.*?)(?:^```|\Z)", re.S | re.M)
+
+# Below this many results the scalar path beats numpy's call overhead
+_NP_MIN_RESULTS = 64
+
+# Field groups for validate_ai_response, resolved once at import
+_REQUIRED_FIELDS_SORTED = tuple(sorted(REQUIRED_FIELDS))
+_VALID_SIDES_SORTED = sorted(VALID_SIDES)
+_UNIT_INTERVAL_FIELDS = ("prob_yes_raw", "confidence_raw", "resolution_risk", "dispute_risk")
+_ARRAY_FIELDS = ("key_drivers", "disqualifiers")
+_NUMERIC_TYPES = (int, float)
+_STRING_FIELDS = ("resolution_summary", "evidence_summary", "uncertainty_reason", "notes")
+
+
+def _check_unit_interval(val: Any) -> Optional[str]:
+    # bool is an int subclass: True would otherwise pass as 1.0
+    if isinstance(val, bool) or not isinstance(val, _NUMERIC_TYPES):
+        return "must be numeric, got {}".format(type(val).__name__)
+    if val < 0.0 or val > 1.0:
+        return "out of range [0,1]: {}".format(val)
+    return None
+
+
+def _check_side(val: Any) -> Optional[str]:
+    if val not in VALID_SIDES:
+        return "must be one of {}, got '{}'".format(_VALID_SIDES_SORTED, val)
+    return None
+
+
+def _check_array(val: Any) -> Optional[str]:
+    if not isinstance(val, list):
+        return "must be an array, got {}".format(type(val).__name__)
+    return None
+
+
+def _check_string(val: Any) -> Optional[str]:
+    if not isinstance(val, str):
+        return "must be a string, got {}".format(type(val).__name__)
+    return None
+
+
+# (field, check) pairs walked in one pass; a check returns an error suffix or None
+_FIELD_CHECKS = tuple(
+    [(f, _check_unit_interval) for f in _UNIT_INTERVAL_FIELDS]
+    + [("recommended_side", _check_side)]
+    + [(f, _check_array) for f in _ARRAY_FIELDS]
+    + [(f, _check_string) for f in _STRING_FIELDS]
+)  # type: Tuple[Tuple[str, Callable[[Any], Optional[str]]], ...]
+
+
+def validate_ai_response(
+    response: Dict[str, Any],
+    fast_fail: bool = False,
+) -> Tuple[bool, List[str]]:
     """Validate an AI response against the strict JSON schema.
 
+    With ``fast_fail`` the first failing check ends validation, for callers
+    that only need pass/fail plus one reason.
+
     Returns (valid, list_of_errors).
     """
+    if not isinstance(response, dict):
+        return False, ["Response must be a JSON object, got {}".format(type(response).__name__)]
+
     errors = []  # type: List[str]
+    get = response.get
 
-    # Check all required fields present
-    missing = REQUIRED_FIELDS - set(response.keys())
+    # Check all required fields present (iterates pre-sorted names, no set build)
+    missing = [f for f in _REQUIRED_FIELDS_SORTED if f not in response]
     if missing:
-        errors.append("Missing required fields: {}".format(sorted(missing)))
+        errors.append("Missing required fields: {}".format(missing))
+        if fast_fail:
+            return False, errors
 
-    # Range checks
-    for field in ("prob_yes_raw", "confidence_raw", "resolution_risk", "dispute_risk"):
-        val = response.get(field)
-        if val is not None:
-            if not isinstance(val, (int, float)):
-                errors.append("{} must be numeric, got {}".format(field, type(val).__name__))
-            elif val < 0 or val > 1:
-                errors.append("{} out of range [0,1]: {}".format(field, val))
+    # Per-field type/range checks; absent fields are covered above
+    for field, check in _FIELD_CHECKS:
+        val = get(field)
+        if val is None:
+            continue
+        err = check(val)
+        if err is not None:
+            errors.append("{} {}".format(field, err))
+            if fast_fail:
+                return False, errors
 
-    # recommended_side check
-    side = response.get("recommended_side")
-    if side is not None and side not in VALID_SIDES:
-        errors.append("recommended_side must be one of {}, got '{}'".format(sorted(VALID_SIDES), side))
+    return not errors, errors
 
-    # Type checks for arrays
-    for field in ("key_drivers", "disqualifiers"):
-        val = response.get(field)
-        if val is not None and not isinstance(val, list):
-            errors.append("{} must be an array, got {}".format(field, type(val).__name__))
 
-    # Type checks for strings
-    for field in ("resolution_summary", "evidence_summary", "uncertainty_reason", "notes"):
-        val = response.get(field)
-        if val is not None and not isinstance(val, str):
-            errors.append("{} must be a string, got {}".format(field, type(val).__name__))
+def extract_json_text(content: str) -> str:
+    """Return the JSON text from model output, unwrapping a markdown fence."""
+    json_str = content.strip()
+    m = _FENCE_RE.match(json_str)
+    return m.group(1) if m else json_str
 
-    return len(errors) == 0, errors
 
+_JSON_DECODER = json.JSONDecoder()
 
-def compute_prompt_hash(prompt: str) -> str:
-    """SHA-256 hash of the prompt for replayability."""
-    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
 
+def parse_model_json(json_str: str) -> Any:
+    """Parse model JSON, tolerating chatter before or after the object.
 
-def compute_weighted_disagreement(
-    results: List[Dict[str, Any]],
-) -> float:
-    """Compute weighted standard deviation of prob_yes_raw.
-
-    Returns 0.0 if insufficient data.
+    Strict orjson parse first; on failure, decode the first JSON object
+    starting at the first '{' and ignore any trailing text.
+    Raises json.JSONDecodeError if no object can be decoded.
     """
-    if len(results) < 2:
-        return 0.0
+    try:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        start = json_str.find("{")
+        if start < 0:
+            raise
+    obj, _ = _JSON_DECODER.raw_decode(json_str, start)
+    return obj
 
-    total_weight = sum(r.get("weight", 1) for r in results)
-    if total_weight == 0:
-        return 0.0
 
-    # Weighted mean
-    weighted_sum = sum(r["prob_yes_raw"] * r.get("weight", 1) for r in results)
-    mean = weighted_sum / total_weight
+def compute_prompt_hash(prompt: str) -> str:
+    """SHA-256 hash of the prompt for replayability."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
 
-    # Weighted variance
-    variance = sum(
-        r.get("weight", 1) * (r["prob_yes_raw"] - mean) ** 2
-        for r in results
-    ) / total_weight
 
-    return math.sqrt(variance)
+def _weighted_moments(
+    results: Iterable[Dict[str, Any]],
+) -> Tuple[int, int, Optional[float], float]:
+    """Single pass over results: (count, total_weight, weighted_mean, weighted_stdev).
 
+    Uses the weighted Welford update, so mean and variance come out of one
+    fold without a second pass or the cancellation of sum(w*p^2) - mean^2.
+    weighted_mean is None when total weight is 0; stdev is 0.0 below 2 results.
+    Every result must carry ``weight`` (call_single_model always sets it).
+    """
+    n = 0
+    total_weight = 0
+    mean = 0.0
+    m2 = 0.0
+    for r in results:
+        n += 1
+        w = r["weight"]
+        if w <= 0:
+            continue
+        p = r["prob_yes_raw"]
+        total_weight += w
+        delta = p - mean
+        mean += delta * w / total_weight
+        m2 += w * delta * (p - mean)
 
-def check_quorum(results: List[Dict[str, Any]]) -> Tuple[bool, str]:
-    """Check if quorum is met per spec §12.4.
+    if total_weight == 0:
+        return n, total_weight, None, 0.0
+    stdev = math.sqrt(max(m2 / total_weight, 0.0)) if n >= 2 else 0.0
+    return n, total_weight, mean, stdev
 
-    Returns (met, reason_if_not).
-    """
-    valid_results = [r for r in results if r.get("parse_ok", False)]
 
-    if len(valid_results) < QUORUM_MIN_MODELS:
+def _quorum_verdict(n_valid: int, total_weight: int, disagreement: float) -> Tuple[bool, str]:
+    """Apply the spec §12.4 quorum rules to pre-aggregated results."""
+    if n_valid < QUORUM_MIN_MODELS:
         return False, "AI_QUORUM_FAILED: only {}/{} models returned valid JSON".format(
-            len(valid_results), QUORUM_MIN_MODELS,
+            n_valid, QUORUM_MIN_MODELS,
         )
 
-    total_weight = sum(r.get("weight", 1) for r in valid_results)
     if total_weight < QUORUM_MIN_WEIGHT:
         return False, "AI_QUORUM_FAILED: total weight {}/{} insufficient".format(
             total_weight, QUORUM_MIN_WEIGHT,
         )
 
     # Check disagreement
-    disagreement = compute_weighted_disagreement(valid_results)
     if disagreement > DISAGREE_THRESHOLD:
         return False, "AI_DISAGREEMENT: weighted stdev {:.4f} > threshold {:.4f}".format(
             disagreement, DISAGREE_THRESHOLD,
@@ -177,67 +280,124 @@ def check_quorum(results: List[Dict[str, Any]]) -> Tuple[bool, str]:
     return True, ""
 
 
-def build_analysis_prompt(
+def compute_weighted_disagreement(
+    results: List[Dict[str, Any]],
+) -> float:
+    """Compute weighted standard deviation of prob_yes_raw.
+
+    Returns 0.0 if insufficient data.
+    """
+    n = len(results)
+    if n < 2:
+        return 0.0
+
+    if np is not None and n >= _NP_MIN_RESULTS:
+        probs = np.fromiter((r["prob_yes_raw"] for r in results), dtype=np.float64, count=n)
+        weights = np.fromiter((r["weight"] for r in results), dtype=np.float64, count=n)
+        if weights.sum() == 0:
+            return 0.0
+        mean = np.average(probs, weights=weights)
+        return float(np.sqrt(np.average((probs - mean) ** 2, weights=weights)))
+
+    return _weighted_moments(results)[3]
+
+
+def check_quorum(results: List[Dict[str, Any]]) -> Tuple[bool, str]:
+    """Check if quorum is met per spec §12.4.
+
+    Returns (met, reason_if_not).
+    """
+    n_valid, total_weight, _, disagreement = _weighted_moments(
+        r for r in results if r.get("parse_ok", False)
+    )
+    return _quorum_verdict(n_valid, total_weight, disagreement)
+
+
+# Static prompt text, formatted/serialized once at import
+_PROMPT_HEADER = "\n".join([
+    "You are analysing a binary prediction market. Respond ONLY with valid JSON.",
+    "",
+    "Market: {}",
+    "Description: {}",
+    "Category: {}",
+    "Resolution source: {}",
+    "End date: {}",
+])
+_PROMPT_PRICES = (
+    "\nCurrent prices:\n"
+    "  YES best_bid={} best_ask={}\n"
+    "  NO  best_bid={} best_ask={}"
+)
+_PROMPT_EVIDENCE_ITEM = "  [{}] {} (Tier {} - {})\n    {}"
+_SCHEMA_EXAMPLE_JSON = orjson.dumps({
+    "market_id": "<market_id>",
+    "prob_yes_raw": 0.55,
+    "confidence_raw": 0.7,
+    "resolution_risk": 0.1,
+    "dispute_risk": 0.05,
+    "resolution_summary": "...",
+    "evidence_summary": "...",
+    "uncertainty_reason": "...",
+    "key_drivers": ["..."],
+    "disqualifiers": ["..."],
+    "recommended_side": "YES|NO|NO_TRADE",
+    "notes": "...",
+}, option=orjson.OPT_INDENT_2).decode("utf-8")
+_PROMPT_SCHEMA_TAIL = '\nRespond with JSON matching schema version "{}":\n{}'.format(
+    SCHEMA_VERSION, _SCHEMA_EXAMPLE_JSON,
+)
+
+
+def build_analysis_prompt_parts(
     market: Dict[str, Any],
     evidence_bundle: Optional[Dict[str, Any]] = None,
     snapshot: Optional[Dict[str, Any]] = None,
-) -> str:
-    """Build the analysis prompt for the AI swarm."""
-    parts = [
-        "You are analysing a binary prediction market. Respond ONLY with valid JSON.",
-        "",
-        "Market: {}".format(market.get("title", "Unknown")),
-        "Description: {}".format(market.get("description", "")),
-        "Category: {}".format(market.get("category", "")),
-        "Resolution source: {}".format(market.get("resolution_source", "")),
-        "End date: {}".format(market.get("end_date_utc", "")),
-    ]
+) -> Tuple[str, str]:
+    """Build the analysis prompt as (prefix, suffix).
+
+    The prefix (instructions + market metadata) is stable across
+    re-analyses of a market; the suffix (prices, evidence, schema) varies.
+    The full prompt is ``prefix + "\n" + suffix``.
+    """
+    prefix = _PROMPT_HEADER.format(
+        market.get("title", "Unknown"),
+        market.get("description", ""),
+        market.get("category", ""),
+        market.get("resolution_source", ""),
+        market.get("end_date_utc", ""),
+    )
+    parts = []  # type: List[str]
 
     if snapshot:
-        parts.extend([
-            "",
-            "Current prices:",
-            "  YES best_bid={} best_ask={}".format(
-                snapshot.get("best_bid_yes"), snapshot.get("best_ask_yes"),
-            ),
-            "  NO  best_bid={} best_ask={}".format(
-                snapshot.get("best_bid_no"), snapshot.get("best_ask_no"),
-            ),
-        ])
+        parts.append(_PROMPT_PRICES.format(
+            snapshot.get("best_bid_yes"), snapshot.get("best_ask_yes"),
+            snapshot.get("best_bid_no"), snapshot.get("best_ask_no"),
+        ))
 
     if evidence_bundle:
-        parts.extend([
-            "",
-            "Evidence:",
-        ])
-        for i, item in enumerate(evidence_bundle.get("items", [])):
-            parts.append("  [{}] {} (Tier {} - {})".format(
-                i + 1, item.get("title", ""), item.get("reliability_tier", "?"),
-                item.get("source_id", ""),
+        parts.append("\nEvidence:")
+        append = parts.append
+        fmt = _PROMPT_EVIDENCE_ITEM.format
+        for i, item in enumerate(evidence_bundle.get("items", []), 1):
+            get = item.get
+            append(fmt(
+                i, get("title", ""), get("reliability_tier", "?"),
+                get("source_id", ""), get("text", "")[:500],
             ))
-            text = item.get("text", "")[:500]
-            parts.append("    {}".format(text))
-
-    parts.extend([
-        "",
-        'Respond with JSON matching schema version "{}":'.format(SCHEMA_VERSION),
-        json.dumps({
-            "market_id": "<market_id>",
-            "prob_yes_raw": 0.55,
-            "confidence_raw": 0.7,
-            "resolution_risk": 0.1,
-            "dispute_risk": 0.05,
-            "resolution_summary": "...",
-            "evidence_summary": "...",
-            "uncertainty_reason": "...",
-            "key_drivers": ["..."],
-            "disqualifiers": ["..."],
-            "recommended_side": "YES|NO|NO_TRADE",
-            "notes": "...",
-        }, indent=2),
-    ])
-
-    return "\n".join(parts)
+
+    parts.append(_PROMPT_SCHEMA_TAIL)
+
+    return prefix, "\n".join(parts)
+
+
+def build_analysis_prompt(
+    market: Dict[str, Any],
+    evidence_bundle: Optional[Dict[str, Any]] = None,
+    snapshot: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Build the analysis prompt for the AI swarm."""
+    prefix, suffix = build_analysis_prompt_parts(market, evidence_bundle, snapshot)
+    return prefix + "\n" + suffix
 
 
 async def call_single_model(
@@ -246,9 +406,15 @@ async def call_single_model(
     prompt: str,
     api_key: str,
     market_id: str,
+    prompt_cache_key: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """Call a single model via OpenRouter.
 
+    ``prompt_cache_key`` (hash of the stable prompt prefix) is sent so the
+    provider can route repeat analyses to a warm prefix/KV cache.
+    ``headers`` lets a long-lived caller pass prebuilt auth headers.
+
     Returns result dict with parse_ok, response, model, weight, etc.
     """
     weight = SWARM_MODELS.get(model_key, {}).get("weight", 1)
@@ -259,29 +425,25 @@ async def call_single_model(
         "response": None,
         "error": None,
         "latency_ms": 0,
+        "cache_hit": False,
     }  # type: Dict[str, Any]
 
     start = time.time()
 
     try:
         payload = {
+            **_BASE_PAYLOAD,
             "model": model_key,
-            "messages": [
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": 0.1,
-            "max_tokens": 2000,
+            "messages": [{"role": "user", "content": prompt}],
         }
+        if prompt_cache_key:
+            payload["prompt_cache_key"] = prompt_cache_key
 
-        timeout = aiohttp.ClientTimeout(total=PER_MODEL_TIMEOUT_SEC)
         async with session.post(
             OPENROUTER_API_URL,
             json=payload,
-            headers={
-                "Authorization": "Bearer {}".format(api_key),
-                "Content-Type": "application/json",
-            },
-            timeout=timeout,
+            headers=headers if headers is not None else _auth_headers(api_key),
+            timeout=_PER_MODEL_TIMEOUT,
         ) as resp:
             result["latency_ms"] = int((time.time() - start) * 1000)
 
@@ -289,7 +451,7 @@ async def call_single_model(
                 result["error"] = "HTTP {}".format(resp.status)
                 return result
 
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
 
         # Extract content
         choices = data.get("choices", [])
@@ -300,25 +462,11 @@ async def call_single_model(
         content = choices[0].get("message", {}).get("content", "")
 
         # Parse JSON from content (may be wrapped in markdown)
-        json_str = content.strip()
-        if json_str.startswith("```"):
-            lines = json_str.split("\n")
-            json_lines = []
-            in_block = False
-            for line in lines:
-                if line.startswith("```") and not in_block:
-                    in_block = True
-                    continue
-                elif line.startswith("```") and in_block:
-                    break
-                elif in_block:
-                    json_lines.append(line)
-            json_str = "\n".join(json_lines)
-
-        parsed = json.loads(json_str)
+        json_str = extract_json_text(content)
+        parsed = parse_model_json(json_str)
 
         # Validate
-        valid, errors = validate_ai_response(parsed)
+        valid, errors = validate_ai_response(parsed, fast_fail=True)
         if valid:
             # Ensure market_id matches
             parsed["market_id"] = market_id
@@ -331,7 +479,7 @@ async def call_single_model(
     except asyncio.TimeoutError:
         result["error"] = "Timeout after {}s".format(PER_MODEL_TIMEOUT_SEC)
         result["latency_ms"] = int((time.time() - start) * 1000)
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
         result["error"] = "JSON parse error: {}".format(e)
         result["latency_ms"] = int((time.time() - start) * 1000)
     except Exception as e:
@@ -342,11 +490,29 @@ async def call_single_model(
 
 
 class AISwarm:
-    """OpenRouter AI swarm with quorum and disagreement checks."""
+    """OpenRouter AI swarm with quorum and disagreement checks.
+
+    Holds one lazily-created HTTP session for its lifetime so connections
+    to OpenRouter are reused across analyses.  Use as an async context
+    manager, or call ``aclose()`` on shutdown.
+    """
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrent_requests: Optional[int] = None,
+    ) -> None:
         self._api_key = api_key or os.environ.get("OPENROUTER_API_KEY", "")
         self._enabled = bool(self._api_key and self._api_key != "sk-or-REPLACE_ME")
+        self._headers = _auth_headers(self._api_key)
+        self._session = None  # type: Optional[aiohttp.ClientSession]
+        if max_concurrent_requests is None:
+            max_concurrent_requests = int(os.environ.get(
+                "POLYEDGE_AI_MAX_CONC", DEFAULT_MAX_CONCURRENT_REQUESTS,
+            ))
+        # Backpressure: bounds requests in flight when many markets analyse at once
+        self._sem = asyncio.Semaphore(max_concurrent_requests)
+        self._cache = OrderedDict()  # type: OrderedDict[Tuple[str, str], Dict[str, Any]]
         if self._enabled:
             logger.info("AISwarm initialised with %d models", len(SWARM_MODELS))
         else:
@@ -356,6 +522,154 @@ class AISwarm:
     def is_enabled(self) -> bool:
         return self._enabled
 
+    async def __aenter__(self) -> "AISwarm":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=SESSION_CONN_LIMIT,
+                    limit_per_host=SESSION_CONN_LIMIT_PER_HOST,
+                    ttl_dns_cache=SESSION_DNS_CACHE_TTL_SEC,
+                ),
+                timeout=aiohttp.ClientTimeout(total=SWARM_TOTAL_TIMEOUT_SEC),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared session (idempotent)."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _cache_get(
+        self,
+        prompt_hash: str,
+        model_key: str,
+        market_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached validated result, or None on miss."""
+        key = (prompt_hash, model_key)
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        self._cache.move_to_end(key)
+        result = dict(cached)
+        result["response"] = dict(cached["response"], market_id=market_id)
+        result["latency_ms"] = 0
+        result["cache_hit"] = True
+        return result
+
+    def _cache_put(self, prompt_hash: str, model_key: str, result: Dict[str, Any]) -> None:
+        """Store a validated result, evicting the least recently used entry."""
+        self._cache[(prompt_hash, model_key)] = result
+        if len(self._cache) > RESPONSE_CACHE_MAX:
+            self._cache.popitem(last=False)
+
+    async def _call_bounded(
+        self,
+        session: aiohttp.ClientSession,
+        model_key: str,
+        prompt: str,
+        prompt_hash: str,
+        prefix_hash: str,
+        market_id: str,
+    ) -> Dict[str, Any]:
+        """Call one model while holding a concurrency slot.
+
+        Identical prompts are served from the response cache without a
+        request.  The per-model timeout applies inside the slot, so a slow
+        model cannot hold it for longer than PER_MODEL_TIMEOUT_SEC.
+        """
+        cached = self._cache_get(prompt_hash, model_key, market_id)
+        if cached is not None:
+            return cached
+
+        async with self._sem:
+            result = await call_single_model(
+                session, model_key, prompt, self._api_key, market_id,
+                prompt_cache_key=prefix_hash, headers=self._headers,
+            )
+
+        if result["parse_ok"]:
+            # Cache a copy so callers mutating their result cannot alter later hits
+            self._cache_put(prompt_hash, model_key, dict(result, response=dict(result["response"])))
+        return result
+
+    async def _dispatch(
+        self,
+        session: aiohttp.ClientSession,
+        prompt: str,
+        prompt_hash: str,
+        prefix_hash: str,
+        market_id: str,
+    ) -> List[Dict[str, Any]]:
+        """Fan out to all models, returning one result per model in SWARM_MODELS order.
+
+        Results are folded in as they complete; once the arrived set meets
+        quorum the stragglers are cancelled, so latency tracks the fastest
+        quorum rather than the slowest model.  Models still pending at
+        SWARM_TOTAL_TIMEOUT_SEC are cancelled and reported as timed out.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SWARM_TOTAL_TIMEOUT_SEC
+        tasks = {
+            asyncio.ensure_future(self._call_bounded(
+                session, model_key, prompt, prompt_hash, prefix_hash, market_id,
+            )): model_key
+            for model_key in SWARM_MODELS
+        }
+        by_model = {}  # type: Dict[str, Dict[str, Any]]
+        pending = set(tasks)
+        stop_reason = "Swarm timeout after {}s".format(SWARM_TOTAL_TIMEOUT_SEC)
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=max(deadline - loop.time(), 0.0),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                break
+            for task in done:
+                model_key = tasks[task]
+                exc = task.exception()
+                if exc is not None:
+                    by_model[model_key] = {
+                        "model": model_key,
+                        "weight": 0,
+                        "parse_ok": False,
+                        "error": str(exc),
+                    }
+                else:
+                    by_model[model_key] = task.result()
+            if pending:
+                n_valid, total_weight, _, disagreement = _weighted_moments(
+                    r for r in by_model.values() if r.get("parse_ok", False)
+                )
+                if _quorum_verdict(n_valid, total_weight, disagreement)[0]:
+                    stop_reason = "Cancelled: quorum reached"
+                    break
+
+        if pending:
+            for task in pending:
+                task.cancel()
+                model_key = tasks[task]
+                by_model[model_key] = {
+                    "model": model_key,
+                    "weight": SWARM_MODELS[model_key]["weight"],
+                    "parse_ok": False,
+                    "error": stop_reason,
+                }
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return [by_model[model_key] for model_key in SWARM_MODELS]
+
     async def analyze(
         self,
         market_id: str,
@@ -377,53 +691,26 @@ class AISwarm:
                 "Set OPENROUTER_API_KEY in .env file."
             )
 
-        prompt = build_analysis_prompt(market, evidence_bundle, snapshot)
-        prompt_hash = compute_prompt_hash(prompt)
+        prefix, suffix = build_analysis_prompt_parts(market, evidence_bundle, snapshot)
+        prompt = prefix + "\n" + suffix
+        prompt_hash = compute_prompt_hash(prompt)  # full prompt, for replay
+        prefix_hash = compute_prompt_hash(prefix)  # provider cache affinity
 
-        # Parallel dispatch with total timeout
-        timeout = aiohttp.ClientTimeout(total=SWARM_TOTAL_TIMEOUT_SEC)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            tasks = []
-            for model_key in SWARM_MODELS:
-                tasks.append(
-                    call_single_model(session, model_key, prompt, self._api_key, market_id)
-                )
+        # Parallel dispatch over the shared session; stops early on quorum
+        session = await self._get_session()
+        processed = await self._dispatch(session, prompt, prompt_hash, prefix_hash, market_id)
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        processed = []  # type: List[Dict[str, Any]]
-        for r in results:
-            if isinstance(r, Exception):
-                processed.append({
-                    "model": "unknown",
-                    "weight": 0,
-                    "parse_ok": False,
-                    "error": str(r),
-                })
-            else:
-                processed.append(r)
-
-        # Check quorum
-        quorum_met, quorum_reason = check_quorum(processed)
-
-        # Compute aggregated probability (weighted mean of valid results)
-        valid_results = [r for r in processed if r.get("parse_ok", False)]
-        aggregated_prob = None
-        disagreement = 0.0
-
-        if valid_results:
-            total_weight = sum(r.get("weight", 1) for r in valid_results)
-            if total_weight > 0:
-                aggregated_prob = sum(
-                    r["prob_yes_raw"] * r.get("weight", 1) for r in valid_results
-                ) / total_weight
-            disagreement = compute_weighted_disagreement(valid_results)
+        # One fold over valid results feeds quorum, aggregate and disagreement
+        n_valid, total_weight, aggregated_prob, disagreement = _weighted_moments(
+            r for r in processed if r.get("parse_ok", False)
+        )
+        quorum_met, quorum_reason = _quorum_verdict(n_valid, total_weight, disagreement)
 
         return {
             "market_id": market_id,
             "candidate_id": candidate_id,
             "prompt_hash": prompt_hash,
+            "prompt_prefix_hash": prefix_hash,
             "schema_version": SCHEMA_VERSION,
             "quorum_met": quorum_met,
             "quorum_reason": quorum_reason if not quorum_met else None,
@@ -431,6 +718,6 @@ class AISwarm:
             "aggregated_prob_yes": aggregated_prob,
             "model_results": processed,
             "models_total": len(SWARM_MODELS),
-            "models_valid": len(valid_results),
+            "models_valid": n_valid,
             "barrier_generation": barrier_generation,
         }
@@ -8,6 +8,7 @@ Implements:
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import hmac
 import json
@@ -17,6 +18,8 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+import orjson
+
 from polyedge.constants import (
     ARMING_FILE_MAX_AGE_SEC,
     ARMING_NONCE1_TTL_SEC,
@@ -46,17 +49,30 @@ class ArmingCeremony:
     ) -> None:
         self._process_start = process_start_unix_ms
         self._secret = local_state_secret
+        # Keyed HMAC state built once; per-call MACs copy it instead of
+        # re-encoding the key and redoing the ipad/opad setup.
+        self._secret_bytes = local_state_secret.encode("utf-8")
+        self._hmac_base = hmac.new(self._secret_bytes, digestmod=hashlib.sha256)
         self._arming_dir = Path(arming_dir)
         self._nonce1 = None  # type: Optional[str]
         self._nonce1_created_at = 0.0
         self._last_totp_used = ""
         self._last_totp_used_at = 0.0
         self._armed = False
+        # Parsed arming file keyed on (st_mtime_ns, st_size):
+        # (key, record, signature_ok).  Re-read only when the file changes.
+        self._record_cache = None  # type: Optional[Tuple[Tuple[int, int], Dict[str, Any], bool]]
 
     @property
     def is_armed(self) -> bool:
         return self._armed
 
+    def _mac(self, msg: bytes) -> hmac.HMAC:
+        """HMAC-SHA256 of msg under the local state secret."""
+        h = self._hmac_base.copy()
+        h.update(msg)
+        return h
+
     def step1_totp(self, totp_code: str) -> str:
         """Step 1: Validate TOTP and generate nonce1.
 
@@ -70,11 +86,7 @@ class ArmingCeremony:
 
         # Generate TOTP from secret (simplified: HMAC of current 30s window)
         window = int(time.time() / 30)
-        expected = hmac.new(
-            self._secret.encode("utf-8"),
-            str(window).encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()[:6]
+        expected = self._mac(str(window).encode("utf-8")).hexdigest()[:6]
 
         # In production, would use proper TOTP. For now, accept the code
         # if it looks valid (6 digits/chars)
@@ -113,21 +125,20 @@ class ArmingCeremony:
             "armed_at_utc": time.time(),
             "process_start_unix_ms": self._process_start,
             "nonce1": self._nonce1,
-            "arming_signature": hmac.new(
-                self._secret.encode("utf-8"),
+            "arming_signature": base64.b64encode(self._mac(
                 "{}:{}".format(self._process_start, self._nonce1).encode("utf-8"),
-                hashlib.sha256,
-            ).hexdigest(),
+            ).digest()).decode("ascii"),
         }
 
         # Write arming file
         self._arming_dir.mkdir(parents=True, exist_ok=True)
         arming_path = self._arming_dir / "arming.json"
-        with open(arming_path, "w", encoding="utf-8") as f:
-            json.dump(arming_record, f, indent=2)
+        with open(arming_path, "wb") as f:
+            f.write(orjson.dumps(arming_record, option=orjson.OPT_INDENT_2))
 
         self._armed = True
         self._nonce1 = None  # Consume nonce
+        self._record_cache = None
 
         logger.info("Arming ceremony complete: file written to %s", arming_path)
         return arming_record
@@ -143,14 +154,33 @@ class ArmingCeremony:
         """
         arming_path = self._arming_dir / "arming.json"
 
-        if not arming_path.is_file():
+        try:
+            st = arming_path.stat()
+        except OSError:
             return False, "Arming file not found"
 
-        try:
-            with open(arming_path, "r", encoding="utf-8") as f:
-                record = json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
-            return False, "Arming file unreadable: {}".format(e)
+        # Parse + signature check only when the file has changed; the
+        # age check below depends on the clock and always runs.
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._record_cache
+        if cached is not None and cached[0] == key:
+            _, record, sig_ok = cached
+        else:
+            try:
+                with open(arming_path, "rb") as f:
+                    record = orjson.loads(f.read())
+            except (json.JSONDecodeError, OSError) as e:
+                return False, "Arming file unreadable: {}".format(e)
+
+            expected_sig = self._mac(
+                "{}:{}".format(record.get("process_start_unix_ms"), record.get("nonce1")).encode("utf-8"),
+            ).digest()
+            try:
+                actual_sig = base64.b64decode(record.get("arming_signature") or "", validate=True)
+            except (TypeError, ValueError):  # binascii.Error is a ValueError
+                actual_sig = b""
+            sig_ok = hmac.compare_digest(expected_sig, actual_sig)
+            self._record_cache = (key, record, sig_ok)
 
         # Process binding
         if record.get("process_start_unix_ms") != self._process_start:
@@ -163,13 +193,7 @@ class ArmingCeremony:
             return False, "Arming file expired ({:.0f}s > {}s)".format(age, ARMING_FILE_MAX_AGE_SEC)
 
         # Signature check
-        expected_sig = hmac.new(
-            self._secret.encode("utf-8"),
-            "{}:{}".format(record.get("process_start_unix_ms"), record.get("nonce1")).encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-
-        if record.get("arming_signature") != expected_sig:
+        if not sig_ok:
             return False, "Arming signature mismatch"
 
         self._armed = True
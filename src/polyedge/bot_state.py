@@ -11,13 +11,32 @@ import hmac
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from polyedge.constants import VALID_STATES
 
 logger = logging.getLogger(__name__)
 
 
+# Statement text is fixed at import: asyncpg's per-connection statement
+# cache is keyed on the query string, so every load/save after the first on
+# a connection reuses the server-side prepared statement (no re-parse/plan).
+_LOAD_SQL = "SELECT * FROM bot_state WHERE id = TRUE"
+_SAVE_SQL = """
+    INSERT INTO bot_state (id, state, counter, ts_utc, armed_until_utc,
+                           halt_until_utc, halt_resume_state, state_signature)
+    VALUES (TRUE, $1, $2, $3, $4, $5, $6, $7)
+    ON CONFLICT (id) DO UPDATE SET
+        state = EXCLUDED.state,
+        counter = EXCLUDED.counter,
+        ts_utc = EXCLUDED.ts_utc,
+        armed_until_utc = EXCLUDED.armed_until_utc,
+        halt_until_utc = EXCLUDED.halt_until_utc,
+        halt_resume_state = EXCLUDED.halt_resume_state,
+        state_signature = EXCLUDED.state_signature
+"""
+
+
 class StateSignatureError(Exception):
     """Raised when bot_state signature verification fails."""
 
@@ -26,16 +45,21 @@ class InvalidStateTransition(Exception):
     """Raised on an illegal state transition."""
 
 
+def _secret_bytes(secret: Union[str, bytes]) -> bytes:
+    """Encode a str secret; pre-encoded bytes pass through untouched."""
+    return secret.encode("utf-8") if isinstance(secret, str) else secret
+
+
 def _compute_state_signature(
     state: str,
     counter: int,
     ts_utc: str,
-    secret: str,
+    secret_bytes: bytes,
 ) -> bytes:
     """HMAC-SHA256 signature over canonical state fields."""
     canonical = "state={}|counter={}|ts_utc={}".format(state, counter, ts_utc)
     return hmac.new(
-        secret.encode("utf-8"),
+        secret_bytes,
         canonical.encode("utf-8"),
         hashlib.sha256,
     ).digest()
@@ -64,23 +88,23 @@ class BotState:
         self.halt_resume_state = halt_resume_state
         self.state_signature = state_signature
 
-    def verify_signature(self, secret: str) -> bool:
+    def verify_signature(self, secret: Union[str, bytes]) -> bool:
         """Verify the HMAC signature. Returns True if valid."""
         expected = _compute_state_signature(
             self.state,
             self.counter,
             self.ts_utc.isoformat(),
-            secret,
+            _secret_bytes(secret),
         )
         return hmac.compare_digest(self.state_signature, expected)
 
-    def sign(self, secret: str) -> None:
+    def sign(self, secret: Union[str, bytes]) -> None:
         """Compute and set the HMAC signature."""
         self.state_signature = _compute_state_signature(
             self.state,
             self.counter,
             self.ts_utc.isoformat(),
-            secret,
+            _secret_bytes(secret),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -97,7 +121,7 @@ class BotState:
 
 async def load_bot_state(pool: Any) -> Optional[BotState]:
     """Load the bot_state singleton row from DB.  Returns None if not yet initialised."""
-    row = await pool.fetchrow("SELECT * FROM bot_state WHERE id = TRUE")
+    row = await pool.fetchrow(_LOAD_SQL)
     if row is None:
         return None
     return BotState(
@@ -114,19 +138,7 @@ async def load_bot_state(pool: Any) -> Optional[BotState]:
 async def save_bot_state(pool: Any, bs: BotState) -> None:
     """Upsert the bot_state singleton row."""
     await pool.execute(
-        """
-        INSERT INTO bot_state (id, state, counter, ts_utc, armed_until_utc,
-                               halt_until_utc, halt_resume_state, state_signature)
-        VALUES (TRUE, $1, $2, $3, $4, $5, $6, $7)
-        ON CONFLICT (id) DO UPDATE SET
-            state = EXCLUDED.state,
-            counter = EXCLUDED.counter,
-            ts_utc = EXCLUDED.ts_utc,
-            armed_until_utc = EXCLUDED.armed_until_utc,
-            halt_until_utc = EXCLUDED.halt_until_utc,
-            halt_resume_state = EXCLUDED.halt_resume_state,
-            state_signature = EXCLUDED.state_signature
-        """,
+        _SAVE_SQL,
         bs.state,
         bs.counter,
         bs.ts_utc,
@@ -142,19 +154,20 @@ async def initialise_bot_state(pool: Any, secret: str) -> BotState:
 
     Returns the (possibly force-downgraded) BotState.
     """
+    key = _secret_bytes(secret)  # encoded once for verify + re-sign
     bs = await load_bot_state(pool)
 
     if bs is None:
         # First run: create OBSERVE_ONLY
         now = datetime.now(timezone.utc)
         bs = BotState(state="OBSERVE_ONLY", counter=1, ts_utc=now)
-        bs.sign(secret)
+        bs.sign(key)
         await save_bot_state(pool, bs)
         logger.info("Bot state initialised: OBSERVE_ONLY")
         return bs
 
     # Verify signature (spec §5.4 step 4)
-    if not bs.verify_signature(secret):
+    if not bs.verify_signature(key):
         raise StateSignatureError(
             "Bot state signature verification failed — possible tampering. HALTED."
         )
@@ -166,7 +179,7 @@ async def initialise_bot_state(pool: Any, secret: str) -> BotState:
         bs.counter += 1
         bs.ts_utc = datetime.now(timezone.utc)
         bs.armed_until_utc = None
-        bs.sign(secret)
+        bs.sign(key)
         await save_bot_state(pool, bs)
         logger.warning(
             "Startup force-downgrade: %s -> OBSERVE_ONLY (spec §5.4 step 5)",
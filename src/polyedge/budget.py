@@ -10,10 +10,16 @@ Implements:
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
-import uuid
+import secrets
+import threading
+import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from enum import IntEnum
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 from polyedge.constants import (
     AI_ANALYSES_PER_DAY_HARD_CAP,
@@ -25,11 +31,22 @@ from polyedge.constants import (
 
 logger = logging.getLogger(__name__)
 
-# Reservation status enum (spec §13.2)
-STATUS_RESERVED = "RESERVED"
-STATUS_SETTLED = "SETTLED"
-STATUS_FORCE_SETTLED = "FORCE_SETTLED"
-STATUS_RELEASED = "RELEASED"
+_UTC = timezone.utc
+
+
+class ResStatus(IntEnum):
+    """Reservation status enum (spec §13.2); ``.name`` is the persisted form."""
+
+    RESERVED = 0
+    SETTLED = 1
+    FORCE_SETTLED = 2
+    RELEASED = 3
+
+
+STATUS_RESERVED = ResStatus.RESERVED
+STATUS_SETTLED = ResStatus.SETTLED
+STATUS_FORCE_SETTLED = ResStatus.FORCE_SETTLED
+STATUS_RELEASED = ResStatus.RELEASED
 
 # Default reservation expiry
 DEFAULT_RESERVATION_EXPIRY_SEC = 120
@@ -38,6 +55,20 @@ DEFAULT_RESERVATION_EXPIRY_SEC = 120
 FORCE_SETTLE_DEGRADED_THRESHOLD = 3
 
 
+def _mono_now() -> float:
+    """Monotonic clock for expiry and window arithmetic.
+
+    Wall-clock datetimes are only built for persisted/logged fields.
+    """
+    return time.monotonic()
+
+
+def _seconds_until_next_utc_midnight(now: datetime) -> float:
+    """Seconds from now (UTC) to the start of the next UTC day."""
+    midnight = datetime(now.year, now.month, now.day, tzinfo=_UTC) + timedelta(days=1)
+    return (midnight - now).total_seconds()
+
+
 def compute_daily_cap(wallet_usd: float) -> float:
     """Compute effective daily AI cap per spec §3.3.
 
@@ -58,11 +89,45 @@ class BudgetDeniedError(Exception):
     """Raised when AI budget reservation is denied."""
 
 
+class Reservation:
+    """A single budget reservation (spec §13.2)."""
+
+    __slots__ = (
+        "reservation_id", "model_key", "reserved_usd", "actual_usd", "status",
+        "correlation_id", "ts_utc", "expires_at", "ts_mono", "expires_mono",
+    )
+
+    def __init__(
+        self,
+        reservation_id: str,
+        model_key: str,
+        reserved_usd: float,
+        correlation_id: str,
+        ts_utc: datetime,
+        expires_at: datetime,
+        ts_mono: float,
+        expires_mono: float,
+        status: ResStatus = STATUS_RESERVED,
+        actual_usd: Optional[float] = None,
+    ) -> None:
+        self.reservation_id = reservation_id
+        self.model_key = model_key
+        self.reserved_usd = reserved_usd
+        self.actual_usd = actual_usd
+        self.status = status
+        self.correlation_id = correlation_id
+        self.ts_utc = ts_utc
+        self.expires_at = expires_at
+        self.ts_mono = ts_mono
+        self.expires_mono = expires_mono
+
+
 class BudgetManager:
     """In-memory budget manager for testing.
 
     Production uses DB with SERIALIZABLE transactions.
-    This in-memory version enforces all the same invariants.
+    This in-memory version enforces all the same invariants and is safe to
+    share between threads: each operation holds one short critical section.
     """
 
     def __init__(self, wallet_usd: float = 100.0) -> None:
@@ -70,34 +135,84 @@ class BudgetManager:
         self.daily_cap = compute_daily_cap(wallet_usd)
         self.window_cap = compute_window_cap(self.daily_cap)
 
-        # Day tracking
-        self._today = datetime.now(timezone.utc).date()
+        # Day tracking; the date is only re-read once the monotonic clock
+        # passes the next UTC midnight
+        now = datetime.now(_UTC)
+        self._today = now.date()
+        self._next_rollover_mono = _mono_now() + _seconds_until_next_utc_midnight(now)
         self._spent_usd = 0.0
         self._in_flight_usd = 0.0
 
-        # Reservations
-        self._reservations = {}  # type: Dict[str, Dict[str, Any]]
+        # Reservations, plus status indexes so the reaper and day rollover
+        # touch only the reservations they act on
+        self._reservations = {}  # type: Dict[str, Reservation]
+        self._reserved_ids = set()  # type: Set[str]
+        self._expiry_heap = []  # type: List[Tuple[float, str]]  # (expires_mono, id)
+        self._final_ids = []  # type: List[str]
+
+        # Rolling window of RESERVED costs, maintained incrementally:
+        # (ts_mono, reserved_usd, reservation_id) in reservation order, the ids
+        # still counted, and their running sum.
+        self._window = deque()  # type: Deque[Tuple[float, float, str]]
+        self._window_ids = set()  # type: Set[str]
+        self._window_sum_usd = 0.0
+
+        # stats snapshot: reused until a mutation bumps the version or the
+        # clock reaches valid_until_mono (window eviction / day rollover)
+        self._stats_version = 0
+        self._stats_cache = None  # type: Optional[Tuple[int, float, Dict[str, Any]]]
+
+        # Guards the counters and indexes above for the cap check + insert and
+        # each status transition; record building and logging stay outside.
+        self._lock = threading.Lock()
+
+        # In-process reservation ids: random per-manager prefix + counter
+        self._id_prefix = secrets.token_hex(4)
+        self._id_seq = itertools.count(1)
 
         # Tracking
-        self._correlation_ids_today = set()  # type: set
+        # 64-bit fingerprints (hash()) of today's correlation ids rather than
+        # the strings; per-process SipHash keying keeps them unpredictable, and
+        # at AI_ANALYSES_PER_DAY_HARD_CAP entries a collision (one uncounted
+        # analysis) has probability ~n^2 / 2^65, i.e. < 1e-15.
+        self._correlation_ids_today = set()  # type: Set[int]
         self._force_settle_count_today = 0
 
     def _check_day_rollover(self) -> None:
         """Reset counters if day has changed."""
-        today = datetime.now(timezone.utc).date()
+        if _mono_now() < self._next_rollover_mono:
+            return
+        now = datetime.now(_UTC)
+        today = now.date()
+        # Re-derived from the wall clock so monotonic drift cannot accumulate
+        self._next_rollover_mono = _mono_now() + _seconds_until_next_utc_midnight(now)
         if today != self._today:
             self._today = today
+            self._stats_version += 1
             self._spent_usd = 0.0
             self._in_flight_usd = 0.0
             self._correlation_ids_today.clear()
             self._force_settle_count_today = 0
-            # Clear settled/force-settled reservations from previous day
-            to_remove = [
-                rid for rid, r in self._reservations.items()
-                if r["status"] != STATUS_RESERVED
-            ]
-            for rid in to_remove:
+            # Clear settled/force-settled/released reservations from previous day
+            for rid in self._final_ids:
                 del self._reservations[rid]
+            self._final_ids = []
+
+    def _mark_final(self, reservation_id: str, reserved_usd: float) -> None:
+        """Move a reservation out of the RESERVED indexes after a transition."""
+        self._stats_version += 1
+        self._reserved_ids.discard(reservation_id)
+        self._final_ids.append(reservation_id)
+        self._window_discard(reservation_id, reserved_usd)
+
+    def _window_discard(self, reservation_id: str, reserved_usd: float) -> None:
+        """Stop counting a reservation towards the window sum (if it still is)."""
+        if reservation_id in self._window_ids:
+            self._window_ids.remove(reservation_id)
+            if self._window_ids:
+                self._window_sum_usd -= reserved_usd
+            else:
+                self._window_sum_usd = 0.0  # resync: no float drift when empty
 
     def _window_sum(self) -> float:
         """Sum of in-flight (RESERVED) costs in the rolling window.
@@ -105,17 +220,16 @@ class BudgetManager:
         Per spec §13.3: window check is separate from daily.
         Only RESERVED items count towards window pressure since
         settled items are already tracked in spent_usd.
-        """
-        now = datetime.now(timezone.utc)
-        cutoff = now - timedelta(seconds=AI_WINDOW_SEC)
 
-        total = 0.0
-        for r in self._reservations.values():
-            if r["status"] == STATUS_RESERVED:
-                ts = r["ts_utc"]
-                if ts >= cutoff:
-                    total += r["reserved_usd"]
-        return total
+        Entries older than AI_WINDOW_SEC are evicted from the left of the
+        deque; reservations that left RESERVED were already discounted.
+        """
+        cutoff = _mono_now() - AI_WINDOW_SEC
+        window = self._window
+        while window and window[0][0] < cutoff:
+            _, reserved_usd, rid = window.popleft()
+            self._window_discard(rid, reserved_usd)
+        return self._window_sum_usd
 
     def reserve(
         self,
@@ -128,53 +242,64 @@ class BudgetManager:
         Returns reservation_id on success.
         Raises BudgetDeniedError if any cap is exceeded.
         """
-        self._check_day_rollover()
-        now = datetime.now(timezone.utc)
-
-        # Check daily cap
-        if self._spent_usd + self._in_flight_usd + worst_case_usd > self.daily_cap:
-            raise BudgetDeniedError(
-                "Daily cap exceeded: spent={:.4f} in_flight={:.4f} requested={:.4f} cap={:.4f}".format(
-                    self._spent_usd, self._in_flight_usd, worst_case_usd, self.daily_cap,
-                )
-            )
+        # Build the record outside the lock; only cap checks + insertion hold it
+        now = datetime.now(_UTC)
+        ts_mono = _mono_now()
+        correlation_fp = hash(correlation_id)
+        reservation_id = "{}-{}".format(self._id_prefix, next(self._id_seq))
+        reservation = Reservation(
+            reservation_id=reservation_id,
+            model_key=model_key,
+            reserved_usd=worst_case_usd,
+            correlation_id=correlation_id,
+            ts_utc=now,
+            expires_at=now + timedelta(seconds=DEFAULT_RESERVATION_EXPIRY_SEC),
+            ts_mono=ts_mono,
+            expires_mono=ts_mono + DEFAULT_RESERVATION_EXPIRY_SEC,
+        )
+
+        with self._lock:
+            self._check_day_rollover()
 
-        # Check window cap
-        window_sum = self._window_sum()
-        if window_sum + worst_case_usd > self.window_cap:
-            raise BudgetDeniedError(
-                "Window cap exceeded: window_sum={:.4f} requested={:.4f} cap={:.4f}".format(
-                    window_sum, worst_case_usd, self.window_cap,
+            # Check daily cap
+            if self._spent_usd + self._in_flight_usd + worst_case_usd > self.daily_cap:
+                raise BudgetDeniedError(
+                    "Daily cap exceeded: spent={:.4f} in_flight={:.4f} requested={:.4f} "
+                    "cap={:.4f}".format(
+                        self._spent_usd, self._in_flight_usd, worst_case_usd, self.daily_cap,
+                    )
                 )
-            )
 
-        # Check analysis count cap
-        if len(self._correlation_ids_today) >= AI_ANALYSES_PER_DAY_HARD_CAP:
-            # Only count if this is a new correlation_id
-            if correlation_id not in self._correlation_ids_today:
+            # Check window cap
+            window_sum = self._window_sum()
+            if window_sum + worst_case_usd > self.window_cap:
                 raise BudgetDeniedError(
-                    "Analysis count cap exceeded: {} >= {}".format(
-                        len(self._correlation_ids_today), AI_ANALYSES_PER_DAY_HARD_CAP,
+                    "Window cap exceeded: window_sum={:.4f} requested={:.4f} cap={:.4f}".format(
+                        window_sum, worst_case_usd, self.window_cap,
                     )
                 )
 
-        # Create reservation
-        reservation_id = str(uuid.uuid4())
-        expires_at = now + timedelta(seconds=DEFAULT_RESERVATION_EXPIRY_SEC)
+            # Check analysis count cap
+            if len(self._correlation_ids_today) >= AI_ANALYSES_PER_DAY_HARD_CAP:
+                # Only count if this is a new correlation_id
+                if correlation_fp not in self._correlation_ids_today:
+                    raise BudgetDeniedError(
+                        "Analysis count cap exceeded: {} >= {}".format(
+                            len(self._correlation_ids_today), AI_ANALYSES_PER_DAY_HARD_CAP,
+                        )
+                    )
+
+            self._reservations[reservation_id] = reservation
+            self._reserved_ids.add(reservation_id)
+            heapq.heappush(self._expiry_heap, (reservation.expires_mono, reservation_id))
 
-        self._reservations[reservation_id] = {
-            "reservation_id": reservation_id,
-            "model_key": model_key,
-            "reserved_usd": worst_case_usd,
-            "actual_usd": None,
-            "status": STATUS_RESERVED,
-            "correlation_id": correlation_id,
-            "ts_utc": now,
-            "expires_at": expires_at,
-        }
+            self._in_flight_usd += worst_case_usd
+            self._correlation_ids_today.add(correlation_fp)
 
-        self._in_flight_usd += worst_case_usd
-        self._correlation_ids_today.add(correlation_id)
+            self._window.append((ts_mono, worst_case_usd, reservation_id))
+            self._window_ids.add(reservation_id)
+            self._window_sum_usd += worst_case_usd
+            self._stats_version += 1
 
         logger.debug(
             "Budget reserved: id=%s model=%s usd=%.4f",
@@ -187,25 +312,34 @@ class BudgetManager:
 
         Returns True if settlement succeeded, False if already final.
         """
-        self._check_day_rollover()
-
-        r = self._reservations.get(reservation_id)
-        if r is None:
+        with self._lock:
+            self._check_day_rollover()
+
+            r = self._reservations.get(reservation_id)
+            if r is None:
+                status = None
+            elif r.status != STATUS_RESERVED:
+                status = r.status
+            else:
+                status = STATUS_RESERVED
+                cost = actual_usd if actual_usd is not None else r.reserved_usd
+
+                r.status = STATUS_SETTLED
+                r.actual_usd = cost
+                self._mark_final(reservation_id, r.reserved_usd)
+
+                self._in_flight_usd -= r.reserved_usd
+                self._spent_usd += cost
+
+        if status is None:
             logger.warning("Settle: reservation %s not found", reservation_id)
             return False
-
-        if r["status"] != STATUS_RESERVED:
-            logger.info("Settle: reservation %s already %s (idempotent)", reservation_id, r["status"])
+        if status != STATUS_RESERVED:
+            logger.info(
+                "Settle: reservation %s already %s (idempotent)", reservation_id, status.name,
+            )
             return False
 
-        cost = actual_usd if actual_usd is not None else r["reserved_usd"]
-
-        r["status"] = STATUS_SETTLED
-        r["actual_usd"] = cost
-
-        self._in_flight_usd -= r["reserved_usd"]
-        self._spent_usd += cost
-
         logger.debug(
             "Budget settled: id=%s actual=%.4f",
             reservation_id, cost,
@@ -217,12 +351,14 @@ class BudgetManager:
 
         Returns True if release succeeded.
         """
-        r = self._reservations.get(reservation_id)
-        if r is None or r["status"] != STATUS_RESERVED:
-            return False
+        with self._lock:
+            r = self._reservations.get(reservation_id)
+            if r is None or r.status != STATUS_RESERVED:
+                return False
 
-        r["status"] = STATUS_RELEASED
-        self._in_flight_usd -= r["reserved_usd"]
+            r.status = STATUS_RELEASED
+            self._in_flight_usd -= r.reserved_usd
+            self._mark_final(reservation_id, r.reserved_usd)
 
         logger.debug("Budget released: id=%s", reservation_id)
         return True
@@ -232,28 +368,38 @@ class BudgetManager:
 
         Returns count of force-settled reservations.
         """
-        self._check_day_rollover()
-        now = datetime.now(timezone.utc)
-        grace = timedelta(seconds=5)
-        count = 0
+        grace_sec = 5.0
+        reaped = []  # type: List[Reservation]
+
+        with self._lock:
+            self._check_day_rollover()
 
-        for r in list(self._reservations.values()):
-            if r["status"] == STATUS_RESERVED and r["expires_at"] < now - grace:
-                r["status"] = STATUS_FORCE_SETTLED
-                r["actual_usd"] = r["reserved_usd"]
+            # Pop due entries off the expiry heap; ids no longer RESERVED are stale
+            heap = self._expiry_heap
+            cutoff = _mono_now() - grace_sec
+            while heap and heap[0][0] < cutoff:
+                _, rid = heapq.heappop(heap)
+                if rid not in self._reserved_ids:
+                    continue
 
-                self._in_flight_usd -= r["reserved_usd"]
-                self._spent_usd += r["reserved_usd"]
+                r = self._reservations[rid]
+                r.status = STATUS_FORCE_SETTLED
+                r.actual_usd = r.reserved_usd
+                self._mark_final(rid, r.reserved_usd)
+
+                self._in_flight_usd -= r.reserved_usd
+                self._spent_usd += r.reserved_usd
 
-                count += 1
                 self._force_settle_count_today += 1
+                reaped.append(r)
 
-                logger.warning(
-                    "Budget force-settled: id=%s model=%s usd=%.4f",
-                    r["reservation_id"], r["model_key"], r["reserved_usd"],
-                )
+        for r in reaped:
+            logger.warning(
+                "Budget force-settled: id=%s model=%s usd=%.4f",
+                r.reservation_id, r.model_key, r.reserved_usd,
+            )
 
-        return count
+        return len(reaped)
 
     @property
     def is_degraded(self) -> bool:
@@ -262,16 +408,32 @@ class BudgetManager:
 
     @property
     def stats(self) -> Dict[str, Any]:
-        """Current budget stats."""
-        self._check_day_rollover()
-        return {
-            "daily_cap": self.daily_cap,
-            "window_cap": self.window_cap,
-            "spent_usd": self._spent_usd,
-            "in_flight_usd": self._in_flight_usd,
-            "remaining_daily": self.daily_cap - self._spent_usd - self._in_flight_usd,
-            "window_sum": self._window_sum(),
-            "analyses_today": len(self._correlation_ids_today),
-            "force_settles_today": self._force_settle_count_today,
-            "is_degraded": self.is_degraded,
-        }
+        """Current budget stats.
+
+        Cached between mutations; the snapshot also expires when the oldest
+        window entry ages out or the next UTC day begins.
+        """
+        with self._lock:
+            self._check_day_rollover()
+            cached = self._stats_cache
+            if (cached is not None and cached[0] == self._stats_version
+                    and _mono_now() < cached[1]):
+                return dict(cached[2])
+
+            window_sum = self._window_sum()
+            valid_until = self._next_rollover_mono
+            if self._window:
+                valid_until = min(valid_until, self._window[0][0] + AI_WINDOW_SEC)
+            stats = {
+                "daily_cap": self.daily_cap,
+                "window_cap": self.window_cap,
+                "spent_usd": self._spent_usd,
+                "in_flight_usd": self._in_flight_usd,
+                "remaining_daily": self.daily_cap - self._spent_usd - self._in_flight_usd,
+                "window_sum": window_sum,
+                "analyses_today": len(self._correlation_ids_today),
+                "force_settles_today": self._force_settle_count_today,
+                "is_degraded": self.is_degraded,
+            }
+            self._stats_cache = (self._stats_version, valid_until, stats)
+            return dict(stats)
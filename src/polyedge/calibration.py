@@ -8,10 +8,16 @@ Implements:
 
 from __future__ import annotations
 
+import bisect
 import logging
 import math
 from typing import Any, Dict, List, Optional, Tuple
 
+try:  # optional: vectorized Brier/binning for long prediction histories
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None
+
 from polyedge.constants import (
     DELTA_MAX_DEFAULT,
     DELTA_MAX_HIGH_DISPUTE,
@@ -28,6 +34,9 @@ REASON_P_EFF_OUTLIER = "P_EFF_OUTLIER"
 # Calibration bin boundaries
 DEFAULT_BINS = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
 
+# Below this many predictions the pure-Python path beats numpy's call overhead
+_NP_MIN_PREDICTIONS = 32
+
 
 def brier_score(predictions: List[float], outcomes: List[int]) -> float:
     """Compute Brier score.
@@ -40,9 +49,87 @@ def brier_score(predictions: List[float], outcomes: List[int]) -> float:
         return 1.0  # Worst possible
 
     n = len(predictions)
+    if np is not None and n >= _NP_MIN_PREDICTIONS:
+        p = np.asarray(predictions, dtype=np.float64)
+        o = np.asarray(outcomes, dtype=np.float64)
+        return float(np.mean((p - o) ** 2))
     return sum((p - o) ** 2 for p, o in zip(predictions, outcomes)) / n
 
 
+class BrierStreamer:
+    """Running Brier score per category, updated in O(1) per resolution.
+
+    Keeps (sum of squared errors, count) per category instead of re-scanning
+    the prediction history; use brier_score() for one-off batches.
+    """
+
+    def __init__(self) -> None:
+        self._sse = {}  # type: Dict[str, float]
+        self._n = {}  # type: Dict[str, int]
+
+    def update(self, category: str, prediction: float, outcome: int) -> float:
+        """Fold in one resolved prediction; returns the category's new score."""
+        err = prediction - outcome
+        sse = self._sse.get(category, 0.0) + err * err
+        n = self._n.get(category, 0) + 1
+        self._sse[category] = sse
+        self._n[category] = n
+        return sse / n
+
+    def score(self, category: str) -> float:
+        """Current Brier score for a category (1.0 if nothing resolved yet)."""
+        n = self._n.get(category, 0)
+        if not n:
+            return 1.0  # Worst possible, as brier_score() for empty input
+        return self._sse[category] / n
+
+    def count(self, category: str) -> int:
+        """Number of resolved predictions folded in for a category."""
+        return self._n.get(category, 0)
+
+
+def _bin_sums(
+    predictions: List[float],
+    outcomes: List[int],
+    edges: List[float],
+) -> Tuple[List[int], List[float], List[float]]:
+    """Per-bin (count, sum of predictions, sum of outcomes).
+
+    Bins are [lo, hi) except the last, which also includes its upper edge;
+    predictions outside [edges[0], edges[-1]] fall in no bin.
+    """
+    n_bins = len(edges) - 1
+    n = min(len(predictions), len(outcomes))
+
+    if np is not None and n >= _NP_MIN_PREDICTIONS:
+        p = np.asarray(predictions[:n], dtype=np.float64)
+        o = np.asarray(outcomes[:n], dtype=np.float64)
+        in_range = (p >= edges[0]) & (p <= edges[-1])  # also drops NaN
+        p = p[in_range]
+        o = o[in_range]
+        idx = np.minimum(np.digitize(p, edges) - 1, n_bins - 1)
+        return (
+            np.bincount(idx, minlength=n_bins).tolist(),
+            np.bincount(idx, weights=p, minlength=n_bins).tolist(),
+            np.bincount(idx, weights=o, minlength=n_bins).tolist(),
+        )
+
+    counts = [0] * n_bins
+    pred_sums = [0.0] * n_bins
+    out_sums = [0.0] * n_bins
+    first, last = edges[0], edges[-1]
+    for p, o in zip(predictions, outcomes):
+        if not first <= p <= last:  # also drops NaN
+            continue
+        i = bisect.bisect_right(edges, p) - 1
+        if i == n_bins:  # p == last edge belongs to the final bin
+            i -= 1
+        counts[i] += 1
+        pred_sums[i] += p
+        out_sums[i] += o
+    return counts, pred_sums, out_sums
+
+
 def calibration_bins(
     predictions: List[float],
     outcomes: List[int],
@@ -53,25 +140,18 @@ def calibration_bins(
     Returns list of bins with predicted_mean, observed_fraction, count.
     """
     edges = bin_edges or DEFAULT_BINS
+    counts, pred_sums, out_sums = _bin_sums(predictions, outcomes, edges)
     bins = []  # type: List[Dict[str, Any]]
 
-    for i in range(len(edges) - 1):
+    for i, count in enumerate(counts):
         lo, hi = edges[i], edges[i + 1]
-
-        bin_preds = []
-        bin_outcomes = []
-        for p, o in zip(predictions, outcomes):
-            if lo <= p < hi or (i == len(edges) - 2 and p == hi):
-                bin_preds.append(p)
-                bin_outcomes.append(o)
-
-        if bin_preds:
+        if count:
             bins.append({
                 "bin_lo": lo,
                 "bin_hi": hi,
-                "predicted_mean": sum(bin_preds) / len(bin_preds),
-                "observed_fraction": sum(bin_outcomes) / len(bin_outcomes),
-                "count": len(bin_preds),
+                "predicted_mean": pred_sums[i] / count,
+                "observed_fraction": out_sums[i] / count,
+                "count": count,
             })
         else:
             bins.append({
@@ -101,22 +181,28 @@ def compute_w_ai(
     if n_resolved < N_RESOLVED_MIN:
         return 0.0
 
-    w = W_AI_MAX  # Start at max and reduce
+    w = W_AI_MAX  # Start at max and reduce; stop as soon as it hits 0
 
     # Reduce if AI calibration is worse than baseline
     if category_brier_ai is not None and category_brier_baseline is not None:
         if category_brier_ai > category_brier_baseline:
             # AI is worse → reduce proportionally
-            ratio = category_brier_baseline / max(category_brier_ai, 0.001)
-            w *= ratio
+            denom = category_brier_ai if category_brier_ai > 0.001 else 0.001
+            w *= category_brier_baseline / denom
+            if w <= 0.0:
+                return 0.0
 
     # Reduce for high disagreement
     if disagreement > 0:
         w *= max(0.0, 1.0 - disagreement * 3)
+        if w <= 0.0:
+            return 0.0
 
     # Reduce for high dispute risk
     if dispute_risk > 0.5:
         w *= max(0.0, 1.0 - (dispute_risk - 0.5) * 2)
+        if w <= 0.0:
+            return 0.0
 
     # Reduce if evidence tier mix is weak
     if evidence_tier_mix:
@@ -139,26 +225,16 @@ def compute_p_eff(
 
     Returns (p_eff, reason_code_if_rejected).
     """
-    p_eff = p_market + w_ai * (p_ai_cal - p_market)
-
-    # Hard bounds
-    delta_max = DELTA_MAX_DEFAULT
-    if dispute_risk >= 0.7:
-        delta_max = DELTA_MAX_HIGH_DISPUTE
-
-    # Clamp to delta_max
-    delta = p_eff - p_market
-    if abs(delta) > delta_max:
-        if delta > 0:
-            p_eff = p_market + delta_max
-        else:
-            p_eff = p_market - delta_max
+    # Hard bounds: clamp the AI shift to ±delta_max
+    delta_max = DELTA_MAX_HIGH_DISPUTE if dispute_risk >= 0.7 else DELTA_MAX_DEFAULT
+    delta = w_ai * (p_ai_cal - p_market)
+    if not -delta_max <= delta <= delta_max:
+        delta = delta_max if delta > 0 else -delta_max
+    p_eff = p_market + delta
 
     # Outlier check
-    if abs(p_eff - p_market) > P_EFF_OUTLIER_THRESHOLD:
+    if abs(delta) > P_EFF_OUTLIER_THRESHOLD:
         return p_eff, REASON_P_EFF_OUTLIER
 
     # Clamp to [0, 1]
-    p_eff = max(0.0, min(1.0, p_eff))
-
-    return p_eff, None
+    return min(1.0, max(0.0, p_eff)), None
@@ -9,12 +9,15 @@ Fast loop runs every FAST_LOOP_SEC (2s). For each watchlist market:
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import time
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from enum import IntEnum
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
 
 from polyedge.constants import (
     CANDIDATES_PER_MIN_MAX,
@@ -26,9 +29,14 @@ from polyedge.constants import (
     TRIGGER_PERSIST_MIN_SEC,
     TRIGGER_PERSIST_UPDATES,
 )
+from polyedge.snapshots import Snapshot
 
 logger = logging.getLogger(__name__)
 
+# Batched candidate inserts: flush at this many rows or after this delay
+CANDIDATE_BATCH_MAX = 64
+CANDIDATE_BATCH_MAX_DELAY_SEC = 0.05
+
 # Trigger types (spec §9.1)
 TRIGGER_SPREAD_CHANGE = "spread_change"
 TRIGGER_DEPTH_DROP = "depth_drop"
@@ -42,14 +50,48 @@ ALL_TRIGGER_TYPES = frozenset({
     TRIGGER_APPROACHING_RESOLUTION,
 })
 
-# Candidate status enum (spec §9.2)
-STATUS_NEW = "NEW"
-STATUS_FILTERED = "FILTERED"
-STATUS_EVIDENCE_DONE = "EVIDENCE_DONE"
-STATUS_AI_DONE = "AI_DONE"
-STATUS_DECIDED = "DECIDED"
-STATUS_EXECUTED = "EXECUTED"
-STATUS_DROPPED = "DROPPED"
+# JSON for trigger_reasons lists made only of known trigger types (bounded:
+# at most len(ALL_TRIGGER_TYPES) entries each), keyed by the tuple of reasons
+_TRIGGER_REASONS_JSON = {}  # type: Dict[Tuple[str, ...], str]
+
+
+def _trigger_reasons_json(trigger_reasons: List[str]) -> str:
+    """Serialized trigger_reasons, memoized for lists of known trigger types."""
+    key = tuple(trigger_reasons)
+    cached = _TRIGGER_REASONS_JSON.get(key)
+    if cached is None:
+        cached = json.dumps(trigger_reasons)
+        if len(key) <= len(ALL_TRIGGER_TYPES) and ALL_TRIGGER_TYPES.issuperset(key):
+            _TRIGGER_REASONS_JSON[key] = cached
+    return cached
+
+
+class CandidateStatus(IntEnum):
+    """Candidate status enum (spec §9.2); ``.name`` is the persisted form."""
+
+    NEW = 0
+    FILTERED = 1
+    EVIDENCE_DONE = 2
+    AI_DONE = 3
+    DECIDED = 4
+    EXECUTED = 5
+    DROPPED = 6
+
+
+STATUS_NEW = CandidateStatus.NEW
+STATUS_FILTERED = CandidateStatus.FILTERED
+STATUS_EVIDENCE_DONE = CandidateStatus.EVIDENCE_DONE
+STATUS_AI_DONE = CandidateStatus.AI_DONE
+STATUS_DECIDED = CandidateStatus.DECIDED
+STATUS_EXECUTED = CandidateStatus.EXECUTED
+STATUS_DROPPED = CandidateStatus.DROPPED
+
+
+def _as_status(status: Union[CandidateStatus, str]) -> CandidateStatus:
+    """Accept a CandidateStatus or its persisted name."""
+    if isinstance(status, CandidateStatus):
+        return status
+    return CandidateStatus[status]
 
 
 class TriggerState:
@@ -60,29 +102,35 @@ class TriggerState:
     """
 
     def __init__(self) -> None:
-        # (market_id, trigger_type) -> {"first_seen": timestamp, "count": int}
-        self._state = {}  # type: Dict[Tuple[str, str], Dict[str, Any]]
+        # market_id -> trigger_type -> {"first_seen": monotonic ts, "count": int}
+        self._state = {}  # type: Dict[str, Dict[str, Dict[str, Any]]]
 
     def record_trigger(
         self,
         market_id: str,
         trigger_type: str,
         snapshot_id: str,
+        now_mono: Optional[float] = None,
     ) -> bool:
-        """Record a trigger occurrence. Returns True if persistence threshold met."""
-        key = (market_id, trigger_type)
-        now = time.time()
+        """Record a trigger occurrence. Returns True if persistence threshold met.
 
-        if key not in self._state:
-            self._state[key] = {
+        now_mono lets a fast-loop tick share one time.monotonic() reading.
+        """
+        now = time.monotonic() if now_mono is None else now_mono
+
+        market = self._state.get(market_id)
+        if market is None:
+            market = self._state[market_id] = {}
+
+        entry = market.get(trigger_type)
+        if entry is None:
+            market[trigger_type] = {
                 "first_seen": now,
                 "count": 1,
                 "last_snapshot_id": snapshot_id,
             }
             return False
 
-        entry = self._state[key]
-
         # Don't count same snapshot twice
         if entry["last_snapshot_id"] == snapshot_id:
             return False
@@ -97,16 +145,21 @@ class TriggerState:
 
         return False
 
+    def active_triggers(self, market_id: str) -> List[str]:
+        """Trigger types currently being tracked for a market."""
+        return list(self._state.get(market_id, ()))
+
     def clear_trigger(self, market_id: str, trigger_type: str) -> None:
         """Clear a trigger after candidate is enqueued or trigger disappears."""
-        key = (market_id, trigger_type)
-        self._state.pop(key, None)
+        market = self._state.get(market_id)
+        if market is not None:
+            market.pop(trigger_type, None)
+            if not market:
+                del self._state[market_id]
 
     def clear_market(self, market_id: str) -> None:
         """Clear all triggers for a market."""
-        keys_to_remove = [k for k in self._state if k[0] == market_id]
-        for k in keys_to_remove:
-            del self._state[k]
+        self._state.pop(market_id, None)
 
 
 class CandidateRateLimiter:
@@ -118,31 +171,44 @@ class CandidateRateLimiter:
     """
 
     def __init__(self) -> None:
-        self._global_timestamps = []  # type: List[float]
-        self._market_timestamps = defaultdict(list)  # type: Dict[str, List[float]]
-
-    def _prune(self, timestamps: List[float], now: float) -> List[float]:
-        """Remove timestamps older than 60 seconds."""
+        # Enqueue times in arrival order, so expired entries sit at the left
+        self._global_timestamps = deque()  # type: Deque[float]
+        self._market_timestamps = defaultdict(deque)  # type: Dict[str, Deque[float]]
+        self._last_gc = time.time()
+
+    @staticmethod
+    def _prune(timestamps: Deque[float], now: float) -> None:
+        """Drop timestamps older than 60 seconds from the left, in place."""
         cutoff = now - 60.0
-        return [t for t in timestamps if t > cutoff]
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+
+    def _gc_markets(self, now: float) -> None:
+        """Forget markets with no enqueues in the last 60 seconds."""
+        self._last_gc = now
+        for market_id, timestamps in list(self._market_timestamps.items()):
+            self._prune(timestamps, now)
+            if not timestamps:
+                del self._market_timestamps[market_id]
 
     def can_enqueue(self, market_id: str) -> bool:
         """Check if a new candidate can be enqueued."""
         now = time.time()
-
-        # Prune old timestamps
-        self._global_timestamps = self._prune(self._global_timestamps, now)
-        self._market_timestamps[market_id] = self._prune(
-            self._market_timestamps[market_id], now,
-        )
-
-        # Check global cap
-        if len(self._global_timestamps) >= CANDIDATES_PER_MIN_MAX:
-            return False
-
-        # Check per-market cap
-        if len(self._market_timestamps[market_id]) >= PER_MARKET_CANDIDATES_PER_MIN_MAX:
-            return False
+        if now - self._last_gc >= 60.0:
+            self._gc_markets(now)
+
+        # Prune only when at a cap; below it pruning cannot change the answer
+        timestamps = self._global_timestamps
+        if len(timestamps) >= CANDIDATES_PER_MIN_MAX:
+            self._prune(timestamps, now)
+            if len(timestamps) >= CANDIDATES_PER_MIN_MAX:
+                return False
+
+        timestamps = self._market_timestamps.get(market_id)
+        if timestamps is not None and len(timestamps) >= PER_MARKET_CANDIDATES_PER_MIN_MAX:
+            self._prune(timestamps, now)
+            if len(timestamps) >= PER_MARKET_CANDIDATES_PER_MIN_MAX:
+                return False
 
         return True
 
@@ -153,14 +219,43 @@ class CandidateRateLimiter:
         self._market_timestamps[market_id].append(now)
 
 
+def market_end_epoch(market_data: Dict[str, Any]) -> Optional[float]:
+    """Resolution time of a market as a Unix timestamp, or None if unknown.
+
+    end_date_utc (ISO string or datetime; naive means UTC) is parsed once and
+    memoized in market_data["end_date_epoch"], so the fast loop reuses it.
+    """
+    try:
+        return market_data["end_date_epoch"]
+    except KeyError:
+        pass
+
+    end_epoch = None  # type: Optional[float]
+    end_date = market_data.get("end_date_utc")
+    if isinstance(end_date, str):
+        try:
+            end_date = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
+        except ValueError:
+            end_date = None
+    if isinstance(end_date, datetime):
+        if end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=timezone.utc)
+        end_epoch = end_date.timestamp()
+
+    market_data["end_date_epoch"] = end_epoch
+    return end_epoch
+
+
 def detect_triggers(
     market_id: str,
-    snapshot: Any,
-    prev_snapshot: Optional[Any] = None,
+    snapshot: Optional[Snapshot],
+    prev_snapshot: Optional[Snapshot] = None,
     market_data: Optional[Dict[str, Any]] = None,
+    now_utc: Optional[datetime] = None,
 ) -> List[str]:
     """Detect which triggers fire for a market given the latest snapshot.
 
+    now_utc lets a fast-loop tick share one clock reading across markets.
     Returns list of trigger type strings.
     """
     triggers = []  # type: List[str]
@@ -168,45 +263,34 @@ def detect_triggers(
     if snapshot is None:
         return triggers
 
-    # Trigger: spread_change
-    if hasattr(snapshot, "best_bid_yes") and hasattr(snapshot, "best_ask_yes"):
-        if snapshot.best_bid_yes is not None and snapshot.best_ask_yes is not None:
-            spread_yes = snapshot.best_ask_yes - snapshot.best_bid_yes
-            if prev_snapshot and prev_snapshot.best_bid_yes and prev_snapshot.best_ask_yes:
-                prev_spread = prev_snapshot.best_ask_yes - prev_snapshot.best_bid_yes
-                spread_change = abs(spread_yes - prev_spread)
-                if spread_change > 0.005:  # 0.5% spread change threshold
-                    triggers.append(TRIGGER_SPREAD_CHANGE)
-
-    # Trigger: depth_drop
-    if hasattr(snapshot, "depth_yes") and prev_snapshot and hasattr(prev_snapshot, "depth_yes"):
-        current_depth = sum(level[1] for level in (snapshot.depth_yes or [])[:3])
-        prev_depth = sum(level[1] for level in (prev_snapshot.depth_yes or [])[:3])
-        if prev_depth > 0 and current_depth < prev_depth * 0.7:  # 30% depth drop
+    # Spread, mid and top-3 depth are precomputed on the Snapshot; a missing
+    # side is NaN, so every comparison below is False without None checks.
+    if prev_snapshot is not None:
+        # A previous bid/ask of 0.0 counts as missing too (no baseline to
+        # move from), so price triggers need both previous sides non-zero
+        prev_priced = bool(prev_snapshot.best_bid_yes and prev_snapshot.best_ask_yes)
+
+        # Trigger: spread_change
+        if prev_priced and abs(snapshot.spread_yes - prev_snapshot.spread_yes) > 0.005:  # 0.5%
+            triggers.append(TRIGGER_SPREAD_CHANGE)
+
+        # Trigger: depth_drop
+        prev_depth = prev_snapshot.top3_depth_yes
+        if prev_depth > 0 and snapshot.top3_depth_yes < prev_depth * 0.7:  # 30% depth drop
             triggers.append(TRIGGER_DEPTH_DROP)
 
-    # Trigger: mid_move
-    if (hasattr(snapshot, "best_bid_yes") and hasattr(snapshot, "best_ask_yes")
-            and snapshot.best_bid_yes is not None and snapshot.best_ask_yes is not None):
-        mid = (snapshot.best_bid_yes + snapshot.best_ask_yes) / 2.0
-        if prev_snapshot and prev_snapshot.best_bid_yes and prev_snapshot.best_ask_yes:
-            prev_mid = (prev_snapshot.best_bid_yes + prev_snapshot.best_ask_yes) / 2.0
-            if abs(mid - prev_mid) > 0.01:  # 1% mid move
-                triggers.append(TRIGGER_MID_MOVE)
+        # Trigger: mid_move
+        if prev_priced and abs(snapshot.mid_yes - prev_snapshot.mid_yes) > 0.01:  # 1% mid move
+            triggers.append(TRIGGER_MID_MOVE)
 
     # Trigger: approaching_resolution
     if market_data:
-        end_date = market_data.get("end_date_utc")
-        if end_date:
-            if isinstance(end_date, str):
-                try:
-                    end_date = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-                except (ValueError, TypeError):
-                    end_date = None
-            if end_date:
-                remaining = (end_date - datetime.now(timezone.utc)).total_seconds()
-                if TIME_TO_RESOLUTION_MIN_SEC <= remaining <= 24 * 3600:  # Within 24h
-                    triggers.append(TRIGGER_APPROACHING_RESOLUTION)
+        end_epoch = market_end_epoch(market_data)
+        if end_epoch is not None:
+            now = time.time() if now_utc is None else now_utc.timestamp()
+            remaining = end_epoch - now
+            if TIME_TO_RESOLUTION_MIN_SEC <= remaining <= 24 * 3600:  # Within 24h
+                triggers.append(TRIGGER_APPROACHING_RESOLUTION)
 
     return triggers
 
@@ -215,14 +299,16 @@ def create_candidate(
     market_id: str,
     snapshot_id: str,
     trigger_reasons: List[str],
+    now_utc: Optional[datetime] = None,
 ) -> Dict[str, Any]:
     """Create a candidate record per spec §9.2."""
-    now = datetime.now(timezone.utc)
+    now = now_utc or datetime.now(timezone.utc)
     return {
         "candidate_id": str(uuid.uuid4()),
         "market_id": market_id,
         "snapshot_id": snapshot_id,
         "created_at_utc": now,
+        "created_at_epoch": now.timestamp(),
         "trigger_reasons": trigger_reasons,
         "status": STATUS_NEW,
         "filter_reason": None,
@@ -232,24 +318,29 @@ def create_candidate(
     }
 
 
-async def enqueue_candidate(pool: Any, candidate: Dict[str, Any]) -> None:
-    """Insert a candidate into the database."""
-    import json as _json
+_INSERT_CANDIDATE_SQL = """
+    INSERT INTO candidates (
+        candidate_id, market_id, snapshot_id, created_at_utc,
+        trigger_reasons, status, filter_reason,
+        decided_at_utc, decision_id_hex, updated_at_utc
+    ) VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7, $8, $9, $10)
+"""
 
-    await pool.execute(
-        """
-        INSERT INTO candidates (
-            candidate_id, market_id, snapshot_id, created_at_utc,
-            trigger_reasons, status, filter_reason,
-            decided_at_utc, decision_id_hex, updated_at_utc
-        ) VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7, $8, $9, $10)
-        """,
-        uuid.UUID(candidate["candidate_id"]),
+
+def _as_uuid(value: Union[uuid.UUID, str]) -> uuid.UUID:
+    """Pass uuid.UUID through; parse strings."""
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+
+
+def _candidate_row(candidate: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Positional INSERT arguments for a candidate (trigger_reasons serialized)."""
+    return (
+        _as_uuid(candidate["candidate_id"]),
         candidate["market_id"],
-        uuid.UUID(candidate["snapshot_id"]),
+        _as_uuid(candidate["snapshot_id"]),
         candidate["created_at_utc"],
-        _json.dumps(candidate["trigger_reasons"]),
-        candidate["status"],
+        _trigger_reasons_json(candidate["trigger_reasons"]),
+        _as_status(candidate["status"]).name,
         candidate["filter_reason"],
         candidate["decided_at_utc"],
         candidate["decision_id_hex"],
@@ -257,15 +348,140 @@ async def enqueue_candidate(pool: Any, candidate: Dict[str, Any]) -> None:
     )
 
 
+async def enqueue_candidate(pool: Any, candidate: Dict[str, Any]) -> None:
+    """Insert a candidate into the database."""
+    await pool.execute(_INSERT_CANDIDATE_SQL, *_candidate_row(candidate))
+
+
+def _resolve(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():  # the flush() caller may have been cancelled
+        waiter.set_result(None)
+
+
+class CandidateBatcher:
+    """Buffer candidate inserts and write them in batches.
+
+    A background task drains the queue into one ``executemany`` per batch,
+    flushing at CANDIDATE_BATCH_MAX rows or CANDIDATE_BATCH_MAX_DELAY_SEC
+    after the first queued row, whichever comes first.
+
+    A failed batch is not dropped silently: the error is kept and re-raised
+    from the next ``submit()``, ``flush()`` or ``aclose()``.  Rows are only
+    durable once ``flush()`` (or ``aclose()``) has returned, so
+    ``update_candidate_status`` must not run for a submitted candidate
+    before then (the UPDATE would match no row).
+    """
+
+    def __init__(
+        self,
+        pool: Any,
+        max_batch: int = CANDIDATE_BATCH_MAX,
+        max_delay_sec: float = CANDIDATE_BATCH_MAX_DELAY_SEC,
+    ) -> None:
+        self._pool = pool
+        self._max_batch = max_batch
+        self._max_delay_sec = max_delay_sec
+        # Rows are serialized at submit time; a Future is a flush request
+        # (resolved once everything queued before it is written) and None
+        # is the shutdown sentinel
+        self._queue = asyncio.Queue()  # type: asyncio.Queue[Any]
+        self._task = None  # type: Optional[asyncio.Task[None]]
+        self._error = None  # type: Optional[BaseException]
+
+    async def __aenter__(self) -> "CandidateBatcher":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    def _raise_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    async def submit(self, candidate: Dict[str, Any]) -> None:
+        """Queue a candidate for insertion.
+
+        Raises the error of an earlier failed batch, if any, without
+        queueing the candidate.
+        """
+        self._raise_error()
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        await self._queue.put(_candidate_row(candidate))
+
+    async def flush(self) -> None:
+        """Write everything queued so far; raises if any batch failed."""
+        if self._task is not None:
+            done = asyncio.get_running_loop().create_future()  # type: asyncio.Future[None]
+            await self._queue.put(done)
+            await done
+        self._raise_error()
+
+    async def aclose(self) -> None:
+        """Flush everything queued so far and stop the writer (idempotent).
+
+        Raises if any batch failed.
+        """
+        if self._task is not None:
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+        self._raise_error()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            if item is None:
+                return
+            if isinstance(item, asyncio.Future):
+                _resolve(item)
+                continue
+            batch = [item]
+            flushed = None  # type: Optional[asyncio.Future[None]]
+            deadline = loop.time() + self._max_delay_sec
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                if isinstance(item, asyncio.Future):
+                    flushed = item
+                    break
+                batch.append(item)
+            await self._write(batch)
+            if flushed is not None:
+                _resolve(flushed)
+
+    async def _write(self, batch: List[Tuple[Any, ...]]) -> None:
+        try:
+            await self._pool.executemany(_INSERT_CANDIDATE_SQL, batch)
+        except Exception as e:
+            logger.error("Candidate batch insert failed (%d rows): %s", len(batch), e)
+            if self._error is None:
+                self._error = e
+
+
 async def update_candidate_status(
     pool: Any,
-    candidate_id: str,
-    status: str,
+    candidate_id: Union[uuid.UUID, str],
+    status: Union[CandidateStatus, str],
     filter_reason: Optional[str] = None,
     decision_id_hex: Optional[str] = None,
+    now_utc: Optional[datetime] = None,
 ) -> None:
     """Update candidate status."""
-    now = datetime.now(timezone.utc)
+    status = _as_status(status)
+    now = now_utc or datetime.now(timezone.utc)
     decided_at = now if status == STATUS_DECIDED else None
 
     await pool.execute(
@@ -277,17 +493,34 @@ async def update_candidate_status(
             updated_at_utc = $6
         WHERE candidate_id = $1
         """,
-        uuid.UUID(candidate_id), status, filter_reason, decided_at, decision_id_hex, now,
+        _as_uuid(candidate_id), status.name, filter_reason, decided_at, decision_id_hex, now,
     )
 
 
-def is_candidate_expired(candidate: Dict[str, Any]) -> bool:
-    """Check if a candidate has exceeded CANDIDATE_MAX_AGE_SEC."""
-    created = candidate.get("created_at_utc")
-    if created is None:
-        return True
-    now = datetime.now(timezone.utc)
-    if isinstance(created, str):
-        created = datetime.fromisoformat(created.replace("Z", "+00:00"))
-    age = (now - created).total_seconds()
-    return age > CANDIDATE_MAX_AGE_SEC
+def is_candidate_expired(
+    candidate: Dict[str, Any],
+    now_utc: Optional[datetime] = None,
+) -> bool:
+    """Check if a candidate has exceeded CANDIDATE_MAX_AGE_SEC.
+
+    Uses created_at_epoch (set by create_candidate); candidates without it
+    (e.g. read back from the DB) have created_at_utc parsed once and the
+    epoch memoized onto the dict.  Naive datetimes are taken as UTC.
+    """
+    created_epoch = candidate.get("created_at_epoch")
+    if created_epoch is None:
+        created = candidate.get("created_at_utc")
+        if created is None:
+            return True
+        if isinstance(created, str):
+            created = datetime.fromisoformat(created.replace("Z", "+00:00"))
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)
+        created_epoch = candidate["created_at_epoch"] = created.timestamp()
+    if now_utc is None:
+        now = time.time()
+    else:
+        if now_utc.tzinfo is None:
+            now_utc = now_utc.replace(tzinfo=timezone.utc)
+        now = now_utc.timestamp()
+    return now - created_epoch > CANDIDATE_MAX_AGE_SEC
@@ -10,12 +10,13 @@ Single command entrypoint supporting:
 
 from __future__ import annotations
 
-import asyncio
-import json
+import atexit
+import functools
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import click
 
@@ -27,12 +28,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger("polyedge")
 
+if TYPE_CHECKING:
+    import asyncio
+
+# asyncio (and uvloop, which imports it) is only loaded once a command first
+# calls _run, so sync-only commands such as `config verify` never pay for it.
+
+
+def _install_uvloop() -> None:
+    """Make uvloop the default event loop policy, if it is installed.
+
+    Called by _run just before it creates the CLI loop, so that loop (and
+    any later one, e.g. db.run_migrations_sync's, which opens its own pool)
+    is a uvloop.Loop; without uvloop the stdlib selector loop is kept.
+    """
+    import asyncio
+
+    try:  # optional: libuv-backed event loop for the I/O-bound commands
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:  # pragma: no cover - uvloop is an optional extra (no Windows support)
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+@functools.lru_cache(maxsize=None)
+def _db() -> ModuleType:
+    """Return polyedge.db, imported on first use (pulls in asyncpg)."""
+    import polyedge.db
+
+    return polyedge.db
+
+
+# One event loop per process: the asyncpg pool is bound to the loop that
+# created it, so reusing the loop keeps the pool warm across commands run in
+# the same process (e.g. an embedding app invoking several subcommands).
+_loop = None  # type: Optional[asyncio.AbstractEventLoop]
+
 
 def _run(coro: Any) -> Any:
     """Run an async coroutine from sync Click context."""
-    loop = asyncio.new_event_loop()
+    global _loop
+    if _loop is None:
+        import asyncio
+
+        _install_uvloop()
+        _loop = asyncio.new_event_loop()
+        atexit.register(_shutdown_loop)
+    return _loop.run_until_complete(coro)
+
+
+def _shutdown_loop() -> None:
+    """Close the DB pool (if one was opened) and the CLI loop at exit."""
+    global _loop
+    loop, _loop = _loop, None
+    if loop is None or loop.is_closed():
+        return
     try:
-        return loop.run_until_complete(coro)
+        db = sys.modules.get("polyedge.db")
+        if db is not None:
+            loop.run_until_complete(db.close_pool())
     finally:
         loop.close()
 
@@ -43,7 +97,6 @@ def _run(coro: Any) -> Any:
 @click.version_option(version="2.5.0", prog_name="polyedge")
 def cli() -> None:
     """PolyEdge Automator v2.5 — autonomous prediction-market edge system."""
-    pass
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -61,7 +114,7 @@ def config() -> None:
     "--config-dir", default="config", help="Path to config directory",
     type=click.Path(exists=True),
 )
-@click.option("--key", required=True, help="Operator HMAC key for signing")
+@click.option("--key", required=True, help="Operator key for signing")
 def config_generate_manifest(config_dir: str, key: str) -> None:
     """Generate a signed config manifest."""
     from polyedge.config_signing import generate_manifest
@@ -77,7 +130,7 @@ def config_generate_manifest(config_dir: str, key: str) -> None:
     "--config-dir", default="config", help="Path to config directory",
     type=click.Path(exists=True),
 )
-@click.option("--key", required=True, help="Operator HMAC key for verification")
+@click.option("--key", required=True, help="Operator key for verification")
 def config_verify(config_dir: str, key: str) -> None:
     """Verify the signed config manifest (fail-closed)."""
     from polyedge.config_signing import ConfigTamperError, verify_manifest
@@ -107,18 +160,9 @@ def db() -> None:
 )
 def db_migrate(migrations_dir: Optional[str]) -> None:
     """Run pending database migrations."""
-    from polyedge.db import close_pool, run_migrations
-
     mdir = Path(migrations_dir) if migrations_dir else None
 
-    async def _run_migrate() -> List[str]:
-        try:
-            result = await run_migrations(mdir)
-            return result
-        finally:
-            await close_pool()
-
-    applied = _run(_run_migrate())
+    applied = _run(_db().run_migrations(mdir))
     if applied:
         click.echo("Applied {} migration(s): {}".format(len(applied), ", ".join(applied)))
     else:
@@ -137,22 +181,49 @@ def wal() -> None:
 
 @wal.command("write")
 @click.option("--type", "record_type", required=True, help="WAL record type")
-@click.option("--payload", required=True, help="JSON payload")
+@click.option("--payload", default=None, help="JSON payload")
+@click.option(
+    "--batch-file", default=None, type=click.File("r", encoding="utf-8"),
+    help="NDJSON file of payloads ('-' for stdin), written with one fsync",
+)
 @click.option("--wal-path", default="data/wal.jsonl", help="Path to WAL file")
-def wal_write(record_type: str, payload: str, wal_path: str) -> None:
-    """Write a single record to the WAL."""
+def wal_write(
+    record_type: str, payload: Optional[str], batch_file: Optional[Any], wal_path: str,
+) -> None:
+    """Write a single record (or an NDJSON batch) to the WAL."""
+    import orjson
+
     from polyedge.wal import WALSyncError, WALWriter
 
-    try:
-        payload_dict = json.loads(payload)
-    except json.JSONDecodeError as e:
-        click.echo("Invalid JSON payload: {}".format(e), err=True)
+    if (payload is None) == (batch_file is None):
+        click.echo("Exactly one of --payload or --batch-file is required", err=True)
         sys.exit(1)
 
+    # Parse everything up front so a bad line writes nothing
+    payloads = []  # type: List[Dict[str, Any]]
+    if payload is not None:
+        lines = [(1, payload)]
+    else:
+        lines = [(n, line) for n, line in enumerate(batch_file, 1) if line.strip()]
+    for line_num, raw in lines:
+        try:
+            payloads.append(orjson.loads(raw))
+        except orjson.JSONDecodeError as e:
+            click.echo("Invalid JSON payload (line {}): {}".format(line_num, e), err=True)
+            sys.exit(1)
+
     try:
         with WALWriter(wal_path) as writer:
-            record = writer.write(record_type, payload_dict)
-        click.echo("WAL record written: type={} id={}".format(record_type, record["event_id"]))
+            if batch_file is None:
+                record = writer.write(record_type, payloads[0])
+                click.echo("WAL record written: type={} id={}".format(
+                    record_type, record["event_id"],
+                ))
+            else:
+                records = writer.write_batch(record_type, payloads)
+                click.echo("WAL batch written: type={} count={}".format(
+                    record_type, len(records),
+                ))
     except (WALSyncError, ValueError) as e:
         click.echo("WAL write failed: {}".format(e), err=True)
         sys.exit(1)
@@ -162,15 +233,11 @@ def wal_write(record_type: str, payload: str, wal_path: str) -> None:
 @click.option("--wal-path", default="data/wal.jsonl", help="Path to WAL file")
 def wal_replay(wal_path: str) -> None:
     """Replay WAL records into the database."""
-    from polyedge.db import close_pool, get_pool
     from polyedge.wal import WALSyncError, replay_wal
 
     async def _run_replay() -> Dict[str, int]:
-        try:
-            pool = await get_pool()
-            return await replay_wal(wal_path, pool)
-        finally:
-            await close_pool()
+        pool = await _db().get_pool()
+        return await replay_wal(wal_path, pool)
 
     try:
         stats = _run(_run_replay())
@@ -200,7 +267,6 @@ def ws() -> None:
 @click.option("--markets", default=None, help="Comma-separated market IDs to subscribe")
 def ws_run(mock: bool, duration: int, markets: Optional[str]) -> None:
     """Connect to WS and ingest orderbook snapshots."""
-    from polyedge.db import close_pool, get_pool
     from polyedge.snapshots import create_snapshot, store_snapshot
     from polyedge.ws_client import OrderbookWSClient
 
@@ -211,20 +277,17 @@ def ws_run(mock: bool, duration: int, markets: Optional[str]) -> None:
         nonlocal snapshot_count
         snap = create_snapshot(book_data["market_id"], book_data, snapshot_source="WS")
         try:
-            pool = await get_pool()
+            pool = await _db().get_pool()
             await store_snapshot(pool, snap)
             snapshot_count += 1
         except Exception as e:
             logger.error("Failed to store snapshot: %s", e)
 
     async def _run_ws() -> None:
-        try:
-            client = OrderbookWSClient(mock_mode=mock, on_book_update=on_book_update)
-            await client.connect()
-            await client.subscribe(market_ids)
-            await client.run(duration_sec=duration)
-        finally:
-            await close_pool()
+        client = OrderbookWSClient(mock_mode=mock, on_book_update=on_book_update)
+        await client.connect()
+        await client.subscribe(market_ids)
+        await client.run(duration_sec=duration)
 
     click.echo("WS {} mode — subscribing to {} markets".format(
         "mock" if mock else "live", len(market_ids),
@@ -287,20 +350,16 @@ def registry() -> None:
 @click.option("--mock", is_flag=True, help="Use mock data (no Gamma API calls)")
 def registry_sync(mock: bool) -> None:
     """Sync markets from Gamma API (or mock data)."""
-    from polyedge.db import close_pool, get_pool
     from polyedge.registry import generate_mock_markets, sync_markets
 
     async def _run_sync() -> Dict[str, int]:
-        try:
-            pool = await get_pool()
-            if mock:
-                markets = generate_mock_markets()
-            else:
-                from polyedge.registry import fetch_markets_from_gamma
-                markets = await fetch_markets_from_gamma()
-            return await sync_markets(pool, markets)
-        finally:
-            await close_pool()
+        pool = await _db().get_pool()
+        if mock:
+            markets = generate_mock_markets()
+        else:
+            from polyedge.registry import fetch_markets_from_gamma
+            markets = await fetch_markets_from_gamma()
+        return await sync_markets(pool, markets)
 
     click.echo("Registry sync ({} mode)...".format("mock" if mock else "live"))
     stats = _run(_run_sync())
@@ -314,15 +373,11 @@ def registry_sync(mock: bool) -> None:
 @registry.command("stats")
 def registry_stats() -> None:
     """Print market registry statistics."""
-    from polyedge.db import close_pool, get_pool
     from polyedge.registry import get_registry_stats
 
     async def _run_stats() -> Dict[str, Any]:
-        try:
-            pool = await get_pool()
-            return await get_registry_stats(pool)
-        finally:
-            await close_pool()
+        pool = await _db().get_pool()
+        return await get_registry_stats(pool)
 
     stats = _run(_run_stats())
     click.echo("Total markets:     {}".format(stats["total_markets"]))
@@ -348,23 +403,21 @@ def snapshot() -> None:
 @click.option("--data", required=True, help="JSON book data")
 def snapshot_ingest(market_id: str, data: str) -> None:
     """Ingest a single snapshot from JSON data."""
-    from polyedge.db import close_pool, get_pool
+    import orjson
+
     from polyedge.snapshots import create_snapshot, store_snapshot
 
     try:
-        book_data = json.loads(data)
-    except json.JSONDecodeError as e:
+        book_data = orjson.loads(data)
+    except orjson.JSONDecodeError as e:
         click.echo("Invalid JSON: {}".format(e), err=True)
         sys.exit(1)
 
     async def _run_ingest() -> None:
-        try:
-            pool = await get_pool()
-            snap = create_snapshot(market_id, book_data, snapshot_source="REST")
-            await store_snapshot(pool, snap)
-            click.echo("Snapshot stored: id={} market={}".format(snap.snapshot_id, market_id))
-        finally:
-            await close_pool()
+        pool = await _db().get_pool()
+        snap = create_snapshot(market_id, book_data, snapshot_source="REST")
+        await store_snapshot(pool, snap)
+        click.echo("Snapshot stored: id={} market={}".format(snap.snapshot_id, market_id))
 
     _run(_run_ingest())
 
@@ -385,6 +438,7 @@ def pipeline() -> None:
 def pipeline_run(mock: bool, duration: int) -> None:
     """Run the candidate pipeline fast loop."""
     import time as _time
+    from datetime import datetime, timezone
 
     from polyedge.candidates import (
         CandidateRateLimiter,
@@ -414,18 +468,26 @@ def pipeline_run(mock: bool, duration: int) -> None:
         while _time.time() - start < duration:
             results = await client.run_mock_loop(duration_sec=2.0)
 
+            # One clock reading per tick, shared by every market
+            now_utc = datetime.now(timezone.utc)
+            now_mono = _time.monotonic()
+
             for book_data in results:
                 mid = book_data["market_id"]
                 snap = create_snapshot(mid, book_data, snapshot_source="WS")
 
                 prev = prev_snapshots.get(mid)
-                triggers = detect_triggers(mid, snap, prev)
+                triggers = detect_triggers(mid, snap, prev, now_utc=now_utc)
                 prev_snapshots[mid] = snap
 
                 for trig in triggers:
-                    persisted = trigger_state.record_trigger(mid, trig, snap.snapshot_id)
+                    persisted = trigger_state.record_trigger(
+                        mid, trig, snap.snapshot_id, now_mono=now_mono,
+                    )
                     if persisted and rate_limiter.can_enqueue(mid):
-                        candidate = create_candidate(mid, snap.snapshot_id, [trig])
+                        candidate = create_candidate(
+                            mid, snap.snapshot_id, [trig], now_utc=now_utc,
+                        )
 
                         market_data = {
                             "is_binary_eligible": True,
@@ -466,15 +528,11 @@ def watchlist() -> None:
 @watchlist.command("show")
 def watchlist_show() -> None:
     """Print current watchlist."""
-    from polyedge.db import close_pool, get_pool
     from polyedge.watchlist import get_watchlist
 
     async def _run_show() -> List[Dict[str, Any]]:
-        try:
-            pool = await get_pool()
-            return await get_watchlist(pool)
-        finally:
-            await close_pool()
+        pool = await _db().get_pool()
+        return await get_watchlist(pool)
 
     items = _run(_run_show())
     if not items:
@@ -492,28 +550,24 @@ def watchlist_show() -> None:
 @click.option("--mock", is_flag=True, help="Use mock data")
 def watchlist_refresh(mock: bool) -> None:
     """Refresh the watchlist from eligible markets."""
-    from polyedge.db import close_pool, get_pool
     from polyedge.registry import generate_mock_markets, parse_gamma_market
     from polyedge.watchlist import refresh_watchlist
 
     async def _run_refresh() -> Dict[str, int]:
-        try:
-            pool = await get_pool()
-            if mock:
-                raw_markets = generate_mock_markets()
-            else:
-                from polyedge.registry import fetch_markets_from_gamma
-                raw_markets = await fetch_markets_from_gamma()
-
-            eligible = []
-            for m in raw_markets:
-                parsed = parse_gamma_market(m)
-                if parsed and parsed["is_binary_eligible"]:
-                    eligible.append(parsed)
-
-            return await refresh_watchlist(pool, eligible)
-        finally:
-            await close_pool()
+        pool = await _db().get_pool()
+        if mock:
+            raw_markets = generate_mock_markets()
+        else:
+            from polyedge.registry import fetch_markets_from_gamma
+            raw_markets = await fetch_markets_from_gamma()
+
+        eligible = []
+        for m in raw_markets:
+            parsed = parse_gamma_market(m)
+            if parsed and parsed["is_binary_eligible"]:
+                eligible.append(parsed)
+
+        return await refresh_watchlist(pool, eligible)
 
     stats = _run(_run_refresh())
     click.echo("Watchlist refreshed: added={} probation={} quarantine={}".format(
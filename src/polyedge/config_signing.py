@@ -1,7 +1,9 @@
 """Config signing and manifest verification (spec §22, §5.4 step 1).
 
-Implements HMAC-SHA256 manifest signing.  On verification failure the process
-MUST halt — callers should catch ConfigTamperError and exit non-zero.
+Implements keyed BLAKE2b-256 manifest signing over BLAKE2b-256 file hashes
+(manifest schema v2.6; v2.5 used HMAC-SHA256 and must be regenerated).  On
+verification failure the process MUST halt — callers should catch
+ConfigTamperError and exit non-zero.
 """
 
 from __future__ import annotations
@@ -10,17 +12,40 @@ import hashlib
 import hmac
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-# Files that must be present in the manifest
-MANIFEST_FILES = (
+# Files that must be present in the manifest, in canonical (sorted) order:
+# hashes and the signature payload are built by iterating this tuple as-is.
+MANIFEST_FILES = tuple(sorted((
     "config.yaml",
     "evidence_sources.json",
     "injection_patterns.json",
     "model_pricing.json",
+)))
+
+
+MANIFEST_SCHEMA_VERSION = "polyedge.manifest.v2.6"
+
+# Manifest digest: BLAKE2b truncated to 32 bytes (64 hex chars, same width as
+# the SHA-256 it replaced); its keyed mode replaces the HMAC construction.
+_DIGEST_SIZE = 32
+_MAX_KEY_SIZE = hashlib.blake2b.MAX_KEY_SIZE  # 64 bytes
+
+
+def _new_file_hash() -> "hashlib._Hash":
+    return hashlib.blake2b(digest_size=_DIGEST_SIZE)
+
+
+# Verified-manifest cache: one token per config dir, skipping the re-hash
+# when neither the manifest nor any config file has changed since the last
+# successful verification under the same operator key.
+VERIFY_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "polyedge" / "verify.cache"
 )
 
 
@@ -28,35 +53,125 @@ class ConfigTamperError(Exception):
     """Raised when manifest verification fails."""
 
 
+# Read size for the pre-3.11 fallback hashing loop
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _fadvise(fd: int, advice_name: str) -> None:
+    """Best-effort posix_fadvise over the whole file (no-op off Linux/Unix)."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
 def compute_file_hash(path: Path) -> str:
-    """Return the SHA-256 hex digest of a file's contents."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    """Return the BLAKE2b-256 hex digest of a file's contents.
 
+    Files are hashed once per verification, so the kernel is told to read
+    ahead sequentially and then to drop the pages from the page cache
+    rather than evict hotter (e.g. DB) pages.
+    """
+    with open(path, "rb", buffering=0) as f:
+        fd = f.fileno()
+        _fadvise(fd, "POSIX_FADV_SEQUENTIAL")
+        try:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+: read loop runs in C
+                return hashlib.file_digest(f, _new_file_hash).hexdigest()
+            h = _new_file_hash()
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                h.update(chunk)
+            return h.hexdigest()
+        finally:
+            _fadvise(fd, "POSIX_FADV_DONTNEED")
 
-def _canonical_hashes(config_dir: Path) -> Dict[str, str]:
-    """Compute deterministic file hashes for all manifest files."""
-    hashes = {}  # type: Dict[str, str]
-    for fname in sorted(MANIFEST_FILES):
-        fpath = config_dir / fname
+
+def _signing_key(operator_key: str) -> bytes:
+    """Operator key as a BLAKE2b key.
+
+    Keys longer than BLAKE2b's 64-byte limit are first hashed down to 64
+    bytes (as HMAC does for long keys) rather than truncated.
+    """
+    key = operator_key.encode("utf-8")
+    if len(key) > _MAX_KEY_SIZE:
+        key = hashlib.blake2b(key).digest()
+    return key
+
+
+def _hashes_and_signature(config_dir: Path, operator_key: str) -> Tuple[Dict[str, str], str]:
+    """Hash all manifest files and sign them in one pass.
+
+    Files are hashed concurrently (hashlib releases the GIL on large
+    updates) and each ``name=digest`` entry is streamed into the keyed
+    BLAKE2b-256 signer in canonical MANIFEST_FILES order, newline-separated,
+    so no intermediate payload string is built.
+    """
+    paths = [config_dir / fname for fname in MANIFEST_FILES]
+    for fpath in paths:
         if not fpath.is_file():
             raise ConfigTamperError("Required config file missing: {}".format(fpath))
-        hashes[fname] = compute_file_hash(fpath)
-    return hashes
+    signer = hashlib.blake2b(key=_signing_key(operator_key), digest_size=_DIGEST_SIZE)
+    hashes = {}  # type: Dict[str, str]
+    with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+        for fname, digest in zip(MANIFEST_FILES, ex.map(compute_file_hash, paths)):
+            if hashes:
+                signer.update(b"\n")
+            signer.update("{}={}".format(fname, digest).encode("utf-8"))
+            hashes[fname] = digest
+    return hashes, signer.hexdigest()
 
 
-def _compute_signature(hashes: Dict[str, str], operator_key: str) -> str:
-    """HMAC-SHA256 signature over the canonical hash payload."""
-    canonical = "\n".join("{}={}".format(k, v) for k, v in sorted(hashes.items()))
-    sig = hmac.new(
-        operator_key.encode("utf-8"),
-        canonical.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-    return sig
+def _fingerprint(config_dir: Path) -> str:
+    """Stat fingerprint of the manifest and config files.
+
+    ctime and inode are included alongside mtime/size since neither can be
+    set back by a plain utime() after an edit.
+    """
+    parts = []
+    for fname in ("manifest.json",) + MANIFEST_FILES:
+        st = os.stat(config_dir / fname)
+        parts.append("{}:{}:{}:{}:{}".format(
+            fname, st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino,
+        ))
+    return "\n".join(parts)
+
+
+def _cache_token(manifest_raw: bytes, fingerprint: str, operator_key: str) -> str:
+    """Keyed digest binding a verified manifest to its file fingerprint.
+
+    Keyed by a digest of the operator key, so entries cannot be forged
+    without it and are invalidated when the key rotates.
+    """
+    key = hashlib.blake2b(operator_key.encode("utf-8"), digest_size=_DIGEST_SIZE).digest()
+    h = hashlib.blake2b(key=key, digest_size=_DIGEST_SIZE)
+    h.update(MANIFEST_SCHEMA_VERSION.encode("utf-8") + b"\0")
+    h.update(fingerprint.encode("utf-8") + b"\0")
+    h.update(manifest_raw)
+    return h.hexdigest()
+
+
+def _load_verify_cache(cache_path: Path) -> Dict[str, str]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _store_verify_cache(cache_path: Path, dir_key: str, token: str) -> None:
+    """Record a successful verification; failures to write are non-fatal."""
+    cache = _load_verify_cache(cache_path)
+    cache[dir_key] = token
+    tmp = cache_path.with_suffix(".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(cache, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    except OSError as e:
+        logger.debug("Could not write verify cache %s: %s", cache_path, e)
 
 
 def generate_manifest(config_dir: Path, operator_key: str) -> Dict[str, Any]:
@@ -65,11 +180,10 @@ def generate_manifest(config_dir: Path, operator_key: str) -> Dict[str, Any]:
     Returns the manifest dict and also writes it to config_dir/manifest.json.
     """
     config_dir = Path(config_dir)
-    hashes = _canonical_hashes(config_dir)
-    signature = _compute_signature(hashes, operator_key)
+    hashes, signature = _hashes_and_signature(config_dir, operator_key)
 
     manifest = {
-        "schema_version": "polyedge.manifest.v2.5",
+        "schema_version": MANIFEST_SCHEMA_VERSION,
         "file_hashes": hashes,
         "signature": signature,
     }  # type: Dict[str, Any]
@@ -83,9 +197,16 @@ def generate_manifest(config_dir: Path, operator_key: str) -> Dict[str, Any]:
     return manifest
 
 
-def verify_manifest(config_dir: Path, operator_key: str) -> bool:
+def verify_manifest(
+    config_dir: Path,
+    operator_key: str,
+    cache_path: Optional[Path] = None,
+) -> bool:
     """Verify the signed manifest against current config files.
 
+    A successful result is cached in ``cache_path`` (default
+    VERIFY_CACHE_PATH) against a stat fingerprint of the manifest and
+    config files; repeat calls with nothing changed skip re-hashing.
     Raises ConfigTamperError on any mismatch.  Returns True on success.
     """
     config_dir = Path(config_dir)
@@ -94,20 +215,40 @@ def verify_manifest(config_dir: Path, operator_key: str) -> bool:
     if not manifest_path.is_file():
         raise ConfigTamperError("Manifest file not found: {}".format(manifest_path))
 
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if cache_path is None:
+        cache_path = VERIFY_CACHE_PATH
+    manifest_raw = manifest_path.read_bytes()
+    dir_key = str(config_dir.resolve())
+    try:
+        token = _cache_token(manifest_raw, _fingerprint(config_dir), operator_key)
+    except OSError:
+        token = None  # a config file is missing; the full check reports it
+    if token is not None:
+        cached = _load_verify_cache(cache_path).get(dir_key)
+        if isinstance(cached, str) and hmac.compare_digest(cached, token):
+            logger.info("Config manifest verified OK (cached)")
+            return True
+
+    manifest = json.loads(manifest_raw.decode("utf-8"))
 
     # Verify structure
     if "file_hashes" not in manifest or "signature" not in manifest:
         raise ConfigTamperError("Manifest missing required fields")
+    if manifest.get("schema_version") != MANIFEST_SCHEMA_VERSION:
+        raise ConfigTamperError(
+            "Unsupported manifest schema {!r} (expected {}); regenerate the manifest".format(
+                manifest.get("schema_version"), MANIFEST_SCHEMA_VERSION,
+            )
+        )
 
     stored_hashes = manifest["file_hashes"]
     stored_sig = manifest["signature"]
 
-    # Recompute hashes
-    current_hashes = _canonical_hashes(config_dir)
+    # Recompute hashes and the expected signature
+    current_hashes, expected_sig = _hashes_and_signature(config_dir, operator_key)
 
     # Compare file hashes
-    for fname in sorted(MANIFEST_FILES):
+    for fname in MANIFEST_FILES:
         if fname not in stored_hashes:
             raise ConfigTamperError("Manifest missing hash for: {}".format(fname))
         if stored_hashes[fname] != current_hashes[fname]:
@@ -118,9 +259,10 @@ def verify_manifest(config_dir: Path, operator_key: str) -> bool:
             )
 
     # Verify signature
-    expected_sig = _compute_signature(current_hashes, operator_key)
     if not hmac.compare_digest(stored_sig, expected_sig):
         raise ConfigTamperError("Manifest signature verification failed")
 
+    if token is not None:
+        _store_verify_cache(cache_path, dir_key, token)
     logger.info("Config manifest verified OK")
     return True
@@ -5,14 +5,20 @@ Implements:
 - EV calculation: EV = (p_eff × $1) - entry_price - required_edge
 - Trade rule: only if max(EV_yes, EV_no) >= EV_MIN
 - Deterministic decision_id from canonical hash
+- Batch screening of many candidates (NumPy when installed)
 """
 
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
-from typing import Any, Dict, Optional, Tuple
+import struct
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:  # optional: vectorized friction/EV screen for large candidate batches
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None
 
 from polyedge.constants import (
     EV_MIN,
@@ -20,6 +26,9 @@ from polyedge.constants import (
     PAPER_MIN_FEE_BPS,
 )
 
+if TYPE_CHECKING:
+    from polyedge.snapshots import Snapshot
+
 logger = logging.getLogger(__name__)
 
 # Reason codes
@@ -43,6 +52,19 @@ def compute_fee_cost(
         return fee_rate_bps / 10000.0
 
 
+class DecisionConfig:
+    """Session-constant decision settings, specialised once.
+
+    A running session has a single mode and usually a single fee rate, so
+    the fee cost is evaluated here rather than on every make_decision call.
+    """
+
+    def __init__(self, is_paper: bool = True, fee_rate_bps: float = 0.0) -> None:
+        self.is_paper = is_paper
+        self.fee_rate_bps = fee_rate_bps
+        self.fee_cost = compute_fee_cost(fee_rate_bps, is_paper)
+
+
 def compute_slippage_buffer(
     order_size_usd: float,
     depth_usd_top_levels: float,
@@ -108,11 +130,119 @@ def compute_ev(
         return (1.0 - p_eff) * 1.0 - entry_price - required_edge
 
 
+# Side codes returned by _decide_kernel
+_SIDE_YES = 0
+_SIDE_NO = 1
+_SIDE_NO_TRADE = 2
+_SIDE_NAMES = ("YES", "NO", "NO_TRADE")
+
+
+def _decide_kernel(
+    bid_yes: float,
+    ask_yes: float,
+    bid_no: float,
+    ask_no: float,
+    depth_yes: float,
+    depth_no: float,
+    p_eff: float,
+    order_size_usd: float,
+    dispute_risk: float,
+    evidence_conflict_tier1: bool,
+    decision_to_exec_sec: float,
+    time_to_resolution_days: float,
+    fee: float,
+) -> Tuple[int, float, float, float, float, float, float, float, float, float, float,
+           float, float, float]:
+    """Friction model + EV + trade rule fused into one call.
+
+    Inlines the compute_* helpers above (same operations in the same order,
+    so results are bit-identical) to avoid ~10 Python calls per decision.
+    ``fee`` is the precomputed compute_fee_cost (see DecisionConfig).
+    Returns (side_code, ev, entry_price, required_edge, ev_yes, ev_no,
+    spread_yes, spread_no, fee, slippage_yes, slippage_no, dispute,
+    latency, time_val).
+    """
+    spread_yes = 0.5 * max(0, ask_yes - bid_yes)
+    spread_no = 0.5 * max(0, ask_no - bid_no)
+    slippage_yes = max(0.005, order_size_usd / max(depth_yes, 1) * 0.02)
+    slippage_no = max(0.005, order_size_usd / max(depth_no, 1) * 0.02)
+    dispute = 0.01 + 0.02 * dispute_risk
+    if evidence_conflict_tier1:
+        dispute *= 1.5
+    latency = max(0, (decision_to_exec_sec - 2)) * 0.001
+    time_val = min(0.02, time_to_resolution_days * 0.0002)
+
+    edge_yes = spread_yes + fee + slippage_yes + dispute + latency + time_val
+    edge_no = spread_no + fee + slippage_no + dispute + latency + time_val
+    ev_yes = p_eff * 1.0 - ask_yes - edge_yes
+    ev_no = (1.0 - p_eff) * 1.0 - ask_no - edge_no
+
+    # Trade rule
+    if ev_yes >= EV_MIN and ev_yes >= ev_no:
+        side, ev, entry_price, required_edge = _SIDE_YES, ev_yes, ask_yes, edge_yes
+    elif ev_no >= EV_MIN:
+        side, ev, entry_price, required_edge = _SIDE_NO, ev_no, ask_no, edge_no
+    else:
+        side = _SIDE_NO_TRADE
+        ev = max(ev_yes, ev_no)
+        entry_price = 0
+        required_edge = max(edge_yes, edge_no)
+
+    return (
+        side, ev, entry_price, required_edge, ev_yes, ev_no,
+        spread_yes, spread_no, fee, slippage_yes, slippage_no, dispute,
+        latency, time_val,
+    )
+
+
+# Canonical decision-id layout (v3).  v1 hashed a sorted-key JSON object;
+# v2 hashes a fixed binary layout: header (version, side code, id lengths),
+# the UTF-8 ids, then the rounded numerics as little-endian doubles.  v3
+# keeps that layout but digests it with BLAKE2b-128 (32 hex chars) instead
+# of SHA-256, since the id doubles as client_order_id in every order record.
+DECISION_ID_CANONICAL_VERSION = 3
+_DECISION_ID_HEAD = struct.Struct("<BBII")
+_DECISION_ID_NUMS = struct.Struct("<5d")
+_DECISION_ID_DIGEST_SIZE = 16
+
+
+def compute_decision_id(
+    market_id: str,
+    candidate_id: str,
+    side_code: int,
+    p_eff: float,
+    entry_price: float,
+    ev: float,
+    required_edge: float,
+    order_size_usd: float,
+) -> str:
+    """Deterministic decision_id_hex: BLAKE2b-128 over the v3 binary layout.
+
+    Ids are length-prefixed (never truncated or padded), so distinct ids
+    cannot collide; numerics keep the v1 rounding (6dp, size 2dp).
+    """
+    market_b = market_id.encode("utf-8")
+    candidate_b = candidate_id.encode("utf-8")
+    h = hashlib.blake2b(_DECISION_ID_HEAD.pack(
+        DECISION_ID_CANONICAL_VERSION, side_code, len(market_b), len(candidate_b),
+    ), digest_size=_DECISION_ID_DIGEST_SIZE)
+    h.update(market_b)
+    h.update(candidate_b)
+    h.update(_DECISION_ID_NUMS.pack(
+        round(p_eff, 6),
+        round(entry_price, 6),
+        round(ev, 6),
+        round(required_edge, 6),
+        round(order_size_usd, 2),
+    ))
+    return h.hexdigest()
+
+
 def make_decision(
     market_id: str,
     candidate_id: str,
     p_eff: float,
-    snapshot: Any,
+    snapshot: Snapshot,
     order_size_usd: float,
     dispute_risk: float = 0.0,
     evidence_conflict_tier1: bool = False,
@@ -120,65 +250,82 @@ def make_decision(
     time_to_resolution_days: float = 30.0,
     fee_rate_bps: float = 0.0,
     is_paper: bool = True,
+    config: Optional[DecisionConfig] = None,
 ) -> Dict[str, Any]:
     """Produce a deterministic decision with full friction model.
 
-    Returns decision dict with side, EV, required_edge, gates, etc.
+    Pass a session ``config`` to reuse its precomputed fee cost; it then
+    takes precedence over ``fee_rate_bps``/``is_paper``.
+    Returns decision dict with side, EV, required_edge, gates, etc.;
+    ``decision_id_hex`` and ``client_order_id`` are "" for NO_TRADE.
     """
-    bid_yes = getattr(snapshot, "best_bid_yes", 0) or 0
-    ask_yes = getattr(snapshot, "best_ask_yes", 0) or 0
-    bid_no = getattr(snapshot, "best_bid_no", 0) or 0
-    ask_no = getattr(snapshot, "best_ask_no", 0) or 0
-
-    depth_yes = sum(l[1] for l in (getattr(snapshot, "depth_yes", []) or [])[:3])
-    depth_no = sum(l[1] for l in (getattr(snapshot, "depth_no", []) or [])[:3])
-
-    # Friction components
-    spread_yes = compute_spread_cost(bid_yes, ask_yes)
-    spread_no = compute_spread_cost(bid_no, ask_no)
-    fee = compute_fee_cost(fee_rate_bps, is_paper)
-    slippage_yes = compute_slippage_buffer(order_size_usd, depth_yes)
-    slippage_no = compute_slippage_buffer(order_size_usd, depth_no)
-    dispute = compute_dispute_buffer(dispute_risk, evidence_conflict_tier1)
-    latency = compute_latency_penalty(decision_to_exec_sec)
-    time_val = compute_time_value_penalty(time_to_resolution_days)
-
-    edge_yes = compute_required_edge(spread_yes, fee, slippage_yes, dispute, latency, time_val)
-    edge_no = compute_required_edge(spread_no, fee, slippage_no, dispute, latency, time_val)
-
-    ev_yes = compute_ev(p_eff, ask_yes, edge_yes, "YES")
-    ev_no = compute_ev(p_eff, ask_no, edge_no, "NO")
-
-    # Trade rule
-    if ev_yes >= EV_MIN and ev_yes >= ev_no:
-        side = "YES"
-        ev = ev_yes
-        entry_price = ask_yes
-        required_edge = edge_yes
-    elif ev_no >= EV_MIN:
-        side = "NO"
-        ev = ev_no
-        entry_price = ask_no
-        required_edge = edge_no
+    if config is None:
+        fee = compute_fee_cost(fee_rate_bps, is_paper)
     else:
-        side = "NO_TRADE"
-        ev = max(ev_yes, ev_no)
-        entry_price = 0
-        required_edge = max(edge_yes, edge_no)
+        fee, is_paper = config.fee_cost, config.is_paper
+    # Snapshot always carries these attributes; only missing prices (None)
+    # need defaulting
+    bid_yes = snapshot.best_bid_yes or 0
+    ask_yes = snapshot.best_ask_yes or 0
+    bid_no = snapshot.best_bid_no or 0
+    ask_no = snapshot.best_ask_no or 0
+
+    depth_yes = snapshot.top3_depth_yes  # pre-summed when the Snapshot is built
+    depth_no = snapshot.top3_depth_no
+
+    (
+        side_code, ev, entry_price, required_edge, ev_yes, ev_no,
+        spread_yes, spread_no, fee, slippage_yes, slippage_no, dispute,
+        latency, time_val,
+    ) = _decide_kernel(
+        bid_yes, ask_yes, bid_no, ask_no, depth_yes, depth_no,
+        p_eff, order_size_usd, dispute_risk, evidence_conflict_tier1,
+        decision_to_exec_sec, time_to_resolution_days, fee,
+    )
+    return _assemble_decision(
+        market_id, candidate_id, p_eff, order_size_usd, is_paper, ask_yes,
+        side_code, ev, entry_price, required_edge, ev_yes, ev_no,
+        spread_yes, spread_no, fee, slippage_yes, slippage_no, dispute,
+        latency, time_val,
+    )
 
-    # Build canonical decision string for hashing
-    canonical = json.dumps({
-        "market_id": market_id,
-        "candidate_id": candidate_id,
-        "side": side,
-        "p_eff": round(p_eff, 6),
-        "entry_price": round(entry_price, 6),
-        "ev": round(ev, 6),
-        "required_edge": round(required_edge, 6),
-        "order_size_usd": round(order_size_usd, 2),
-    }, sort_keys=True, separators=(",", ":"))
 
-    decision_id_hex = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+def _assemble_decision(
+    market_id: str,
+    candidate_id: str,
+    p_eff: float,
+    order_size_usd: float,
+    is_paper: bool,
+    ask_yes: float,
+    side_code: int,
+    ev: float,
+    entry_price: float,
+    required_edge: float,
+    ev_yes: float,
+    ev_no: float,
+    spread_yes: float,
+    spread_no: float,
+    fee: float,
+    slippage_yes: float,
+    slippage_no: float,
+    dispute: float,
+    latency: float,
+    time_val: float,
+) -> Dict[str, Any]:
+    """Hash and build the decision dict from _decide_kernel's outputs.
+
+    Only trading decisions are hashed: NO_TRADE results (most of a scan)
+    never reach an order, so their decision_id_hex/client_order_id are "".
+    """
+    side = _SIDE_NAMES[side_code]
+
+    if side_code == _SIDE_NO_TRADE:
+        decision_id_hex = ""
+    else:
+        decision_id_hex = compute_decision_id(
+            market_id, candidate_id, side_code, p_eff, entry_price, ev,
+            required_edge, order_size_usd,
+        )
 
     return {
         "decision_id_hex": decision_id_hex,
@@ -207,3 +354,154 @@ def make_decision(
         "client_order_id": decision_id_hex,
         "is_paper": is_paper,
     }
+
+
+class SnapshotBatch:
+    """Struct-of-arrays view of many snapshots for make_decisions_batch.
+
+    Each column is a float64 ``np.ndarray`` (a list without numpy); missing
+    prices are 0 and depths are top-3 level sums, as in make_decision.
+    """
+
+    def __init__(
+        self,
+        bid_yes: Any,
+        ask_yes: Any,
+        bid_no: Any,
+        ask_no: Any,
+        depth_yes: Any,
+        depth_no: Any,
+    ) -> None:
+        self.bid_yes = _column(bid_yes)
+        self.ask_yes = _column(ask_yes)
+        self.bid_no = _column(bid_no)
+        self.ask_no = _column(ask_no)
+        self.depth_yes = _column(depth_yes)
+        self.depth_no = _column(depth_no)
+
+    def __len__(self) -> int:
+        return len(self.bid_yes)
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Sequence[Snapshot]) -> SnapshotBatch:
+        """Build the columns from Snapshot objects."""
+        return cls(
+            [snap.best_bid_yes or 0 for snap in snapshots],
+            [snap.best_ask_yes or 0 for snap in snapshots],
+            [snap.best_bid_no or 0 for snap in snapshots],
+            [snap.best_ask_no or 0 for snap in snapshots],
+            [snap.top3_depth_yes for snap in snapshots],
+            [snap.top3_depth_no for snap in snapshots],
+        )
+
+
+def _column(values: Any) -> Any:
+    """float64 array when numpy is available, else a list of floats."""
+    if np is not None:
+        return np.asarray(values, dtype=np.float64)
+    return [float(v) for v in values]
+
+
+def _screen_batch(
+    batch: SnapshotBatch,
+    p_effs: Any,
+    order_sizes: Any,
+    dispute_risks: Any,
+    evidence_conflicts: Any,
+    decision_to_exec_sec: Any,
+    time_to_resolution_days: Any,
+    fee: float,
+) -> List[int]:
+    """Indices whose YES or NO EV clears EV_MIN (vectorized _decide_kernel).
+
+    Same element-wise operations in the same order as the kernel, so the
+    screen agrees with it exactly.
+    """
+    p_eff = np.asarray(p_effs, dtype=np.float64)
+    size = np.asarray(order_sizes, dtype=np.float64)
+    dispute = 0.01 + 0.02 * np.asarray(dispute_risks, dtype=np.float64)
+    dispute = np.where(np.asarray(evidence_conflicts, dtype=bool), dispute * 1.5, dispute)
+    latency = np.maximum(0.0, np.asarray(decision_to_exec_sec, dtype=np.float64) - 2) * 0.001
+    time_val = np.minimum(0.02, np.asarray(time_to_resolution_days, dtype=np.float64) * 0.0002)
+
+    spread_yes = 0.5 * np.maximum(0.0, batch.ask_yes - batch.bid_yes)
+    spread_no = 0.5 * np.maximum(0.0, batch.ask_no - batch.bid_no)
+    slippage_yes = np.maximum(0.005, size / np.maximum(batch.depth_yes, 1.0) * 0.02)
+    slippage_no = np.maximum(0.005, size / np.maximum(batch.depth_no, 1.0) * 0.02)
+
+    edge_yes = spread_yes + fee + slippage_yes + dispute + latency + time_val
+    edge_no = spread_no + fee + slippage_no + dispute + latency + time_val
+    ev_yes = p_eff * 1.0 - batch.ask_yes - edge_yes
+    ev_no = (1.0 - p_eff) * 1.0 - batch.ask_no - edge_no
+
+    trade = (ev_yes >= EV_MIN) | (ev_no >= EV_MIN)
+    return np.flatnonzero(trade).tolist()
+
+
+def make_decisions_batch(
+    market_ids: Sequence[str],
+    candidate_ids: Sequence[str],
+    p_effs: Any,
+    batch: SnapshotBatch,
+    order_sizes: Any,
+    dispute_risks: Union[float, Any] = 0.0,
+    evidence_conflicts: Union[bool, Any] = False,
+    decision_to_exec_sec: Union[float, Any] = 0.0,
+    time_to_resolution_days: Union[float, Any] = 30.0,
+    fee_rate_bps: float = 0.0,
+    is_paper: bool = True,
+    config: Optional[DecisionConfig] = None,
+) -> List[Dict[str, Any]]:
+    """Screen N candidates at once and return decisions for those that trade.
+
+    Per-row inputs are length-N sequences/arrays; the risk/latency/time
+    arguments may also be scalars applied to every row.  The friction + EV
+    math runs as whole-array NumPy operations, and only rows clearing
+    EV_MIN are run through the scalar kernel and hashed, yielding the same
+    dicts make_decision gives for those rows (in input order).  NO_TRADE
+    rows are omitted.  Without numpy every row goes through the scalar path.
+    ``config`` behaves as in make_decision.
+    """
+    n = len(batch)
+    if config is None:
+        fee = compute_fee_cost(fee_rate_bps, is_paper)
+    else:
+        fee, is_paper = config.fee_cost, config.is_paper
+
+    def _row(values: Any, i: int) -> Any:
+        # Per-row value as a plain Python scalar (numpy elements unwrapped)
+        v = values[i] if hasattr(values, "__len__") else values
+        return v.item() if hasattr(v, "item") else v
+
+    if np is not None:
+        rows = _screen_batch(
+            batch, p_effs, order_sizes, dispute_risks, evidence_conflicts,
+            decision_to_exec_sec, time_to_resolution_days, fee,
+        )
+    else:
+        rows = list(range(n))
+
+    cols = [
+        c.tolist() if np is not None else c
+        for c in (batch.bid_yes, batch.ask_yes, batch.bid_no, batch.ask_no,
+                  batch.depth_yes, batch.depth_no)
+    ]
+    decisions = []  # type: List[Dict[str, Any]]
+    for i in rows:
+        p_eff = _row(p_effs, i)
+        size = _row(order_sizes, i)
+        out = _decide_kernel(
+            cols[0][i], cols[1][i], cols[2][i], cols[3][i], cols[4][i], cols[5][i],
+            p_eff, size,
+            _row(dispute_risks, i),
+            bool(_row(evidence_conflicts, i)),
+            _row(decision_to_exec_sec, i),
+            _row(time_to_resolution_days, i),
+            fee,
+        )
+        if out[0] == _SIDE_NO_TRADE:
+            continue
+        decisions.append(_assemble_decision(
+            market_ids[i], candidate_ids[i], p_eff, size, is_paper, cols[1][i], *out,
+        ))
+    return decisions
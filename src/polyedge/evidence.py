@@ -7,16 +7,22 @@ Handles:
 - Bundle building with tier sorting, truncation, hashing
 - Conflict detection (§10.7)
 - TTL enforcement anchored on published_at_utc
+- Concurrent, rate-limited source fetching
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
+import operator
+import struct
+import time
 import unicodedata
+from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
 import aiohttp
 
@@ -63,12 +69,43 @@ class EvidenceItem:
         self.source_id = source_id
         self.url = url
         self.title = title
-        self.text = text
+        self._text = text
+        self._text_bytes = None  # type: Optional[bytes]
+        self._text_lower = None  # type: Optional[str]
         self.published_at_utc = published_at_utc
         self.reliability_tier = reliability_tier
         self.parser_name = parser_name
         self.parser_version = parser_version
 
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+        self._text_bytes = None
+        self._text_lower = None
+
+    @property
+    def text_bytes(self) -> bytes:
+        """UTF-8 encoding of ``text``, encoded once and reused (bundle byte
+        limit, bundle hash) until ``text`` is reassigned."""
+        if self._text_bytes is None:
+            self._text_bytes = self._text.encode("utf-8")
+        return self._text_bytes
+
+    @property
+    def text_byte_len(self) -> int:
+        return len(self.text_bytes)
+
+    @property
+    def text_lower(self) -> str:
+        """Lowercased ``text`` for keyword classifiers, computed once."""
+        if self._text_lower is None:
+            self._text_lower = self._text.lower()
+        return self._text_lower
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "source_id": self.source_id,
@@ -121,7 +158,8 @@ def is_thesis_required(
     if intended_size >= 0.005 * wallet_usd:
         return True
 
-    # Subjective text check
+    # Subjective text check: plain substring tests (so "unlikely" still hits
+    # "likely"); faster than a compiled IGNORECASE alternation on this text
     resolution_text = market.get("resolution_source", "").lower()
     for term in terms:
         if term in resolution_text:
@@ -191,6 +229,9 @@ def is_evidence_ttl_valid(
     return age <= effective_ttl
 
 
+_KEY0 = operator.itemgetter(0)
+
+
 def build_evidence_bundle(
     items: List[EvidenceItem],
     source_ttls: Optional[Dict[str, int]] = None,
@@ -206,22 +247,19 @@ def build_evidence_bundle(
     now = now_utc or datetime.now(timezone.utc)
     ttls = source_ttls or {}
 
-    # Filter by TTL
-    valid_items = []  # type: List[EvidenceItem]
+    # Filter by TTL, building each survivor's sort key in the same pass:
+    # tier ascending (1 first), then newest first, then source_id
+    keyed = []  # type: List[Tuple[Tuple[int, float, str], EvidenceItem]]
     for item in items:
         ttl = ttls.get(item.source_id, 3600)  # default 1h TTL
         if is_evidence_ttl_valid(item, ttl, now_utc=now):
-            valid_items.append(item)
-
-    # Sort: tier ascending (1 first), then newest first, then source_id
-    def sort_key(item: EvidenceItem) -> Tuple[int, float, str]:
-        ts = item.published_at_utc.timestamp() if item.published_at_utc else 0
-        return (item.reliability_tier, -ts, item.source_id)
+            ts = item.published_at_utc.timestamp() if item.published_at_utc else 0
+            keyed.append(((item.reliability_tier, -ts, item.source_id), item))
 
-    valid_items.sort(key=sort_key)
+    keyed.sort(key=_KEY0)  # stable; never falls through to comparing items
 
     # Take top MAX_EVIDENCE_ITEMS
-    selected = valid_items[:MAX_EVIDENCE_ITEMS]
+    selected = [item for _, item in keyed[:MAX_EVIDENCE_ITEMS]]
 
     # Enforce byte and char limits with deterministic truncation
     total_chars = 0
@@ -230,7 +268,7 @@ def build_evidence_bundle(
 
     for item in selected:
         text_chars = len(item.text)
-        text_bytes = len(item.text.encode("utf-8"))
+        text_bytes = item.text_byte_len
 
         if total_chars + text_chars > MAX_EVIDENCE_TEXT_CHARS_TOTAL:
             remaining_chars = MAX_EVIDENCE_TEXT_CHARS_TOTAL - total_chars
@@ -252,14 +290,56 @@ def build_evidence_bundle(
     return final, bundle_hash
 
 
+# Canonical bundle-hash layout (v2).  v1 hashed json.dumps of every item's
+# to_dict(); v2 streams each field straight into SHA-256, length-prefixed.
+BUNDLE_HASH_CANONICAL_VERSION = 2
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_NONE_FIELD = _U32.pack(0xFFFFFFFF)  # distinct from any length, incl. 0
+
+
+def _hash_field(h: Any, value: Optional[str]) -> None:
+    if value is None:
+        h.update(_NONE_FIELD)
+        return
+    _hash_bytes(h, value.encode("utf-8"))
+
+
+def _hash_bytes(h: Any, data: bytes) -> None:
+    h.update(_U32.pack(len(data)))
+    h.update(data)
+
+
 def compute_bundle_hash(items: List[EvidenceItem]) -> str:
-    """SHA-256 hash of the canonical evidence bundle."""
-    canonical = json.dumps(
-        [item.to_dict() for item in items],
-        sort_keys=True,
-        separators=(",", ":"),
-    )
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    """SHA-256 hash of the canonical evidence bundle.
+
+    Items are hashed in bundle order (build_evidence_bundle's tier/recency
+    order) without building a JSON document: each field is fed to the hash
+    with a 4-byte length prefix, so evidence text containing any byte
+    sequence cannot shift field boundaries.
+    """
+    h = hashlib.sha256(_U32.pack(BUNDLE_HASH_CANONICAL_VERSION))
+    h.update(_U32.pack(len(items)))
+    for item in items:
+        _hash_field(h, item.source_id)
+        _hash_field(h, item.url)
+        _hash_field(h, item.title)
+        _hash_bytes(h, item.text_bytes)
+        _hash_field(
+            h, item.published_at_utc.isoformat() if item.published_at_utc else None,
+        )
+        h.update(_I32.pack(item.reliability_tier))
+        _hash_field(h, item.parser_name)
+        _hash_field(h, item.parser_version)
+    return h.hexdigest()
+
+
+# Conflict keywords, matched as substrings of the lowercased text.  Each
+# `in` test is a C-level fast search (~1 GB/s); a combined regex or
+# Aho-Corasick pass measured slower on 40KB bundles, since common words
+# such as "will" match often.
+_YES_SIGNALS = ("will", "yes", "likely", "confirms", "approved", "passed")
+_NO_SIGNALS = ("won't", "no", "unlikely", "denied", "rejected", "failed")
 
 
 def detect_conflict(items: List[EvidenceItem]) -> Tuple[bool, Optional[str]]:
@@ -278,16 +358,13 @@ def detect_conflict(items: List[EvidenceItem]) -> Tuple[bool, Optional[str]]:
 
     # Simple keyword-based conflict detection
     # (In production this would use more sophisticated NLP)
-    yes_signals = {"will", "yes", "likely", "confirms", "approved", "passed"}
-    no_signals = {"won't", "no", "unlikely", "denied", "rejected", "failed"}
-
     yes_count = 0
     no_count = 0
 
     for item in high_tier:
-        text_lower = item.text.lower()
-        yes_hits = sum(1 for w in yes_signals if w in text_lower)
-        no_hits = sum(1 for w in no_signals if w in text_lower)
+        text_lower = item.text_lower
+        yes_hits = sum(1 for w in _YES_SIGNALS if w in text_lower)
+        no_hits = sum(1 for w in _NO_SIGNALS if w in text_lower)
 
         if yes_hits > no_hits:
             yes_count += 1
@@ -333,15 +410,121 @@ class EvidenceFetchRateLimiter:
     """Rate limit evidence fetches per spec §3.5."""
 
     def __init__(self) -> None:
-        self._timestamps = []  # type: List[float]
-
-    def can_fetch(self) -> bool:
-        import time
-        now = time.time()
-        cutoff = now - 3600  # 1 hour
-        self._timestamps = [t for t in self._timestamps if t > cutoff]
-        return len(self._timestamps) < EVIDENCE_FETCHES_PER_HOUR_MAX
-
-    def record_fetch(self) -> None:
-        import time
-        self._timestamps.append(time.time())
+        # Monotonic fetch times in arrival order, so expired ones sit at the left
+        self._timestamps = deque()  # type: Deque[float]
+
+    def can_fetch(self, now_mono: Optional[float] = None) -> bool:
+        """True if another fetch fits in the rolling hour.
+
+        ``now_mono`` lets burst callers share one time.monotonic() reading.
+        """
+        if now_mono is None:
+            now_mono = time.monotonic()
+        cutoff = now_mono - 3600  # 1 hour
+        timestamps = self._timestamps
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+        return len(timestamps) < EVIDENCE_FETCHES_PER_HOUR_MAX
+
+    def record_fetch(self, now_mono: Optional[float] = None) -> None:
+        self._timestamps.append(time.monotonic() if now_mono is None else now_mono)
+
+
+# Source fetching: one shared session, bounded concurrency, short timeouts
+EVIDENCE_FETCH_CONCURRENCY = 8
+EVIDENCE_FETCH_TIMEOUT_SEC = 5
+EVIDENCE_FETCH_RETRIES = 2  # retries after the first attempt
+EVIDENCE_FETCH_BACKOFF_SEC = 0.5  # doubled per retry
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# (source registry entry, url) -> EvidenceItem, or None if unparseable
+EvidenceParser = Callable[[Dict[str, Any], str, bytes], Optional[EvidenceItem]]
+
+
+def make_evidence_session() -> aiohttp.ClientSession:
+    """A session for evidence fetches; share one across bundles so
+    connections are pooled (at most EVIDENCE_FETCH_CONCURRENCY per host)."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=EVIDENCE_FETCH_CONCURRENCY),
+        timeout=aiohttp.ClientTimeout(total=EVIDENCE_FETCH_TIMEOUT_SEC),
+    )
+
+
+async def _fetch_with_backoff(
+    session: aiohttp.ClientSession,
+    url: str,
+    sem: asyncio.Semaphore,
+) -> Optional[bytes]:
+    """GET ``url``, retrying 429/5xx and transport errors with exponential
+    backoff.  Returns the body, or None once retries are exhausted.
+
+    ``sem`` is held per attempt only, so a source backing off does not
+    keep a concurrency slot while it sleeps.
+    """
+    for attempt in range(EVIDENCE_FETCH_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(EVIDENCE_FETCH_BACKOFF_SEC * (2 ** (attempt - 1)))
+        try:
+            async with sem, session.get(url) as resp:
+                if resp.status == 200:
+                    return await resp.read()
+                if resp.status not in _RETRY_STATUSES:
+                    logger.warning("Evidence fetch %s failed: HTTP %d", url, resp.status)
+                    return None
+                logger.debug("Evidence fetch %s: HTTP %d, retrying", url, resp.status)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug("Evidence fetch %s: %s, retrying", url, e)
+    logger.warning("Evidence fetch %s failed after %d attempts", url, EVIDENCE_FETCH_RETRIES + 1)
+    return None
+
+
+async def fetch_evidence(
+    session: aiohttp.ClientSession,
+    targets: Sequence[Tuple[Dict[str, Any], str]],
+    parse: EvidenceParser,
+    rate_limiter: Optional[EvidenceFetchRateLimiter] = None,
+    max_concurrent: int = EVIDENCE_FETCH_CONCURRENCY,
+) -> List[EvidenceItem]:
+    """Fetch and parse (source, url) targets concurrently.
+
+    At most ``max_concurrent`` requests are in flight, so a bundle costs
+    roughly one round trip rather than one per source.  Targets beyond the
+    rate limiter's hourly budget are skipped; failed fetches and
+    unparseable bodies (``parse`` returning None or raising) are dropped.
+    Items are returned in target order.
+    """
+    sem = asyncio.Semaphore(max_concurrent)
+
+    async def _one(source: Dict[str, Any], url: str) -> Optional[EvidenceItem]:
+        body = await _fetch_with_backoff(session, url, sem)
+        if body is None:
+            return None
+        try:
+            return parse(source, url, body)
+        except Exception as e:
+            logger.warning("Evidence parse %s failed: %s", url, e)
+            return None
+
+    allowed = []  # type: List[Tuple[Dict[str, Any], str]]
+    for source, url in targets:
+        if rate_limiter is not None:
+            if not rate_limiter.can_fetch():
+                logger.warning("Evidence fetch budget exhausted; skipping %s", url)
+                continue
+            rate_limiter.record_fetch()
+        allowed.append((source, url))
+
+    results = await asyncio.gather(*(_one(source, url) for source, url in allowed))
+    return [item for item in results if item is not None]
+
+
+async def fetch_evidence_bundle(
+    session: aiohttp.ClientSession,
+    targets: Sequence[Tuple[Dict[str, Any], str]],
+    parse: EvidenceParser,
+    rate_limiter: Optional[EvidenceFetchRateLimiter] = None,
+    source_ttls: Optional[Dict[str, int]] = None,
+) -> Tuple[List[EvidenceItem], str]:
+    """fetch_evidence then build_evidence_bundle; returns (items, bundle_hash)."""
+    items = await fetch_evidence(session, targets, parse, rate_limiter=rate_limiter)
+    return build_evidence_bundle(items, source_ttls=source_ttls)
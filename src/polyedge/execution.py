@@ -28,6 +28,84 @@ class ExecutionDisabledError(Exception):
     """Raised when execution is attempted in a disabled mode."""
 
 
+class PaperOrder:
+    """A PAPER order.
+
+    Slotted rather than a dict: one is held per order and its fields are
+    read for every book update on its market.
+    """
+
+    __slots__ = (
+        "client_order_id", "market_id", "side", "size_usd", "limit_price",
+        "decision_id_hex", "status", "submitted_at", "fills",
+    )
+
+    def __init__(
+        self,
+        client_order_id: str,
+        market_id: str,
+        side: str,
+        size_usd: float,
+        limit_price: float,
+        decision_id_hex: str,
+        submitted_at: float,
+        status: str = "OPEN",
+    ) -> None:
+        self.client_order_id = client_order_id
+        self.market_id = market_id
+        self.side = side
+        self.size_usd = size_usd
+        self.limit_price = limit_price
+        self.decision_id_hex = decision_id_hex
+        self.status = status
+        self.submitted_at = submitted_at
+        self.fills = []  # type: List[PaperFill]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form for serialisation (WAL payloads, logs)."""
+        return {
+            "client_order_id": self.client_order_id,
+            "market_id": self.market_id,
+            "side": self.side,
+            "size_usd": self.size_usd,
+            "limit_price": self.limit_price,
+            "decision_id_hex": self.decision_id_hex,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "fills": [f.to_dict() for f in self.fills],
+        }
+
+
+class PaperFill:
+    """A simulated PAPER fill (pessimistic: at the order's limit price)."""
+
+    __slots__ = ("order_id", "fill_price", "fill_time", "through_price", "fee_usd")
+
+    def __init__(
+        self,
+        order_id: str,
+        fill_price: float,
+        fill_time: float,
+        through_price: float,
+        fee_usd: float = 0.0,
+    ) -> None:
+        self.order_id = order_id
+        self.fill_price = fill_price
+        self.fill_time = fill_time
+        self.through_price = through_price
+        self.fee_usd = fee_usd
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form for serialisation (WAL payloads, logs)."""
+        return {
+            "order_id": self.order_id,
+            "fill_price": self.fill_price,
+            "fill_time": self.fill_time,
+            "through_price": self.through_price,
+            "fee_usd": self.fee_usd,
+        }
+
+
 class PaperFillTracker:
     """Track potential fills for PAPER mode pessimistic fill logic.
 
@@ -39,7 +117,8 @@ class PaperFillTracker:
     SUSTAIN_SEC = 3.0
 
     def __init__(self) -> None:
-        self._pending = {}  # type: Dict[str, Dict[str, Any]]
+        # order_id -> (first_through_at, through_price)
+        self._pending = {}  # type: Dict[str, Tuple[float, float]]
 
     def check_fill(
         self,
@@ -47,10 +126,13 @@ class PaperFillTracker:
         side: str,
         limit_price: float,
         current_price: float,
-    ) -> Optional[Dict[str, Any]]:
+        now: Optional[float] = None,
+    ) -> Optional[PaperFill]:
         """Check if a pending order should be paper-filled.
 
-        Returns fill dict if fill occurs, None otherwise.
+        ``now`` (epoch seconds) lets a caller checking many orders against
+        one book update read the clock once; defaults to time.time().
+        Returns a PaperFill if a fill occurs, None otherwise.
         """
         through = False
         if side == "YES":
@@ -63,38 +145,45 @@ class PaperFillTracker:
         key = order_id
 
         if through:
-            if key not in self._pending:
-                self._pending[key] = {
-                    "first_through_at": time.time(),
-                    "through_price": current_price,
-                }
+            if now is None:
+                now = time.time()
+            entry = self._pending.get(key)
+            if entry is None:
+                entry = self._pending[key] = (now, current_price)
 
-            entry = self._pending[key]
-            elapsed = time.time() - entry["first_through_at"]
+            first_through_at, through_price = entry
+            elapsed = now - first_through_at
 
             if elapsed >= self.SUSTAIN_SEC:
                 # Fill confirmed
                 self._pending.pop(key, None)
-                return {
-                    "order_id": order_id,
-                    "fill_price": limit_price,  # Pessimistic: fill at limit
-                    "fill_time": time.time(),
-                    "through_price": entry["through_price"],
-                }
+                return PaperFill(
+                    order_id,
+                    limit_price,  # Pessimistic: fill at limit
+                    now,
+                    through_price,
+                )
         else:
             # Price pulled back above limit: reset
             self._pending.pop(key, None)
 
         return None
 
+    def discard(self, order_id: str) -> None:
+        """Forget any trade-through in progress for a closed order."""
+        self._pending.pop(order_id, None)
+
 
 class PaperExecutionEngine:
     """PAPER execution engine (spec §17.3)."""
 
     def __init__(self) -> None:
         self._fill_tracker = PaperFillTracker()
-        self._orders = {}  # type: Dict[str, Dict[str, Any]]
-        self._fills = []  # type: List[Dict[str, Any]]
+        self._orders = {}  # type: Dict[str, PaperOrder]
+        # OPEN orders only, per market (submission order), so a book update
+        # touches just that market's live orders instead of every order ever
+        self._open_by_market = {}  # type: Dict[str, Dict[str, PaperOrder]]
+        self._fills = []  # type: List[PaperFill]
         self._total_fees_usd = 0.0
 
     def submit_order(
@@ -105,21 +194,16 @@ class PaperExecutionEngine:
         size_usd: float,
         limit_price: float,
         decision_id_hex: str,
-    ) -> Dict[str, Any]:
+    ) -> PaperOrder:
         """Submit a PAPER order."""
-        order = {
-            "client_order_id": client_order_id,
-            "market_id": market_id,
-            "side": side,
-            "size_usd": size_usd,
-            "limit_price": limit_price,
-            "decision_id_hex": decision_id_hex,
-            "status": "OPEN",
-            "submitted_at": time.time(),
-            "fills": [],
-        }
+        order = PaperOrder(
+            client_order_id, market_id, side, size_usd, limit_price,
+            decision_id_hex, time.time(),
+        )
 
+        self._close(client_order_id)  # resubmitted id replaces the old order
         self._orders[client_order_id] = order
+        self._open_by_market.setdefault(market_id, {})[client_order_id] = order
         logger.info(
             "PAPER order submitted: id=%s market=%s side=%s size=%.2f price=%.4f",
             client_order_id, market_id, side, size_usd, limit_price,
@@ -131,59 +215,79 @@ class PaperExecutionEngine:
         market_id: str,
         best_ask: float,
         best_bid: float,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[PaperFill]:
         """Process a book update; check for PAPER fills.
 
         Returns list of fills that occurred.
         """
-        new_fills = []  # type: List[Dict[str, Any]]
+        new_fills = []  # type: List[PaperFill]
 
-        for order_id, order in list(self._orders.items()):
-            if order["market_id"] != market_id or order["status"] != "OPEN":
-                continue
+        open_orders = self._open_by_market.get(market_id)
+        if not open_orders:
+            return new_fills
+        now = time.time()  # one clock read per update, shared by its orders
+        filled = []  # type: List[str]
 
+        # Iterate the live index directly; fills are closed after the loop
+        for order_id, order in open_orders.items():
             current_price = best_ask  # Use ask for buys
 
             fill = self._fill_tracker.check_fill(
-                order_id, order["side"], order["limit_price"], current_price,
+                order_id, order.side, order.limit_price, current_price, now=now,
             )
 
             if fill:
                 # Apply pessimistic fees
                 fee_bps = max(PAPER_MIN_FEE_BPS, 0) * PAPER_FEE_MULTIPLIER
-                fee_usd = order["size_usd"] * (fee_bps / 10000.0)
-                fill["fee_usd"] = fee_usd
+                fee_usd = order.size_usd * (fee_bps / 10000.0)
+                fill.fee_usd = fee_usd
 
-                order["fills"].append(fill)
-                order["status"] = "FILLED"
+                order.fills.append(fill)
+                order.status = "FILLED"
+                filled.append(order_id)
                 self._fills.append(fill)
                 self._total_fees_usd += fee_usd
                 new_fills.append(fill)
 
                 logger.info(
                     "PAPER fill: order=%s price=%.4f fee=%.4f",
-                    order_id, fill["fill_price"], fee_usd,
+                    order_id, fill.fill_price, fee_usd,
                 )
 
+        for order_id in filled:
+            self._close(order_id)
         return new_fills
 
     def cancel_order(self, client_order_id: str) -> bool:
         """Cancel a PAPER order."""
         order = self._orders.get(client_order_id)
-        if order and order["status"] == "OPEN":
-            order["status"] = "CANCELLED"
+        if order and order.status == "OPEN":
+            order.status = "CANCELLED"
+            self._close(client_order_id)
             return True
         return False
 
+    def _close(self, client_order_id: str) -> None:
+        """Drop an order from the open-order index and the fill tracker."""
+        order = self._orders.get(client_order_id)
+        if order is None:
+            return
+        open_orders = self._open_by_market.get(order.market_id)
+        if open_orders is not None:
+            open_orders.pop(client_order_id, None)
+            if not open_orders:
+                del self._open_by_market[order.market_id]
+        self._fill_tracker.discard(client_order_id)
+
     @property
-    def open_orders(self) -> List[Dict[str, Any]]:
-        return [o for o in self._orders.values() if o["status"] == "OPEN"]
+    def open_orders(self) -> List[PaperOrder]:
+        return [o for o in self._orders.values() if o.status == "OPEN"]
 
     @property
     def stats(self) -> Dict[str, Any]:
         return {
             "total_orders": len(self._orders),
-            "open_orders": len(self.open_orders),
+            "open_orders": sum(len(m) for m in self._open_by_market.values()),
             "total_fills": len(self._fills),
             "total_fees_usd": self._total_fees_usd,
         }
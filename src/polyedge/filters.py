@@ -7,12 +7,12 @@ is immediately marked FILTERED with the first failing reason.
 
 from __future__ import annotations
 
+import functools
 import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from polyedge.constants import (
-    BOOK_LEVELS_REQUIRED,
     CANDIDATE_MAX_AGE_SEC,
     MAX_SPREAD_ABS,
     MIN_DEPTH_USD_NEAR_TOP,
@@ -141,21 +141,13 @@ def filter_spread(snapshot: Any) -> Optional[str]:
 def filter_depth(snapshot: Any) -> Optional[str]:
     """Reject if depth_top_levels < MIN_DEPTH_USD_NEAR_TOP on either side.
 
-    Sum size_usd of top BOOK_LEVELS_REQUIRED bids for each token.
+    Sum size_usd of top BOOK_LEVELS_REQUIRED bids for each token; the
+    Snapshot pre-sums these once when it is built.
     """
-    depth_yes = getattr(snapshot, "depth_yes", None) or []
-    depth_no = getattr(snapshot, "depth_no", None) or []
-
-    # Sum depth of top levels
-    yes_depth = sum(
-        level[1] for level in depth_yes[:BOOK_LEVELS_REQUIRED]
-    ) if depth_yes else 0
-
-    no_depth = sum(
-        level[1] for level in depth_no[:BOOK_LEVELS_REQUIRED]
-    ) if depth_no else 0
-
-    if yes_depth < MIN_DEPTH_USD_NEAR_TOP or no_depth < MIN_DEPTH_USD_NEAR_TOP:
+    if (
+        snapshot.top3_depth_yes < MIN_DEPTH_USD_NEAR_TOP
+        or snapshot.top3_depth_no < MIN_DEPTH_USD_NEAR_TOP
+    ):
         return REASON_DEPTH_TOO_THIN
 
     return None
@@ -175,6 +167,19 @@ def filter_ws_health(
     return None
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_utc(value: str) -> Optional[datetime]:
+    """ISO-8601 string (``Z`` suffix allowed) as a datetime; None if invalid.
+
+    Cached: a market's end_date_utc string is re-parsed for every one of
+    its candidates otherwise.
+    """
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+
+
 def run_all_filters(
     candidate: Dict[str, Any],
     market: Dict[str, Any],
@@ -186,56 +191,70 @@ def run_all_filters(
 
     Returns (passed, reason_code_if_failed).
     Fails on the first failing filter.
+
+    The filter_* predicates are fused inline here (same checks, same
+    order), reading the clock once and each field once; the standalone
+    functions above remain the per-filter reference.
     """
+    now = now_utc or datetime.now(timezone.utc)
+
     # 1. Candidate age
-    reason = filter_candidate_age(candidate, now_utc)
-    if reason:
-        return False, reason
+    created = candidate.get("created_at_utc")
+    if isinstance(created, str):
+        created = _parse_utc(created)
+    if created is None or (now - created).total_seconds() > CANDIDATE_MAX_AGE_SEC:
+        return False, REASON_CANDIDATE_EXPIRED
 
     # 2. Market eligible
-    reason = filter_market_eligible(market)
-    if reason:
-        return False, reason
+    if not market.get("is_binary_eligible", False):
+        return False, REASON_MARKET_NOT_ELIGIBLE
 
     # 3. Time to resolution
-    reason = filter_time_to_resolution(market, now_utc)
-    if reason:
-        return False, reason
+    end_date = market.get("end_date_utc")
+    if isinstance(end_date, str):
+        end_date = _parse_utc(end_date)
+    if end_date is None:
+        return False, REASON_TIME_TO_RESOLUTION_OUT_OF_RANGE
+    remaining = (end_date - now).total_seconds()
+    if remaining < TIME_TO_RESOLUTION_MIN_SEC or remaining > TIME_TO_RESOLUTION_MAX_SEC:
+        return False, REASON_TIME_TO_RESOLUTION_OUT_OF_RANGE
 
     # 4. Volume
-    reason = filter_volume(market)
-    if reason:
-        return False, reason
+    if (market.get("volume_24h_usd", 0) or 0) < MIN_VOLUME_24H_USD:
+        return False, REASON_VOLUME_TOO_LOW
 
     # 5. Liquidity
-    reason = filter_liquidity(market)
-    if reason:
-        return False, reason
+    if (market.get("liquidity_usd", 0) or 0) < MIN_LIQUIDITY_USD:
+        return False, REASON_LIQUIDITY_TOO_LOW
 
     # 6. Invalid book anomaly
-    reason = filter_invalid_book(snapshot)
-    if reason:
-        return False, reason
+    if getattr(snapshot, "invalid_book_anomaly", True):
+        return False, REASON_SNAPSHOT_INVALID_BOOK
 
     # 7. Ask sum anomaly
-    reason = filter_ask_sum_anomaly(snapshot)
-    if reason:
-        return False, reason
+    if getattr(snapshot, "ask_sum_anomaly", True):
+        return False, REASON_SNAPSHOT_ASK_SUM_ANOMALY
 
     # 8. Spread
-    reason = filter_spread(snapshot)
-    if reason:
-        return False, reason
+    bid_yes = getattr(snapshot, "best_bid_yes", None)
+    ask_yes = getattr(snapshot, "best_ask_yes", None)
+    if bid_yes is not None and ask_yes is not None and ask_yes - bid_yes > MAX_SPREAD_ABS:
+        return False, REASON_SPREAD_TOO_WIDE
+    bid_no = getattr(snapshot, "best_bid_no", None)
+    ask_no = getattr(snapshot, "best_ask_no", None)
+    if bid_no is not None and ask_no is not None and ask_no - bid_no > MAX_SPREAD_ABS:
+        return False, REASON_SPREAD_TOO_WIDE
 
-    # 9. Depth
-    reason = filter_depth(snapshot)
-    if reason:
-        return False, reason
+    # 9. Depth (top BOOK_LEVELS_REQUIRED levels, pre-summed on the Snapshot)
+    if (
+        snapshot.top3_depth_yes < MIN_DEPTH_USD_NEAR_TOP
+        or snapshot.top3_depth_no < MIN_DEPTH_USD_NEAR_TOP
+    ):
+        return False, REASON_DEPTH_TOO_THIN
 
     # 10. WS health (only if ws_state provided)
     if ws_state is not None:
-        market_id = candidate.get("market_id", "")
-        reason = filter_ws_health(market_id, snapshot, ws_state)
+        reason = filter_ws_health(candidate.get("market_id", ""), snapshot, ws_state)
         if reason:
             return False, reason
 
@@ -29,6 +29,17 @@ REASON_INJECTION_DETECTED = "INJECTION_DETECTED"
 MIN_INJECTION_VERSION = "1.0.0"
 
 
+def _parse_version(version: str) -> Optional[Tuple[int, ...]]:
+    """Semver-like "1.2.3" as (1, 2, 3); None if malformed."""
+    try:
+        return tuple(int(x) for x in version.split("."))
+    except (ValueError, AttributeError):
+        return None
+
+
+_MIN_VERSION_PARSED = _parse_version(MIN_INJECTION_VERSION)
+
+
 class InjectionPattern:
     """A single injection detection pattern."""
 
@@ -54,6 +65,7 @@ class InjectionDefence:
     def __init__(self, patterns_path: Optional[str] = None) -> None:
         self.patterns = []  # type: List[InjectionPattern]
         self.version = "0.0.0"
+        self.parsed_version = None  # type: Optional[Tuple[int, ...]]
         self.valid = False
 
         if patterns_path:
@@ -76,9 +88,10 @@ class InjectionDefence:
             return
 
         self.version = data.get("pattern_set_version", "0.0.0")
+        self.parsed_version = _parse_version(self.version)
 
-        # Check minimum version
-        if not self._version_gte(self.version, MIN_INJECTION_VERSION):
+        # Check minimum version (minimum is parsed once at import)
+        if self.parsed_version is None or self.parsed_version < _MIN_VERSION_PARSED:
             logger.error(
                 "Injection pattern version %s < minimum %s",
                 self.version, MIN_INJECTION_VERSION,
@@ -106,12 +119,9 @@ class InjectionDefence:
     @staticmethod
     def _version_gte(v1: str, v2: str) -> bool:
         """Compare semver-like versions. Returns True if v1 >= v2."""
-        try:
-            parts1 = [int(x) for x in v1.split(".")]
-            parts2 = [int(x) for x in v2.split(".")]
-            return parts1 >= parts2
-        except (ValueError, AttributeError):
-            return False
+        parts1 = _parse_version(v1)
+        parts2 = _parse_version(v2)
+        return parts1 is not None and parts2 is not None and parts1 >= parts2
 
     def scan(self, text: str) -> List[Dict[str, Any]]:
         """Scan text for injection patterns.
@@ -30,21 +30,26 @@ class MarketLock:
         market_id: str,
         owner_instance_id: str,
         owner_worker_id: str,
+        now: Optional[float] = None,
     ) -> None:
+        if now is None:
+            now = time.time()
         self.market_id = market_id
         self.owner_instance_id = owner_instance_id
         self.owner_worker_id = owner_worker_id
         self.lock_version = 1
-        self.owner_heartbeat = time.time()
-        self.expires_at = time.time() + LOCK_TTL_SEC
-        self.last_renewed = time.time()
+        self.owner_heartbeat = now
+        self.expires_at = now + LOCK_TTL_SEC
+        self.last_renewed = now
 
-    def is_expired(self) -> bool:
-        return time.time() > self.expires_at
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) > self.expires_at
 
-    def is_stealable(self) -> bool:
+    def is_stealable(self, now: Optional[float] = None) -> bool:
         """Can be stolen if expired + grace period passed."""
-        return time.time() > self.expires_at + LOCK_STEAL_GRACE_AFTER_EXPIRY_SEC
+        if now is None:
+            now = time.time()
+        return now > self.expires_at + LOCK_STEAL_GRACE_AFTER_EXPIRY_SEC
 
 
 class LockManager:
@@ -53,6 +58,10 @@ class LockManager:
     def __init__(self, instance_id: str) -> None:
         self.instance_id = instance_id
         self._locks = {}  # type: Dict[str, MarketLock]
+        # held_locks view, rebuilt only after a lock changes or once the
+        # earliest expiry among the held locks has passed
+        self._held = None  # type: Optional[Dict[str, int]]
+        self._held_valid_until = 0.0
 
     def acquire(
         self,
@@ -63,20 +72,23 @@ class LockManager:
 
         Returns (success, lock_version).
         """
+        now = time.time()  # one clock read per call
         existing = self._locks.get(market_id)
 
         if existing is None:
             # No lock exists → acquire
-            lock = MarketLock(market_id, self.instance_id, worker_id)
+            lock = MarketLock(market_id, self.instance_id, worker_id, now=now)
             self._locks[market_id] = lock
+            self._held = None
             logger.debug("Lock acquired: market=%s worker=%s version=%d", market_id, worker_id, lock.lock_version)
             return True, lock.lock_version
 
-        if existing.is_stealable():
+        if existing.is_stealable(now):
             # Expired + grace → steal
-            lock = MarketLock(market_id, self.instance_id, worker_id)
+            lock = MarketLock(market_id, self.instance_id, worker_id, now=now)
             lock.lock_version = existing.lock_version + 1
             self._locks[market_id] = lock
+            self._held = None
             logger.warning(
                 "Lock stolen: market=%s from=%s by=%s version=%d",
                 market_id, existing.owner_worker_id, worker_id, lock.lock_version,
@@ -100,10 +112,12 @@ class LockManager:
         if lock.owner_instance_id != self.instance_id or lock.owner_worker_id != worker_id:
             return False
 
-        lock.owner_heartbeat = time.time()
-        lock.expires_at = time.time() + LOCK_TTL_SEC
-        lock.last_renewed = time.time()
+        now = time.time()
+        lock.owner_heartbeat = now
+        lock.expires_at = now + LOCK_TTL_SEC
+        lock.last_renewed = now
         lock.lock_version += 1
+        self._held = None
 
         return True
 
@@ -117,6 +131,7 @@ class LockManager:
             return False
 
         del self._locks[market_id]
+        self._held = None
         return True
 
     def validate_for_submit(
@@ -157,4 +172,14 @@ class LockManager:
     @property
     def held_locks(self) -> Dict[str, int]:
         """Map of market_id → lock_version for held locks."""
-        return {mid: l.lock_version for mid, l in self._locks.items() if not l.is_expired()}
+        now = time.time()
+        if self._held is None or now > self._held_valid_until:
+            held = {}  # type: Dict[str, int]
+            valid_until = float("inf")
+            for mid, lock in self._locks.items():
+                if not lock.is_expired(now):
+                    held[mid] = lock.lock_version
+                    valid_until = min(valid_until, lock.expires_at)
+            self._held = held
+            self._held_valid_until = valid_until
+        return dict(self._held)
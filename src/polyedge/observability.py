@@ -11,7 +11,8 @@ from __future__ import annotations
 import json
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -53,11 +54,17 @@ NO_TRADE_REASONS = frozenset({
 })
 
 
+# Events kept in memory for recent_events; older ones are only counted
+RECENT_EVENTS_MAX = 100
+
+
 class EventLog:
     """Canonical event log."""
 
     def __init__(self) -> None:
-        self._events = []  # type: List[Dict[str, Any]]
+        # Ring buffer: memory stays bounded however long the daemon runs
+        self._events = deque(maxlen=RECENT_EVENTS_MAX)  # type: Deque[Dict[str, Any]]
+        self._total_events = 0
         self._no_trade_counts = {}  # type: Dict[str, int]
 
     def log_event(
@@ -78,6 +85,7 @@ class EventLog:
             "details": details or {},
         }
         self._events.append(event)
+        self._total_events += 1
 
         if reason_code and reason_code in NO_TRADE_REASONS:
             self._no_trade_counts[reason_code] = self._no_trade_counts.get(reason_code, 0) + 1
@@ -94,13 +102,13 @@ class EventLog:
 
     @property
     def recent_events(self) -> List[Dict[str, Any]]:
-        """Last 100 events."""
-        return self._events[-100:]
+        """Last RECENT_EVENTS_MAX (100) events, oldest first."""
+        return list(self._events)
 
     @property
     def stats(self) -> Dict[str, Any]:
         return {
-            "total_events": len(self._events),
+            "total_events": self._total_events,
             "no_trade_breakdown": self.no_trade_stats,
             "unique_reasons": len(self._no_trade_counts),
         }
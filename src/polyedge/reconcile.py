@@ -11,7 +11,12 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:  # optional: vectorized notional diff for large portfolios
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None
 
 from polyedge.constants import (
     MIN_RECONCILE_THRESHOLD_USD,
@@ -45,13 +50,14 @@ class Mismatch:
         remote_value: Any,
         delta_abs: float,
         level: int,
+        timestamp: Optional[float] = None,
     ) -> None:
         self.field = field
         self.local_value = local_value
         self.remote_value = remote_value
         self.delta_abs = delta_abs
         self.level = level
-        self.timestamp = time.time()
+        self.timestamp = time.time() if timestamp is None else timestamp
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -64,79 +70,114 @@ class Mismatch:
         }
 
 
-def classify_mismatch(delta_abs: float, wallet_usd: float) -> int:
-    """Classify a mismatch based on delta relative to wallet."""
+def level_thresholds(wallet_usd: float) -> Tuple[float, float]:
+    """Absolute USD deltas at which a mismatch becomes Level-2 and Level-3.
+
+    A non-positive wallet makes every mismatch Level-3.
+    """
     if wallet_usd <= 0:
-        return LEVEL_3
+        return float("-inf"), float("-inf")
+    return wallet_usd * LEVEL_1_THRESHOLD_PCT, wallet_usd * LEVEL_2_THRESHOLD_PCT
+
+
+def classify_mismatch(delta_abs: float, wallet_usd: float) -> int:
+    """Classify a mismatch based on delta relative to wallet.
+
+    Compares against absolute thresholds (see level_thresholds) rather
+    than dividing by the wallet.
+    """
+    t2, t3 = level_thresholds(wallet_usd)
+    # `not <` rather than `>=`, so a NaN delta stays Level-3
+    return LEVEL_1 + (not delta_abs < t2) + (not delta_abs < t3)
+
 
-    ratio = delta_abs / wallet_usd
+# Below this many two-sided positions the plain loop beats building arrays
+_VECTOR_MIN_POSITIONS = 64
 
-    if ratio < LEVEL_1_THRESHOLD_PCT:
-        return LEVEL_1
-    elif ratio < LEVEL_2_THRESHOLD_PCT:
-        return LEVEL_2
-    else:
-        return LEVEL_3
+
+def _position_deltas(local_vals: Sequence[Any], remote_vals: Sequence[Any]) -> List[int]:
+    """Indices where |local - remote| > MIN_RECONCILE_THRESHOLD_USD, ascending."""
+    if np is not None and len(local_vals) >= _VECTOR_MIN_POSITIONS:
+        delta = np.abs(
+            np.asarray(local_vals, dtype=np.float64) - np.asarray(remote_vals, dtype=np.float64)
+        )
+        return np.flatnonzero(delta > MIN_RECONCILE_THRESHOLD_USD).tolist()
+    return [
+        i for i, (l, r) in enumerate(zip(local_vals, remote_vals))
+        if abs(l - r) > MIN_RECONCILE_THRESHOLD_USD
+    ]
 
 
 class ReconcileEngine:
     """Reconciliation engine with mismatch tracking."""
 
     def __init__(self, wallet_usd: float = 100.0) -> None:
-        self.wallet_usd = wallet_usd
+        self.wallet_usd = wallet_usd  # also sets the level thresholds
         self._mismatches = []  # type: List[Mismatch]
         self._last_reconcile_at = 0.0
         self._cumulative_level1_count = 0
 
+    @property
+    def wallet_usd(self) -> float:
+        return self._wallet_usd
+
+    @wallet_usd.setter
+    def wallet_usd(self, value: float) -> None:
+        self._wallet_usd = value
+        self._level_thresholds = level_thresholds(value)
+
+    def classify(self, delta_abs: float) -> int:
+        """classify_mismatch against this engine's wallet (thresholds precomputed)."""
+        t2, t3 = self._level_thresholds
+        return LEVEL_1 + (not delta_abs < t2) + (not delta_abs < t3)
+
     def reconcile_positions(
         self,
         local_positions: Dict[str, Dict[str, Any]],
         remote_positions: Dict[str, Dict[str, Any]],
     ) -> List[Mismatch]:
-        """Compare local vs remote positions. Return mismatches."""
-        self._last_reconcile_at = time.time()
-        mismatches = []  # type: List[Mismatch]
+        """Compare local vs remote positions. Return mismatches.
 
-        # Check all local positions
-        all_markets = set(local_positions.keys()) | set(remote_positions.keys())
+        A position on one side only is always Level-3.  Positions on both
+        sides are diffed in one pass (see _position_deltas) and only those
+        past MIN_RECONCILE_THRESHOLD_USD become Mismatch objects.
+        """
+        now = time.time()
+        self._last_reconcile_at = now
+        mismatches = []  # type: List[Mismatch]
 
-        for mid in all_markets:
-            local = local_positions.get(mid)
+        both = []  # type: List[str]
+        local_vals = []  # type: List[Any]
+        remote_vals = []  # type: List[Any]
+        for mid, local in local_positions.items():
             remote = remote_positions.get(mid)
-
-            if local and not remote:
-                mm = Mismatch(
-                    field="position_{}".format(mid),
-                    local_value=local.get("notional_usd", 0),
-                    remote_value=0,
-                    delta_abs=local.get("notional_usd", 0),
-                    level=LEVEL_3,
-                )
-                mismatches.append(mm)
-            elif remote and not local:
-                mm = Mismatch(
-                    field="position_{}".format(mid),
-                    local_value=0,
-                    remote_value=remote.get("notional_usd", 0),
-                    delta_abs=remote.get("notional_usd", 0),
-                    level=LEVEL_3,
-                )
-                mismatches.append(mm)
-            elif local and remote:
-                local_notional = local.get("notional_usd", 0)
-                remote_notional = remote.get("notional_usd", 0)
-                delta = abs(local_notional - remote_notional)
-
-                if delta > MIN_RECONCILE_THRESHOLD_USD:
-                    level = classify_mismatch(delta, self.wallet_usd)
-                    mm = Mismatch(
-                        field="position_{}".format(mid),
-                        local_value=local_notional,
-                        remote_value=remote_notional,
-                        delta_abs=delta,
-                        level=level,
-                    )
-                    mismatches.append(mm)
+            if local and remote:
+                both.append(mid)
+                local_vals.append(local.get("notional_usd", 0))
+                remote_vals.append(remote.get("notional_usd", 0))
+            elif local:
+                notional = local.get("notional_usd", 0)
+                mismatches.append(Mismatch(
+                    "position_{}".format(mid), notional, 0, notional, LEVEL_3, now,
+                ))
+            elif remote:
+                notional = remote.get("notional_usd", 0)
+                mismatches.append(Mismatch(
+                    "position_{}".format(mid), 0, notional, notional, LEVEL_3, now,
+                ))
+        for mid, remote in remote_positions.items():
+            if remote and mid not in local_positions:
+                notional = remote.get("notional_usd", 0)
+                mismatches.append(Mismatch(
+                    "position_{}".format(mid), 0, notional, notional, LEVEL_3, now,
+                ))
+
+        for i in _position_deltas(local_vals, remote_vals):
+            delta = abs(local_vals[i] - remote_vals[i])
+            mismatches.append(Mismatch(
+                "position_{}".format(both[i]), local_vals[i], remote_vals[i], delta,
+                self.classify(delta), now,
+            ))
 
         self._mismatches.extend(mismatches)
 
@@ -16,10 +16,14 @@ import time
 import uuid
 from typing import Any, List, Optional
 
+import orjson
+
 from polyedge.constants import ASK_SUM_HIGH, ASK_SUM_LOW, BOOK_LEVELS_REQUIRED
 
 logger = logging.getLogger(__name__)
 
+_NAN = float("nan")
+
 
 class Snapshot:
     """Immutable orderbook snapshot per spec §7.2."""
@@ -62,6 +66,26 @@ class Snapshot:
         self.ask_sum_anomaly = ask_sum_anomaly
         self.invalid_book_anomaly = invalid_book_anomaly
 
+        # Derived once here for the trigger fast loop; NaN when a side is
+        # missing so comparisons against them are simply False.
+        if best_bid_yes is not None and best_ask_yes is not None:
+            self.spread_yes = best_ask_yes - best_bid_yes
+            self.mid_yes = (best_bid_yes + best_ask_yes) / 2.0
+        else:
+            self.spread_yes = _NAN
+            self.mid_yes = _NAN
+        self.top3_depth_yes = _top3_depth(depth_yes)
+        self.top3_depth_no = _top3_depth(depth_no)
+
+
+def _top3_depth(levels: List[List[float]]) -> float:
+    """Sum of the sizes at the top BOOK_LEVELS_REQUIRED (3) levels (0.0 when
+    empty); the depth filter and slippage buffer both read this."""
+    total = 0.0
+    for level in (levels or [])[:BOOK_LEVELS_REQUIRED]:
+        total += level[1]
+    return total
+
 
 def canonical_orderbook_json(
     best_bid_yes: Optional[float],
@@ -75,6 +99,10 @@ def canonical_orderbook_json(
 
     Keys sorted, ASCII-safe, no trailing whitespace.
     Floats serialised to 6 decimal places for determinism.
+
+    Serialised with orjson: every value is a pre-formatted numeric string
+    or null, so the compact output is byte-identical to the stdlib's
+    ``sort_keys``/``separators=(",", ":")`` form and existing hashes hold.
     """
 
     def _fmt(v: Optional[float]) -> Optional[str]:
@@ -94,7 +122,7 @@ def canonical_orderbook_json(
         "depth_yes": _fmt_levels(depth_yes),
     }
 
-    return json.dumps(obj, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode("ascii")
 
 
 def compute_orderbook_hash(canonical_json: str) -> bytes:
@@ -20,7 +20,7 @@ import os
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +41,8 @@ class WALSyncError(Exception):
 class WALWriter:
     """Append-only WAL writer with fsync per record.
 
-    Each write atomically appends one canonical JSON line and fsyncs.
+    Each write atomically appends one canonical JSON line and fsyncs;
+    write_batch appends many lines under a single fsync.
     """
 
     def __init__(self, wal_path: str) -> None:
@@ -82,6 +83,43 @@ class WALWriter:
         if self._fd is None:
             raise WALSyncError("WAL not opened — call open() first")
 
+        record, line_bytes = self._build(record_type, payload)
+        self._append(line_bytes)
+
+        logger.debug("WAL record written: type=%s id=%s", record_type, record["event_id"])
+        return record
+
+    def write_batch(
+        self, record_type: str, payloads: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Append several records of one type with a single write + fsync.
+
+        The batch is durable only once this returns; records are not
+        individually synced, so callers must not act on any of them before
+        then.  Returns the full record dicts in input order.
+        Raises WALSyncError on any I/O failure.
+        """
+        if record_type not in VALID_RECORD_TYPES:
+            raise ValueError("Invalid WAL record type: {}".format(record_type))
+
+        if self._fd is None:
+            raise WALSyncError("WAL not opened — call open() first")
+
+        records = []  # type: List[Dict[str, Any]]
+        lines = []  # type: List[bytes]
+        for payload in payloads:
+            record, line_bytes = self._build(record_type, payload)
+            records.append(record)
+            lines.append(line_bytes)
+        if lines:
+            self._append(b"".join(lines))
+
+        logger.debug("WAL batch written: type=%s count=%d", record_type, len(records))
+        return records
+
+    @staticmethod
+    def _build(record_type: str, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], bytes]:
+        """Return (record, canonical line bytes) for one WAL entry."""
         record = {
             "event_id": str(uuid.uuid4()),
             "record_type": record_type,
@@ -95,16 +133,16 @@ class WALWriter:
 
         # Compute payload hash for event_log dedup
         record["payload_hash"] = hashlib.sha256(line_bytes).hexdigest()
+        return record, line_bytes
 
+    def _append(self, data: bytes) -> None:
+        """Append bytes to the WAL and fsync."""
         try:
-            os.write(self._fd, line_bytes)
+            os.write(self._fd, data)
             os.fsync(self._fd)
         except OSError as e:
             raise WALSyncError("WAL fsync failed: {}".format(e)) from e
 
-        logger.debug("WAL record written: type=%s id=%s", record_type, record["event_id"])
-        return record
-
 
 class WALReader:
     """Iterate WAL records in offset order (deterministic)."""
@@ -15,6 +15,8 @@ import logging
 import time
 from typing import Any, Callable, Coroutine, Dict, List, Optional, Set
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
@@ -271,9 +273,9 @@ class OrderbookWSClient:
                     break
 
                 try:
-                    msg = json.loads(raw_msg)
+                    msg = orjson.loads(raw_msg)  # hot path: one parse per book update
                     self._handle_message(msg)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning("WS: non-JSON message received")
                 except Exception as e:
                     logger.error("WS message processing error: %s", e)
@@ -1,10 +1,20 @@
 """Tests for AI Swarm interface (spec §12)."""
 
+import asyncio
+import json
+
+import pytest
+
+from polyedge import ai_interface
 from polyedge.ai_interface import (
+    AISwarm,
     build_analysis_prompt,
     check_quorum,
     compute_prompt_hash,
+    build_analysis_prompt_parts,
     compute_weighted_disagreement,
+    extract_json_text,
+    parse_model_json,
     validate_ai_response,
     DISAGREE_THRESHOLD,
 )
@@ -103,6 +113,60 @@ def test_validate_wrong_types() -> None:
     assert valid is False
 
 
+def test_validate_rejects_bool_probability() -> None:
+    """Booleans are not accepted as numeric fields."""
+    resp = {"prob_yes_raw": True, "confidence_raw": 0.5}
+    valid, errors = validate_ai_response(resp)
+    assert valid is False
+    assert any("prob_yes_raw must be numeric, got bool" in e for e in errors)
+
+
+def test_validate_non_object() -> None:
+    """Non-dict JSON (e.g. a bare list) is rejected up front."""
+    valid, errors = validate_ai_response(["not", "an", "object"])
+    assert valid is False
+    assert len(errors) == 1
+
+
+def test_validate_fast_fail_stops_at_first_error() -> None:
+    """fast_fail returns only the first error."""
+    resp = {"market_id": "mkt-001", "prob_yes_raw": 1.5}
+    valid, errors = validate_ai_response(resp, fast_fail=True)
+    assert valid is False
+    assert len(errors) == 1
+    assert "Missing" in errors[0]
+
+
+# ── JSON extraction ───────────────────────────────────────────────────────────
+
+def test_extract_json_plain() -> None:
+    """Unfenced content is returned stripped."""
+    assert extract_json_text('  {"a": 1}\n') == '{"a": 1}'
+
+
+def test_extract_json_fenced() -> None:
+    """Markdown fence (with or without language tag) is unwrapped."""
+    assert extract_json_text('```json\n{"a": 1}\n```').strip() == '{"a": 1}'
+    assert extract_json_text('```\n{"a": 1}\n```\ntrailing').strip() == '{"a": 1}'
+
+
+def test_extract_json_unclosed_fence() -> None:
+    """Unclosed fence takes everything after the opening line."""
+    assert extract_json_text('```json\n{"a": 1}').strip() == '{"a": 1}'
+
+
+def test_parse_model_json_tolerates_surrounding_text() -> None:
+    """Leading chatter and trailing commentary around the object are ignored."""
+    assert parse_model_json('Sure! {"a": 1} Hope this helps.') == {"a": 1}
+    assert parse_model_json('{"a": {"b": [1, 2]}}.') == {"a": {"b": [1, 2]}}
+
+
+def test_parse_model_json_no_object() -> None:
+    """Text with no JSON object still raises a decode error."""
+    with pytest.raises(json.JSONDecodeError):
+        parse_model_json("I cannot answer that.")
+
+
 # ── Quorum ────────────────────────────────────────────────────────────────────
 
 def test_quorum_met() -> None:
@@ -223,3 +287,140 @@ def test_build_prompt_includes_evidence() -> None:
     prompt = build_analysis_prompt(market, evidence_bundle=evidence)
     assert "Fed cuts rates" in prompt
     assert "Tier 1" in prompt
+
+
+# ── Session lifecycle ─────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_swarm_reuses_session() -> None:
+    """One session is shared across calls and closed on exit."""
+    async with AISwarm(api_key="sk-or-test") as swarm:
+        s1 = await swarm._get_session()
+        s2 = await swarm._get_session()
+        assert s1 is s2
+    assert s1.closed
+    assert swarm._session is None
+
+
+@pytest.mark.asyncio
+async def test_swarm_bounds_concurrent_requests(monkeypatch) -> None:
+    """No more than max_concurrent_requests model calls run at once."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_call(session, model_key, prompt, api_key, market_id, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"model": model_key, "weight": 1, "parse_ok": False}
+
+    monkeypatch.setattr(ai_interface, "call_single_model", fake_call)
+    async with AISwarm(api_key="sk-or-test", max_concurrent_requests=2) as swarm:
+        await asyncio.gather(*(
+            swarm.analyze("mkt-{}".format(i), "cand-{}".format(i), {"title": "T"})
+            for i in range(3)
+        ))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_swarm_caches_valid_responses(monkeypatch) -> None:
+    """Re-analysing an identical prompt is served from the cache."""
+    calls = []
+
+    async def fake_call(session, model_key, prompt, api_key, market_id, **kwargs):
+        calls.append(model_key)
+        response = {"market_id": market_id, "prob_yes_raw": 0.55}
+        return {
+            "model": model_key, "weight": 1, "parse_ok": True, "response": response,
+            "prob_yes_raw": 0.55, "latency_ms": 120, "cache_hit": False,
+        }
+
+    monkeypatch.setattr(ai_interface, "call_single_model", fake_call)
+    async with AISwarm(api_key="sk-or-test") as swarm:
+        first = await swarm.analyze("mkt-1", "cand-1", {"title": "T"})
+        second = await swarm.analyze("mkt-2", "cand-2", {"title": "T"})
+
+    assert len(calls) == len(ai_interface.SWARM_MODELS)
+    assert first["quorum_met"] is True
+    assert first["aggregated_prob_yes"] == pytest.approx(0.55)
+    assert first["models_valid"] == len(ai_interface.SWARM_MODELS)
+    assert not any(r["cache_hit"] for r in first["model_results"])
+    assert all(r["cache_hit"] for r in second["model_results"])
+    assert all(r["latency_ms"] == 0 for r in second["model_results"])
+    assert second["model_results"][0]["response"]["market_id"] == "mkt-2"
+
+
+@pytest.mark.asyncio
+async def test_swarm_cache_isolated_from_returned_results(monkeypatch) -> None:
+    """Mutating a returned result does not change what later cache hits return."""
+
+    async def fake_call(session, model_key, prompt, api_key, market_id, **kwargs):
+        response = {"market_id": market_id, "prob_yes_raw": 0.55}
+        return {
+            "model": model_key, "weight": 1, "parse_ok": True, "response": response,
+            "prob_yes_raw": 0.55, "latency_ms": 120, "cache_hit": False,
+        }
+
+    monkeypatch.setattr(ai_interface, "call_single_model", fake_call)
+    async with AISwarm(api_key="sk-or-test") as swarm:
+        first = await swarm.analyze("mkt-1", "cand-1", {"title": "T"})
+        for r in first["model_results"]:
+            r["prob_yes_raw"] = 0.99
+            r["response"]["prob_yes_raw"] = 0.99
+        second = await swarm.analyze("mkt-2", "cand-2", {"title": "T"})
+
+    assert all(r["cache_hit"] for r in second["model_results"])
+    assert all(r["prob_yes_raw"] == 0.55 for r in second["model_results"])
+    assert all(r["response"]["prob_yes_raw"] == 0.55 for r in second["model_results"])
+
+
+def test_disagreement_wide_swarm_matches_scalar(monkeypatch) -> None:
+    """Vectorized path (wide result sets) agrees with the scalar path."""
+    results = [
+        {"weight": 1 + (i % 3), "prob_yes_raw": (i % 10) / 10.0}
+        for i in range(100)
+    ]
+    wide = compute_weighted_disagreement(results)
+    monkeypatch.setattr(ai_interface, "np", None)
+    scalar = compute_weighted_disagreement(results)
+    assert abs(wide - scalar) < 1e-12
+
+
+def test_build_prompt_parts_stable_prefix() -> None:
+    """Changing evidence leaves the prompt prefix (and its hash) unchanged."""
+    market = {"title": "Test", "description": "", "category": "", "resolution_source": "", "end_date_utc": ""}
+    ev_a = {"items": [{"title": "A", "text": "a"}]}
+    ev_b = {"items": [{"title": "B", "text": "b"}]}
+    prefix_a, suffix_a = build_analysis_prompt_parts(market, evidence_bundle=ev_a)
+    prefix_b, suffix_b = build_analysis_prompt_parts(market, evidence_bundle=ev_b)
+    assert prefix_a == prefix_b
+    assert suffix_a != suffix_b
+    assert build_analysis_prompt(market, evidence_bundle=ev_a) == prefix_a + "\n" + suffix_a
+
+
+@pytest.mark.asyncio
+async def test_swarm_exits_early_on_quorum(monkeypatch) -> None:
+    """A straggler is cancelled once the faster models reach quorum."""
+    slow_model = "z-ai/glm-5"  # weight 1: the other three carry weight 5
+
+    async def fake_call(session, model_key, prompt, api_key, market_id, **kwargs):
+        if model_key == slow_model:
+            await asyncio.sleep(30)
+        return {
+            "model": model_key, "weight": ai_interface.SWARM_MODELS[model_key]["weight"],
+            "parse_ok": True, "response": {"market_id": market_id, "prob_yes_raw": 0.6},
+            "prob_yes_raw": 0.6, "latency_ms": 5, "cache_hit": False,
+        }
+
+    monkeypatch.setattr(ai_interface, "call_single_model", fake_call)
+    async with AISwarm(api_key="sk-or-test") as swarm:
+        result = await asyncio.wait_for(swarm.analyze("mkt-1", "cand-1", {"title": "T"}), 2)
+
+    assert result["quorum_met"] is True
+    assert result["models_valid"] == 3
+    by_model = {r["model"]: r for r in result["model_results"]}
+    assert list(by_model) == list(ai_interface.SWARM_MODELS)
+    assert "quorum reached" in by_model[slow_model]["error"]
@@ -1,5 +1,10 @@
 """Tests for AI Budget Manager (spec §13)."""
 
+import heapq
+import time
+
+import pytest
+
 from polyedge.budget import (
     BudgetDeniedError,
     BudgetManager,
@@ -8,6 +13,13 @@ from polyedge.budget import (
 )
 
 
+def _expire(bm: BudgetManager, reservation_id: str) -> None:
+    """Backdate a reservation's expiry 30s into the past (and re-index it)."""
+    r = bm._reservations[reservation_id]
+    r.expires_mono = time.monotonic() - 30
+    heapq.heappush(bm._expiry_heap, (r.expires_mono, reservation_id))
+
+
 # ── Cap computation ───────────────────────────────────────────────────────────
 
 def test_daily_cap_user_limit() -> None:
@@ -65,6 +77,20 @@ def test_reserve_multiple_same_correlation() -> None:
     bm.reserve("model2", 0.01, "same-corr")
     bm.reserve("model3", 0.01, "same-corr")
     # All should succeed since they share correlation_id
+    assert bm.stats["analyses_today"] == 1
+
+
+def test_analysis_count_cap() -> None:
+    """New correlation ids past the daily analysis cap are denied; known ones are not."""
+    from polyedge.budget import AI_ANALYSES_PER_DAY_HARD_CAP
+
+    bm = BudgetManager(wallet_usd=1000.0)
+    for i in range(AI_ANALYSES_PER_DAY_HARD_CAP):
+        bm.settle(bm.reserve("m", 0.0001, "c{}".format(i)), 0.0001)
+
+    with pytest.raises(BudgetDeniedError, match="Analysis count"):
+        bm.reserve("m", 0.0001, "c-new")
+    bm.reserve("m", 0.0001, "c0")
 
 
 # ── Settlement ────────────────────────────────────────────────────────────────
@@ -124,10 +150,7 @@ def test_reaper_force_settles_expired() -> None:
     rid = bm.reserve("model1", 0.10, "c1")
 
     # Manually expire the reservation
-    from datetime import datetime, timedelta, timezone
-    bm._reservations[rid]["expires_at"] = (
-        datetime.now(timezone.utc) - timedelta(seconds=30)
-    )
+    _expire(bm, rid)
 
     count = bm.reap_expired()
     assert count == 1
@@ -140,10 +163,7 @@ def test_reaper_force_settle_no_double_decrement() -> None:
     bm = BudgetManager(wallet_usd=1000.0)
     rid = bm.reserve("model1", 0.10, "c1")
 
-    from datetime import datetime, timedelta, timezone
-    bm._reservations[rid]["expires_at"] = (
-        datetime.now(timezone.utc) - timedelta(seconds=30)
-    )
+    _expire(bm, rid)
 
     bm.reap_expired()
     # Try to settle after force-settle
@@ -156,13 +176,9 @@ def test_reaper_degraded_threshold() -> None:
     """>=3 force-settles triggers is_degraded."""
     bm = BudgetManager(wallet_usd=1000.0)
 
-    from datetime import datetime, timedelta, timezone
-
     for i in range(3):
         rid = bm.reserve("model{}".format(i), 0.01, "c{}".format(i))
-        bm._reservations[rid]["expires_at"] = (
-            datetime.now(timezone.utc) - timedelta(seconds=30)
-        )
+        _expire(bm, rid)
         bm.reap_expired()
 
     assert bm.is_degraded is True
@@ -192,3 +208,148 @@ def test_parallel_reservations_respect_daily_cap() -> None:
 
     # Total in_flight should be 0.35
     assert abs(bm.stats["in_flight_usd"] - 0.35) < 0.001
+
+
+def test_threaded_reservations_respect_caps() -> None:
+    """Concurrent reserve() calls from threads never overshoot the caps."""
+    import threading
+
+    bm = BudgetManager(wallet_usd=1000.0)  # daily_cap=2.00, window_cap=0.40
+    granted = []
+    barrier = threading.Barrier(8)
+
+    def worker(n: int) -> None:
+        barrier.wait()
+        for i in range(20):
+            try:
+                rid = bm.reserve("m", 0.01, "c{}-{}".format(n, i))
+            except BudgetDeniedError:
+                continue
+            granted.append(rid)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Never above the 0.40 window cap; float rounding may cost the last slot
+    assert 39 <= len(granted) <= 40
+    assert abs(bm.stats["in_flight_usd"] - 0.01 * len(granted)) < 1e-9
+    assert bm.stats["in_flight_usd"] <= bm.window_cap + 1e-9
+
+
+# ── Rolling window ────────────────────────────────────────────────────────────
+
+def test_window_sum_tracks_reserved_only() -> None:
+    """Window sum rises on reserve and drops on settle/release."""
+    bm = BudgetManager(wallet_usd=1000.0)  # window_cap=0.40
+    r1 = bm.reserve("m1", 0.10, "c1")
+    r2 = bm.reserve("m2", 0.20, "c2")
+    assert abs(bm.stats["window_sum"] - 0.30) < 1e-9
+
+    bm.settle(r1, 0.05)
+    assert abs(bm.stats["window_sum"] - 0.20) < 1e-9
+
+    bm.release(r2)
+    assert bm.stats["window_sum"] == 0.0
+
+
+def test_window_sum_evicts_old_reservations() -> None:
+    """Reservations older than the window no longer count."""
+    bm = BudgetManager(wallet_usd=1000.0)
+    bm.reserve("m1", 0.10, "c1")
+    ts, usd, rid = bm._window[0]
+    bm._window[0] = (time.monotonic() - 3600, usd, rid)
+
+    assert bm.stats["window_sum"] == 0.0
+    assert bm.stats["in_flight_usd"] == 0.10
+
+
+def test_reaper_skips_settled_reservations() -> None:
+    """Reaper ignores reservations settled before they expired."""
+    bm = BudgetManager(wallet_usd=1000.0)
+    rid = bm.reserve("model1", 0.10, "c1")
+    bm.settle(rid, 0.05)
+    _expire(bm, rid)
+    assert bm.reap_expired() == 0
+    assert bm.stats["spent_usd"] == 0.05
+
+
+def test_reaper_uses_monotonic_clock(monkeypatch) -> None:
+    """Expiry is judged on the monotonic clock, not wall-clock datetimes."""
+    from polyedge import budget
+
+    bm = BudgetManager(wallet_usd=1000.0)
+    bm.reserve("model1", 0.10, "c1")
+    assert bm.reap_expired() == 0
+
+    later = time.monotonic() + budget.DEFAULT_RESERVATION_EXPIRY_SEC + 10
+    monkeypatch.setattr(budget, "_mono_now", lambda: later)
+    assert bm.reap_expired() == 1
+    assert bm.stats["window_sum"] == 0.0
+
+
+def test_reservation_record_fields() -> None:
+    """Reservations are slotted records carrying both clocks."""
+    from polyedge import budget
+
+    bm = BudgetManager(wallet_usd=1000.0)
+    rid = bm.reserve("model1", 0.10, "c1")
+    r = bm._reservations[rid]
+    assert r.status is budget.STATUS_RESERVED
+    assert r.status.name == "RESERVED"
+    assert r.reserved_usd == 0.10
+    assert r.actual_usd is None
+    assert r.expires_mono > r.ts_mono
+    assert not hasattr(r, "__dict__")
+
+
+def test_day_rollover_checked_only_after_midnight_deadline() -> None:
+    """Counters reset once the cached next-midnight deadline has passed."""
+    from datetime import timedelta
+
+    bm = BudgetManager(wallet_usd=1000.0)
+    bm.settle(bm.reserve("model1", 0.10, "c1"), 0.10)
+    bm._today -= timedelta(days=1)
+
+    # Deadline not reached: the date is not even re-read
+    assert bm.stats["spent_usd"] == 0.10
+
+    bm._next_rollover_mono = 0.0
+    stats = bm.stats
+    assert stats["spent_usd"] == 0.0
+    assert stats["analyses_today"] == 0
+    assert bm._reservations == {}
+    assert bm._next_rollover_mono > time.monotonic()
+
+
+def test_reservation_ids_unique_per_manager() -> None:
+    """Reservation ids never repeat within or across managers."""
+    a = BudgetManager(wallet_usd=1000.0)
+    b = BudgetManager(wallet_usd=1000.0)
+    ids = [a.reserve("m", 0.01, "c{}".format(i)) for i in range(5)]
+    ids += [b.reserve("m", 0.01, "c{}".format(i)) for i in range(5)]
+    assert len(set(ids)) == 10
+    assert all(isinstance(rid, str) for rid in ids)
+
+
+def test_stats_cached_until_mutation_or_window_expiry(monkeypatch) -> None:
+    """stats reuses its snapshot until a mutation or the window clock moves."""
+    from polyedge import budget
+
+    bm = BudgetManager(wallet_usd=1000.0)
+    rid = bm.reserve("model1", 0.10, "c1")
+    first = bm.stats
+    first["spent_usd"] = 99.0  # callers get a copy
+    assert bm._stats_cache is not None
+    assert bm.stats["spent_usd"] == 0.0
+
+    bm.settle(rid, 0.05)
+    assert bm.stats["spent_usd"] == 0.05
+
+    bm.reserve("model2", 0.10, "c2")
+    assert bm.stats["window_sum"] == 0.10
+    later = time.monotonic() + budget.AI_WINDOW_SEC + 1
+    monkeypatch.setattr(budget, "_mono_now", lambda: later)
+    assert bm.stats["window_sum"] == 0.0
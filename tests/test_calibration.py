@@ -1,7 +1,13 @@
 """Tests for Calibration + Trust Control (spec §14)."""
 
+import random
+
+import pytest
+
+from polyedge import calibration
 from polyedge.calibration import (
     REASON_P_EFF_OUTLIER,
+    BrierStreamer,
     brier_score,
     calibration_bins,
     compute_p_eff,
@@ -32,6 +38,20 @@ def test_brier_moderate() -> None:
     assert abs(brier_score(preds, outcomes) - 0.25) < 0.001
 
 
+def test_brier_streamer_matches_batch() -> None:
+    """Streaming per-category updates equal the batch Brier score."""
+    preds = [0.9, 0.2, 0.6, 0.4]
+    outcomes = [1, 0, 0, 1]
+    bs = BrierStreamer()
+    assert bs.score("politics") == 1.0
+    for p, o in zip(preds, outcomes):
+        last = bs.update("politics", p, o)
+    assert last == pytest.approx(brier_score(preds, outcomes))
+    assert bs.score("politics") == last
+    assert bs.count("politics") == 4
+    assert bs.count("sports") == 0
+
+
 # ── Calibration bins ──────────────────────────────────────────────────────────
 
 def test_bins_basic() -> None:
@@ -45,6 +65,32 @@ def test_bins_basic() -> None:
     assert len(populated) == 4
 
 
+def _calibration_sample(n: int):
+    rng = random.Random(7)
+    preds = [rng.random() for _ in range(n)] + [0.0, 0.1, 1.0, -0.2, 1.3]
+    outcomes = [rng.randint(0, 1) for _ in range(len(preds))]
+    return preds, outcomes
+
+
+def test_brier_and_bins_numpy_match_scalar(monkeypatch) -> None:
+    """Vectorized Brier/bins agree with the pure-Python path (edges included)."""
+    pytest.importorskip("numpy")
+    preds, outcomes = _calibration_sample(500)
+
+    fast_brier = brier_score(preds, outcomes)
+    fast_bins = calibration_bins(preds, outcomes)
+    monkeypatch.setattr(calibration, "np", None)
+    slow_brier = brier_score(preds, outcomes)
+    slow_bins = calibration_bins(preds, outcomes)
+
+    assert fast_brier == pytest.approx(slow_brier)
+    assert [b["count"] for b in fast_bins] == [b["count"] for b in slow_bins]
+    assert sum(b["count"] for b in fast_bins) == 503  # -0.2 and 1.3 are out of range
+    for fb, sb in zip(fast_bins, slow_bins):
+        assert fb["predicted_mean"] == pytest.approx(sb["predicted_mean"])
+        assert fb["observed_fraction"] == pytest.approx(sb["observed_fraction"])
+
+
 # ── w_ai control law ─────────────────────────────────────────────────────────
 
 def test_w_ai_zero_under_threshold() -> None:
@@ -74,6 +120,15 @@ def test_w_ai_reduced_for_high_dispute() -> None:
     assert w_low > w_high
 
 
+def test_w_ai_zero_for_extreme_disagreement() -> None:
+    """Disagreement ≥ 1/3 zeroes w_ai regardless of later factors."""
+    w = compute_w_ai(
+        n_resolved=100, disagreement=0.5, dispute_risk=0.9,
+        evidence_tier_mix={"tier1": 0},
+    )
+    assert w == 0.0
+
+
 # ── p_eff computation ─────────────────────────────────────────────────────────
 
 def test_p_eff_no_ai_influence() -> None:
@@ -1,15 +1,24 @@
 """Tests for candidate pipeline: triggers, anti-spoof persistence, rate limiting."""
 
+import asyncio
 import time
 import uuid
 from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
 
 from polyedge.candidates import (
+    CandidateBatcher,
     CandidateRateLimiter,
     TriggerState,
     create_candidate,
     detect_triggers,
+    enqueue_candidate,
     is_candidate_expired,
+    market_end_epoch,
+    update_candidate_status,
+    STATUS_DECIDED,
     STATUS_NEW,
     TRIGGER_MID_MOVE,
     TRIGGER_SPREAD_CHANGE,
@@ -74,6 +83,31 @@ def test_detect_spread_change() -> None:
     assert TRIGGER_SPREAD_CHANGE in triggers
 
 
+def test_detect_no_price_triggers_with_missing_side() -> None:
+    """A missing best bid/ask never fires spread_change or mid_move."""
+    prev = _make_snapshot(bid_yes=0.45, ask_yes=0.48)
+    curr = _make_snapshot(bid_yes=None, ask_yes=0.60)
+    triggers = detect_triggers("mkt-001", curr, prev)
+    assert TRIGGER_SPREAD_CHANGE not in triggers
+    assert TRIGGER_MID_MOVE not in triggers
+
+
+def test_detect_no_price_triggers_with_zero_prev_price() -> None:
+    """A previous bid or ask of 0.0 counts as missing, as before precomputation."""
+    curr = _make_snapshot(bid_yes=0.45, ask_yes=0.48)
+    for prev in (_make_snapshot(bid_yes=0.0, ask_yes=0.48),
+                 _make_snapshot(bid_yes=0.45, ask_yes=0.0)):
+        triggers = detect_triggers("mkt-001", curr, prev)
+        assert TRIGGER_SPREAD_CHANGE not in triggers
+        assert TRIGGER_MID_MOVE not in triggers
+
+    # A zero current bid against a priced previous snapshot still compares
+    prev = _make_snapshot(bid_yes=0.45, ask_yes=0.48)
+    triggers = detect_triggers("mkt-001", _make_snapshot(bid_yes=0.0, ask_yes=0.48), prev)
+    assert TRIGGER_SPREAD_CHANGE in triggers
+    assert TRIGGER_MID_MOVE in triggers
+
+
 def test_detect_no_triggers_without_prev() -> None:
     """First snapshot (no prev) produces no triggers."""
     curr = _make_snapshot()
@@ -81,6 +115,29 @@ def test_detect_no_triggers_without_prev() -> None:
     assert len(triggers) == 0
 
 
+def test_detect_approaching_resolution_memoizes_end_date() -> None:
+    """end_date_utc is parsed once and cached on the market dict."""
+    from polyedge.candidates import TRIGGER_APPROACHING_RESOLUTION
+
+    end = datetime.now(timezone.utc) + timedelta(hours=2)
+    market = {"end_date_utc": end.isoformat().replace("+00:00", "Z")}
+    curr = _make_snapshot()
+    assert TRIGGER_APPROACHING_RESOLUTION in detect_triggers("mkt-001", curr, None, market)
+    assert market["end_date_epoch"] == end.timestamp()
+
+    # Cached value wins over the raw field
+    market["end_date_utc"] = "garbage"
+    assert TRIGGER_APPROACHING_RESOLUTION in detect_triggers("mkt-001", curr, None, market)
+
+
+def test_market_end_epoch_unparseable() -> None:
+    """Missing or malformed end dates resolve to None (and are cached)."""
+    market = {"end_date_utc": "not-a-date"}
+    assert market_end_epoch(market) is None
+    assert "end_date_epoch" in market
+    assert market_end_epoch({}) is None
+
+
 # ── Trigger persistence (anti-spoof) ─────────────────────────────────────────
 
 def test_trigger_state_needs_persistence() -> None:
@@ -96,9 +153,9 @@ def test_trigger_state_meets_persistence() -> None:
 
     # Manually set first_seen to past
     ts.record_trigger("mkt-001", TRIGGER_MID_MOVE, "snap-1")
-    key = ("mkt-001", TRIGGER_MID_MOVE)
-    ts._state[key]["first_seen"] = time.time() - 10  # 10s ago
-    ts._state[key]["count"] = 2  # Already 2 updates
+    entry = ts._state["mkt-001"][TRIGGER_MID_MOVE]
+    entry["first_seen"] = time.monotonic() - 10  # 10s ago
+    entry["count"] = 2  # Already 2 updates
 
     # Third update should meet threshold (count=3, elapsed>6s)
     result = ts.record_trigger("mkt-001", TRIGGER_MID_MOVE, "snap-3")
@@ -110,7 +167,7 @@ def test_trigger_state_same_snapshot_not_counted() -> None:
     ts = TriggerState()
     ts.record_trigger("mkt-001", TRIGGER_MID_MOVE, "snap-1")
     ts.record_trigger("mkt-001", TRIGGER_MID_MOVE, "snap-1")  # Same
-    assert ts._state[("mkt-001", TRIGGER_MID_MOVE)]["count"] == 1
+    assert ts._state["mkt-001"][TRIGGER_MID_MOVE]["count"] == 1
 
 
 def test_trigger_state_clear() -> None:
@@ -118,7 +175,20 @@ def test_trigger_state_clear() -> None:
     ts = TriggerState()
     ts.record_trigger("mkt-001", TRIGGER_MID_MOVE, "snap-1")
     ts.clear_trigger("mkt-001", TRIGGER_MID_MOVE)
-    assert ("mkt-001", TRIGGER_MID_MOVE) not in ts._state
+    assert "mkt-001" not in ts._state
+
+
+def test_trigger_state_clear_market() -> None:
+    """Clearing a market drops only that market's triggers."""
+    ts = TriggerState()
+    ts.record_trigger("mkt-001", TRIGGER_MID_MOVE, "snap-1")
+    ts.record_trigger("mkt-001", TRIGGER_SPREAD_CHANGE, "snap-1")
+    ts.record_trigger("mkt-002", TRIGGER_MID_MOVE, "snap-2")
+    assert sorted(ts.active_triggers("mkt-001")) == [TRIGGER_MID_MOVE, TRIGGER_SPREAD_CHANGE]
+
+    ts.clear_market("mkt-001")
+    assert ts.active_triggers("mkt-001") == []
+    assert ts.active_triggers("mkt-002") == [TRIGGER_MID_MOVE]
 
 
 # ── Rate limiting ─────────────────────────────────────────────────────────────
@@ -150,6 +220,30 @@ def test_rate_limiter_different_markets() -> None:
     assert rl.can_enqueue("mkt-002") is True
 
 
+def test_rate_limiter_window_expires() -> None:
+    """Enqueues older than 60s stop counting towards the per-market cap."""
+    rl = CandidateRateLimiter()
+    for _ in range(10):
+        rl.record_enqueue("mkt-001")
+    assert rl.can_enqueue("mkt-001") is False
+
+    old = rl._market_timestamps["mkt-001"]
+    for i in range(len(old)):
+        old[i] -= 61.0
+    assert rl.can_enqueue("mkt-001") is True
+    assert len(old) == 0
+
+
+def test_rate_limiter_gc_drops_idle_markets() -> None:
+    """Idle per-market buckets are dropped by the periodic sweep."""
+    rl = CandidateRateLimiter()
+    rl.record_enqueue("mkt-001")
+    rl._market_timestamps["mkt-001"][0] -= 61.0
+    rl._last_gc -= 61.0
+    rl.can_enqueue("mkt-002")
+    assert "mkt-001" not in rl._market_timestamps
+
+
 # ── Candidate creation ────────────────────────────────────────────────────────
 
 def test_create_candidate_fields() -> None:
@@ -166,10 +260,147 @@ def test_candidate_expired() -> None:
     """Candidate older than CANDIDATE_MAX_AGE_SEC is expired."""
     c = create_candidate("mkt-001", "snap-001", ["mid_move"])
     c["created_at_utc"] = datetime.now(timezone.utc) - timedelta(seconds=200)
+    c["created_at_epoch"] = c["created_at_utc"].timestamp()
+    assert is_candidate_expired(c) is True
+
+
+def test_candidate_expired_from_db_string() -> None:
+    """Rows without created_at_epoch parse created_at_utc once and memoize it."""
+    created = datetime.now(timezone.utc) - timedelta(seconds=200)
+    c = {"created_at_utc": created.isoformat().replace("+00:00", "Z")}
     assert is_candidate_expired(c) is True
+    assert c["created_at_epoch"] == created.timestamp()
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+def test_candidate_expired_naive_is_utc(monkeypatch) -> None:
+    """Naive created_at_utc values are UTC, whatever the local timezone."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        created = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=2)
+        assert is_candidate_expired({"created_at_utc": created}) is True
+        assert is_candidate_expired({"created_at_utc": created.isoformat()}) is True
+        fresh = datetime.now(timezone.utc).replace(tzinfo=None)
+        assert is_candidate_expired({"created_at_utc": fresh}) is False
+        assert is_candidate_expired({"created_at_utc": fresh}, now_utc=fresh) is False
+    finally:
+        monkeypatch.undo()
+        time.tzset()
 
 
 def test_candidate_not_expired() -> None:
     """Fresh candidate is not expired."""
     c = create_candidate("mkt-001", "snap-001", ["mid_move"])
     assert is_candidate_expired(c) is False
+
+
+@pytest.mark.asyncio
+async def test_candidate_status_persisted_by_name() -> None:
+    """Status enums are written to the DB as their names."""
+    pool = AsyncMock()
+    c = create_candidate("mkt-001", str(uuid.uuid4()), ["mid_move"])
+    await enqueue_candidate(pool, c)
+    assert pool.execute.call_args.args[6] == "NEW"
+
+    await update_candidate_status(pool, c["candidate_id"], STATUS_DECIDED)
+    args = pool.execute.call_args.args
+    assert args[2] == "DECIDED"
+    assert args[4] is not None  # decided_at_utc set
+
+    await update_candidate_status(pool, uuid.UUID(c["candidate_id"]), "DROPPED")
+    args = pool.execute.call_args.args
+    assert args[1] == uuid.UUID(c["candidate_id"])
+    assert args[2] == "DROPPED"
+
+
+@pytest.mark.asyncio
+async def test_candidate_batcher_single_executemany() -> None:
+    """Queued candidates are written in one executemany on close."""
+    pool = AsyncMock()
+    async with CandidateBatcher(pool, max_delay_sec=10.0) as batcher:
+        for _ in range(3):
+            await batcher.submit(create_candidate("mkt-001", str(uuid.uuid4()), ["mid_move"]))
+    pool.executemany.assert_awaited_once()
+    rows = pool.executemany.call_args.args[1]
+    assert len(rows) == 3
+    assert rows[0][4] == '["mid_move"]'
+    assert rows[0][5] == "NEW"
+    pool.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_candidate_batcher_flushes_on_delay_and_size() -> None:
+    """Batches flush after max_delay_sec, and split at max_batch rows."""
+    pool = AsyncMock()
+    batcher = CandidateBatcher(pool, max_batch=2, max_delay_sec=0.01)
+    await batcher.submit(create_candidate("mkt-001", str(uuid.uuid4()), ["mid_move"]))
+    await asyncio.sleep(0.05)
+    assert pool.executemany.await_count == 1
+
+    for _ in range(3):
+        await batcher.submit(create_candidate("mkt-001", str(uuid.uuid4()), ["mid_move"]))
+    await batcher.aclose()
+    sizes = [len(c.args[1]) for c in pool.executemany.call_args_list]
+    assert sizes == [1, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_candidate_batcher_flush_writes_immediately() -> None:
+    """flush() writes queued rows without waiting for max_delay_sec."""
+    pool = AsyncMock()
+    batcher = CandidateBatcher(pool, max_delay_sec=10.0)
+    await batcher.flush()  # nothing queued yet
+    for _ in range(2):
+        await batcher.submit(create_candidate("mkt-001", str(uuid.uuid4()), ["mid_move"]))
+    await asyncio.wait_for(batcher.flush(), 1.0)
+    assert [len(c.args[1]) for c in pool.executemany.call_args_list] == [2]
+    await batcher.aclose()
+    pool.executemany.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_candidate_batcher_surfaces_failed_batch() -> None:
+    """A failed executemany is re-raised from flush/submit/aclose, not dropped."""
+    pool = AsyncMock()
+    pool.executemany.side_effect = RuntimeError("fk violation")
+    batcher = CandidateBatcher(pool, max_delay_sec=0.01)
+    await batcher.submit(create_candidate("mkt-001", str(uuid.uuid4()), ["mid_move"]))
+    with pytest.raises(RuntimeError, match="fk violation"):
+        await batcher.flush()
+
+    # Written in the background; the next submit raises and queues nothing
+    await batcher.submit(create_candidate("mkt-001", str(uuid.uuid4()), ["mid_move"]))
+    await asyncio.sleep(0.05)
+    with pytest.raises(RuntimeError, match="fk violation"):
+        await batcher.submit(create_candidate("mkt-001", str(uuid.uuid4()), ["mid_move"]))
+    assert pool.executemany.await_count == 2
+
+    await batcher.submit(create_candidate("mkt-001", str(uuid.uuid4()), ["mid_move"]))
+    with pytest.raises(RuntimeError, match="fk violation"):
+        await batcher.aclose()
+    assert pool.executemany.await_count == 3
+
+
+def test_trigger_reasons_json_cached_for_known_triggers() -> None:
+    """Known trigger lists serialize once; unknown ones are not cached."""
+    from polyedge import candidates
+
+    assert candidates._trigger_reasons_json(["mid_move", "depth_drop"]) == '["mid_move", "depth_drop"]'
+    assert ("mid_move", "depth_drop") in candidates._TRIGGER_REASONS_JSON
+    assert candidates._trigger_reasons_json(["custom"]) == '["custom"]'
+    assert ("custom",) not in candidates._TRIGGER_REASONS_JSON
+
+
+def test_shared_tick_clock_is_used() -> None:
+    """Explicit now_utc / now_mono readings drive expiry and persistence."""
+    now = datetime.now(timezone.utc)
+    c = create_candidate("mkt-001", "snap-001", ["mid_move"], now_utc=now)
+    assert c["created_at_utc"] == now
+    assert is_candidate_expired(c, now_utc=now + timedelta(seconds=200)) is True
+    assert is_candidate_expired(c, now_utc=now) is False
+
+    ts = TriggerState()
+    ts.record_trigger("mkt-001", TRIGGER_MID_MOVE, "snap-1", now_mono=100.0)
+    ts.record_trigger("mkt-001", TRIGGER_MID_MOVE, "snap-2", now_mono=103.0)
+    assert ts.record_trigger("mkt-001", TRIGGER_MID_MOVE, "snap-3", now_mono=110.0) is True
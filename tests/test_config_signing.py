@@ -1,5 +1,6 @@
 """Tests for config signing and manifest verification."""
 
+import hashlib
 import json
 import os
 import tempfile
@@ -7,6 +8,7 @@ from pathlib import Path
 
 import pytest
 
+from polyedge import config_signing
 from polyedge.config_signing import (
     ConfigTamperError,
     compute_file_hash,
@@ -17,6 +19,14 @@ from polyedge.config_signing import (
 OPERATOR_KEY = "test-operator-key-2025"
 
 
+@pytest.fixture(autouse=True)
+def verify_cache(tmp_path_factory, monkeypatch) -> Path:
+    """Keep the verify cache out of the real ~/.cache."""
+    path = tmp_path_factory.mktemp("cache") / "verify.cache"
+    monkeypatch.setattr(config_signing, "VERIFY_CACHE_PATH", path)
+    return path
+
+
 @pytest.fixture
 def config_dir(tmp_path: Path) -> Path:
     """Create a minimal config directory with all required files."""
@@ -30,13 +40,25 @@ def config_dir(tmp_path: Path) -> Path:
 
 
 def test_compute_file_hash(tmp_path: Path) -> None:
-    """SHA-256 hash is deterministic for same content."""
+    """BLAKE2b-256 hash is deterministic for same content."""
     f = tmp_path / "test.txt"
     f.write_text("hello world")
     h1 = compute_file_hash(f)
     h2 = compute_file_hash(f)
     assert h1 == h2
-    assert len(h1) == 64  # hex SHA-256
+    assert len(h1) == 64  # hex BLAKE2b-256
+
+
+def test_compute_file_hash_large_file_and_fallback(tmp_path: Path, monkeypatch) -> None:
+    """Multi-chunk files hash to plain BLAKE2b-256 with and without file_digest."""
+    data = os.urandom((3 << 20) + 123)
+    f = tmp_path / "big.bin"
+    f.write_bytes(data)
+    expected = hashlib.blake2b(data, digest_size=32).hexdigest()
+    assert compute_file_hash(f) == expected
+
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    assert compute_file_hash(f) == expected
 
 
 def test_manifest_generation(config_dir: Path) -> None:
@@ -82,3 +104,89 @@ def test_manifest_missing_manifest_file(config_dir: Path) -> None:
     """Missing manifest.json triggers ConfigTamperError."""
     with pytest.raises(ConfigTamperError, match="not found"):
         verify_manifest(config_dir, OPERATOR_KEY)
+
+
+def test_manifest_old_schema_rejected(config_dir: Path) -> None:
+    """A v2.5 (HMAC-SHA256) manifest fails verification with a clear error."""
+    generate_manifest(config_dir, OPERATOR_KEY)
+    mpath = config_dir / "manifest.json"
+    manifest = json.loads(mpath.read_text())
+    manifest["schema_version"] = "polyedge.manifest.v2.5"
+    mpath.write_text(json.dumps(manifest))
+    with pytest.raises(ConfigTamperError, match="Unsupported manifest schema"):
+        verify_manifest(config_dir, OPERATOR_KEY)
+
+
+def test_manifest_long_operator_key(config_dir: Path) -> None:
+    """Keys beyond BLAKE2b's 64-byte limit work and are not truncated."""
+    long_key = "k" * 100
+    generate_manifest(config_dir, long_key)
+    assert verify_manifest(config_dir, long_key) is True
+    with pytest.raises(ConfigTamperError, match="signature"):
+        verify_manifest(config_dir, long_key[:64])
+
+
+def test_verify_cache_skips_rehash(config_dir: Path, verify_cache: Path, monkeypatch) -> None:
+    """A repeat verification with unchanged files is served from the cache."""
+    generate_manifest(config_dir, OPERATOR_KEY)
+    assert verify_manifest(config_dir, OPERATOR_KEY) is True
+    assert verify_cache.is_file()
+
+    def _boom(path):
+        raise AssertionError("re-hashed {}".format(path))
+
+    monkeypatch.setattr(config_signing, "compute_file_hash", _boom)
+    assert verify_manifest(config_dir, OPERATOR_KEY) is True
+
+
+def test_verify_cache_invalidated_by_edit_and_key(config_dir: Path) -> None:
+    """Edits after a cached verification and wrong keys are still caught."""
+    generate_manifest(config_dir, OPERATOR_KEY)
+    assert verify_manifest(config_dir, OPERATOR_KEY) is True
+    with pytest.raises(ConfigTamperError, match="signature verification failed"):
+        verify_manifest(config_dir, "wrong-key")
+
+    st = os.stat(config_dir / "config.yaml")
+    (config_dir / "config.yaml").write_text("key: evil\n")  # same size
+    os.utime(config_dir / "config.yaml", ns=(st.st_atime_ns, st.st_mtime_ns))
+    with pytest.raises(ConfigTamperError, match="Hash mismatch"):
+        verify_manifest(config_dir, OPERATOR_KEY)
+
+
+def test_verify_cache_unwritable_is_non_fatal(config_dir: Path, tmp_path: Path) -> None:
+    """Verification still succeeds when the cache cannot be written."""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    generate_manifest(config_dir, OPERATOR_KEY)
+    assert verify_manifest(config_dir, OPERATOR_KEY, cache_path=blocker / "verify.cache")
+
+
+def test_manifest_files_canonical_order() -> None:
+    """MANIFEST_FILES is pre-sorted, so hashes come back in canonical order."""
+    assert list(config_signing.MANIFEST_FILES) == sorted(config_signing.MANIFEST_FILES)
+
+
+def test_manifest_signature_payload(config_dir: Path) -> None:
+    """The streamed signature equals keyed BLAKE2b over the joined name=hash lines."""
+    manifest = generate_manifest(config_dir, OPERATOR_KEY)
+    payload = "\n".join(
+        "{}={}".format(k, v) for k, v in sorted(manifest["file_hashes"].items())
+    ).encode("utf-8")
+    expected = hashlib.blake2b(payload, key=OPERATOR_KEY.encode(), digest_size=32).hexdigest()
+    assert manifest["signature"] == expected
+
+
+def test_compute_file_hash_fadvise(tmp_path: Path, monkeypatch) -> None:
+    """Hashing advises sequential read-ahead then drops the pages; works without fadvise."""
+    f = tmp_path / "cfg.yaml"
+    f.write_bytes(b"key: value\n")
+    expected = compute_file_hash(f)
+
+    if hasattr(os, "posix_fadvise"):
+        calls = []
+        monkeypatch.setattr(os, "posix_fadvise", lambda fd, off, ln, adv: calls.append(adv))
+        assert compute_file_hash(f) == expected
+        assert calls == [os.POSIX_FADV_SEQUENTIAL, os.POSIX_FADV_DONTNEED]
+
+    monkeypatch.delattr(os, "posix_fadvise", raising=False)
+    assert compute_file_hash(f) == expected
@@ -0,0 +1,183 @@
+"""Tests for the migration runner (no live Postgres; fake pool/connection)."""
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from polyedge import db
+
+
+class _FakeConn:
+    """Records executed SQL; `applied` seeds the _migrations table."""
+
+    def __init__(self, applied: List[str]) -> None:
+        self.applied = list(applied)
+        self.executed = []  # type: List[Any]
+        self.in_tx = False
+        self.tx_count = 0
+        self.timeouts = []  # type: List[Any]
+
+    async def execute(self, query: str, *args: Any, timeout: Any = None) -> str:
+        self.executed.append((query, args, self.in_tx))
+        self.timeouts.append(timeout)
+        return "OK"
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        if query.startswith("INSERT INTO _migrations"):
+            self.executed.append((query, args, self.in_tx))
+            if args[0] in self.applied:
+                return None
+            self.applied.append(args[0])
+            return args[0]
+        assert "array_agg(name)" in query
+        return list(self.applied)
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.in_tx = True
+        self.tx_count += 1
+        try:
+            yield
+        finally:
+            self.in_tx = False
+
+
+class _FakePool:
+    def __init__(self, conn: _FakeConn) -> None:
+        self.conn = conn
+        self.acquire_count = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.acquire_count += 1
+        yield self.conn
+
+
+@pytest.fixture
+def mdir(tmp_path: Path) -> Path:
+    for name in ("001_a", "002_b", "003_c"):
+        (tmp_path / "{}.sql".format(name)).write_text("SELECT '{}';\n".format(name))
+    return tmp_path
+
+
+async def test_run_migrations_records_and_reuses_connection(mdir: Path, monkeypatch) -> None:
+    """Pending files run on one connection and are recorded in-transaction."""
+    conn = _FakeConn(applied=["001_a"])
+    pool = _FakePool(conn)
+
+    async def _get_pool():
+        return pool
+
+    monkeypatch.setattr(db, "get_pool", _get_pool)
+
+    assert await db.run_migrations(mdir) == ["002_b", "003_c"]
+    assert pool.acquire_count == 1
+    assert conn.tx_count == 2
+    inserts = [(args, in_tx) for q, args, in_tx in conn.executed if q.startswith("INSERT")]
+    assert inserts == [(("002_b",), True), (("003_c",), True)]
+    # Migration files run under their own timeout, not the pool's command_timeout
+    assert conn.timeouts[-2:] == [db.MIGRATION_TIMEOUT_SEC] * 2
+
+    # Second sweep is a no-op now that names are recorded
+    assert await db.run_migrations(mdir) == []
+
+
+async def test_run_migrations_skips_concurrently_claimed(mdir: Path, monkeypatch) -> None:
+    """A file claimed by another runner after the applied-set load is not re-run."""
+    conn = _FakeConn(applied=[])
+    pool = _FakePool(conn)
+    real_fetchval = conn.fetchval
+
+    async def _racing_fetchval(query: str, *args: Any) -> Any:
+        result = await real_fetchval(query, *args)
+        if "array_agg" in query:
+            conn.applied.append("002_b")  # other runner commits 002 meanwhile
+        return result
+
+    async def _get_pool():
+        return pool
+
+    monkeypatch.setattr(conn, "fetchval", _racing_fetchval)
+    monkeypatch.setattr(db, "get_pool", _get_pool)
+
+    assert await db.run_migrations(mdir) == ["001_a", "003_c"]
+    ran = [q for q, _, _ in conn.executed if q.startswith("SELECT '")]
+    assert ran == ["SELECT '001_a';\n", "SELECT '003_c';\n"]
+
+
+def test_run_migrations_sync_uses_own_pool(mdir: Path, monkeypatch) -> None:
+    """The sync wrapper never reuses a pool bound to another loop, and restores it."""
+    conn = _FakeConn(applied=[])
+    created = []
+
+    class _ClosablePool(_FakePool):
+        closed = False
+
+        async def close(self) -> None:
+            self.closed = True
+
+    async def _create_pool(**kwargs):
+        pool = _ClosablePool(conn)
+        created.append(pool)
+        return pool
+
+    outer = object()
+    monkeypatch.setattr(db, "_pool", outer)
+    monkeypatch.setattr(db.asyncpg, "create_pool", _create_pool)
+
+    assert db.run_migrations_sync(mdir) == ["001_a", "002_b", "003_c"]
+    assert len(created) == 1 and created[0].closed
+    assert db._pool is outer
+
+
+async def test_bulk_insert_uses_copy(monkeypatch) -> None:
+    """bulk_insert streams tuples through copy_records_to_table; empty is a no-op."""
+    calls = []
+
+    class _CopyConn:
+        async def copy_records_to_table(self, table, records, columns):
+            calls.append((table, list(records), columns))
+            return "COPY {}".format(len(records))
+
+    pool = _FakePool(_CopyConn())  # type: ignore[arg-type]
+
+    async def _get_pool():
+        return pool
+
+    monkeypatch.setattr(db, "get_pool", _get_pool)
+
+    rows = ((i, "m{}".format(i)) for i in range(3))
+    assert await db.bulk_insert("t", ("id", "name"), rows) == "COPY 3"
+    assert calls == [("t", [(0, "m0"), (1, "m1"), (2, "m2")], ["id", "name"])]
+
+    assert await db.bulk_insert("t", ("id",), []) == "COPY 0"
+    assert pool.acquire_count == 1
+
+
+def test_get_dsn_read_once(monkeypatch) -> None:
+    """The DSN env var is read on first use and cached thereafter."""
+    db.get_dsn.cache_clear()
+    monkeypatch.setenv("POLYEDGE_DATABASE_URL", "postgresql://a/one")
+    assert db.get_dsn() == "postgresql://a/one"
+    monkeypatch.setenv("POLYEDGE_DATABASE_URL", "postgresql://a/two")
+    assert db.get_dsn() == "postgresql://a/one"
+    db.get_dsn.cache_clear()
+    monkeypatch.delenv("POLYEDGE_DATABASE_URL")
+    assert db.get_dsn() == db.DEFAULT_DSN
+    db.get_dsn.cache_clear()
+
+
+def test_pool_sizes(monkeypatch) -> None:
+    """Default min is capped at an explicit max; an explicit min above max is rejected."""
+    monkeypatch.delenv("POLYEDGE_DB_MIN", raising=False)
+    monkeypatch.delenv("POLYEDGE_DB_MAX", raising=False)
+    assert db.pool_sizes() == (db.DEFAULT_POOL_MIN_SIZE, db.DEFAULT_POOL_MAX_SIZE)
+    monkeypatch.setenv("POLYEDGE_DB_MAX", "2")
+    assert db.pool_sizes() == (2, 2)
+    monkeypatch.setenv("POLYEDGE_DB_MIN", "1")
+    assert db.pool_sizes() == (1, 2)
+    monkeypatch.setenv("POLYEDGE_DB_MIN", "3")
+    with pytest.raises(ValueError, match="POLYEDGE_DB_MIN"):
+        db.pool_sizes()
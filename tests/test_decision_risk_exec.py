@@ -79,7 +79,8 @@ def test_make_decision_trade() -> None:
     )
     assert d["side"] == "YES"
     assert d["reason_code"] == "TRADE"
-    assert d["decision_id_hex"] is not None
+    assert len(d["decision_id_hex"]) == 32
+    assert d["client_order_id"] == d["decision_id_hex"]
 
 
 def test_make_decision_no_trade() -> None:
@@ -97,14 +98,137 @@ def test_make_decision_no_trade() -> None:
     )
     assert d["side"] == "NO_TRADE"
     assert d["reason_code"] == REASON_EV_TOO_LOW
+    assert d["decision_id_hex"] == ""  # NO_TRADE is not hashed
+    assert d["client_order_id"] == ""
 
 
 def test_decision_id_deterministic() -> None:
     """Same inputs → same decision_id_hex."""
+    snap = _make_snapshot(best_bid_yes=0.40, best_ask_yes=0.42)
+    d1 = make_decision("mkt", "c1", 0.70, snap, 1.0)
+    d2 = make_decision("mkt", "c1", 0.70, snap, 1.0)
+    assert d1["side"] == "YES"
+    assert d1["decision_id_hex"] == d2["decision_id_hex"] != ""
+
+
+def test_decision_id_v3_layout() -> None:
+    """Frozen v3 vector (32 hex chars); rounding noise ignored; long ids never collide."""
+    from polyedge.decision import compute_decision_id
+
+    assert compute_decision_id("mkt-001", "cand-001", 0, 0.7, 0.42, 0.2, 0.05, 2.0) == (
+        "1ef6dfd16bcf3d594bbdebd045b3d003"
+    )
+    assert compute_decision_id("m", "c", 0, 0.7, 0.42, 0.2, 0.05, 2) == (
+        compute_decision_id("m", "c", 0, 0.7 + 1e-9, 0.42, 0.2, 0.05, 2.0)
+    )
+    long_id = "0x" + "ab" * 40
+    assert compute_decision_id(long_id + "1", "c", 0, 0.5, 0.5, 0.0, 0.0, 1.0) != (
+        compute_decision_id(long_id + "2", "c", 0, 0.5, 0.5, 0.0, 0.0, 1.0)
+    )
+    # Length prefixes keep the market/candidate boundary unambiguous
+    assert compute_decision_id("ab", "c", 0, 0.5, 0.5, 0.0, 0.0, 1.0) != (
+        compute_decision_id("a", "bc", 0, 0.5, 0.5, 0.0, 0.0, 1.0)
+    )
+
+
+def test_decide_kernel_matches_helpers() -> None:
+    """The fused kernel reproduces the compute_* helpers bit-for-bit."""
+    import random
+
+    from polyedge.decision import (
+        _decide_kernel,
+        compute_dispute_buffer,
+        compute_latency_penalty,
+        compute_required_edge,
+        compute_slippage_buffer,
+        compute_time_value_penalty,
+    )
+
+    rng = random.Random(7)
+    for _ in range(500):
+        bid_yes, bid_no = rng.uniform(0.01, 0.9), rng.uniform(0.01, 0.9)
+        ask_yes, ask_no = bid_yes + rng.uniform(-0.05, 0.1), bid_no + rng.uniform(-0.05, 0.1)
+        depth_yes, depth_no = rng.uniform(0, 500), rng.uniform(0, 500)
+        p_eff, size, risk = rng.random(), rng.uniform(0.5, 10), rng.random()
+        conflict, paper = rng.random() < 0.5, rng.random() < 0.5
+        lat, ttr, bps = rng.uniform(0, 6), rng.uniform(0, 200), rng.uniform(0, 30)
+
+        out = _decide_kernel(
+            bid_yes, ask_yes, bid_no, ask_no, depth_yes, depth_no,
+            p_eff, size, risk, conflict, lat, ttr, compute_fee_cost(bps, paper),
+        )
+        common = (
+            compute_fee_cost(bps, paper),
+            compute_dispute_buffer(risk, conflict),
+            compute_latency_penalty(lat),
+            compute_time_value_penalty(ttr),
+        )
+        edge_yes = compute_required_edge(
+            compute_spread_cost(bid_yes, ask_yes), common[0],
+            compute_slippage_buffer(size, depth_yes), *common[1:],
+        )
+        edge_no = compute_required_edge(
+            compute_spread_cost(bid_no, ask_no), common[0],
+            compute_slippage_buffer(size, depth_no), *common[1:],
+        )
+        assert out[4] == compute_ev(p_eff, ask_yes, edge_yes, "YES")
+        assert out[5] == compute_ev(p_eff, ask_no, edge_no, "NO")
+
+
+def test_decision_config_matches_per_call_fee() -> None:
+    """A DecisionConfig gives the same decisions as per-call fee arguments."""
+    from polyedge.decision import DecisionConfig
+
     snap = _make_snapshot()
-    d1 = make_decision("mkt", "c1", 0.55, snap, 1.0)
-    d2 = make_decision("mkt", "c1", 0.55, snap, 1.0)
-    assert d1["decision_id_hex"] == d2["decision_id_hex"]
+    for paper, bps in ((True, 0.0), (True, 40.0), (False, 0.0), (False, 15.0)):
+        config = DecisionConfig(is_paper=paper, fee_rate_bps=bps)
+        assert config.fee_cost == compute_fee_cost(bps, paper)
+        assert make_decision("mkt", "c1", 0.7, snap, 2.0, config=config) == make_decision(
+            "mkt", "c1", 0.7, snap, 2.0, fee_rate_bps=bps, is_paper=paper,
+        )
+
+
+def test_make_decisions_batch_matches_make_decision(monkeypatch) -> None:
+    """The batch screen returns exactly make_decision's trading decisions."""
+    import random
+
+    from polyedge import decision as decision_mod
+    from polyedge.decision import SnapshotBatch, make_decisions_batch
+
+    rng = random.Random(3)
+    snaps, p_effs, sizes, ttrs = [], [], [], []
+    for _ in range(200):
+        bid_yes, bid_no = rng.uniform(0.05, 0.9), rng.uniform(0.05, 0.9)
+        snaps.append(_make_snapshot(
+            best_bid_yes=bid_yes, best_ask_yes=bid_yes + rng.uniform(0, 0.05),
+            best_bid_no=bid_no, best_ask_no=bid_no + rng.uniform(0, 0.05),
+        ))
+        p_effs.append(rng.random())
+        sizes.append(rng.choice([1, 2.0, rng.uniform(0.5, 10)]))
+        ttrs.append(rng.uniform(0, 90))
+    mids = ["m{}".format(i) for i in range(200)]
+    cids = ["c{}".format(i) for i in range(200)]
+
+    expected = [
+        d for d in (
+            make_decision(mids[i], cids[i], p_effs[i], snaps[i], sizes[i],
+                          dispute_risk=0.1, time_to_resolution_days=ttrs[i])
+            for i in range(200)
+        ) if d["side"] != "NO_TRADE"
+    ]
+    assert 0 < len(expected) < 200
+
+    batch = SnapshotBatch.from_snapshots(snaps)
+    got = make_decisions_batch(
+        mids, cids, p_effs, batch, sizes, dispute_risks=0.1, time_to_resolution_days=ttrs,
+    )
+    assert got == expected
+
+    monkeypatch.setattr(decision_mod, "np", None)
+    batch = SnapshotBatch.from_snapshots(snaps)
+    assert make_decisions_batch(
+        mids, cids, p_effs, batch, sizes, dispute_risks=0.1, time_to_resolution_days=ttrs,
+    ) == expected
 
 
 # ── Risk Manager ──────────────────────────────────────────────────────────────
@@ -180,6 +304,55 @@ def test_lock_steal_after_expiry() -> None:
     assert version == 2
 
 
+def test_lock_held_locks_tracks_expiry_and_changes(monkeypatch) -> None:
+    """held_locks is cached but reflects expiry, renewals and releases."""
+    from polyedge import locks
+    from polyedge.constants import LOCK_TTL_SEC
+
+    clock = [1000.0]
+    monkeypatch.setattr(locks.time, "time", lambda: clock[0])
+    lm = LockManager("instance-1")
+    lm.acquire("mkt-A", "worker-1")
+    clock[0] += 1.0
+    lm.acquire("mkt-B", "worker-1")
+    assert lm.held_locks == {"mkt-A": 1, "mkt-B": 1}
+
+    lm.held_locks["mkt-C"] = 9  # callers get a copy
+    assert "mkt-C" not in lm.held_locks
+
+    lm.renew("mkt-B", "worker-1")
+    assert lm.held_locks == {"mkt-A": 1, "mkt-B": 2}
+
+    clock[0] = 1000.0 + LOCK_TTL_SEC  # mkt-A's expiry instant: still held
+    assert lm.held_locks == {"mkt-A": 1, "mkt-B": 2}
+    clock[0] += 0.5
+    assert lm.held_locks == {"mkt-B": 2}
+
+    lm.release("mkt-B", "worker-1")
+    assert lm.held_locks == {}
+
+
+def test_lock_reads_clock_once_per_call(monkeypatch) -> None:
+    """acquire/renew take one time.time() reading and stamp every field with it."""
+    from polyedge import locks
+    from polyedge.constants import LOCK_TTL_SEC
+
+    reads = []
+
+    def _clock() -> float:
+        reads.append(None)
+        return 1000.0 + len(reads)
+
+    monkeypatch.setattr(locks.time, "time", _clock)
+    lm = LockManager("instance-1")
+    lm.acquire("mkt-A", "worker-1")
+    assert len(reads) == 1
+    lm.renew("mkt-A", "worker-1")
+    assert len(reads) == 2
+    lock = lm._locks["mkt-A"]
+    assert lock.owner_heartbeat == lock.last_renewed == lock.expires_at - LOCK_TTL_SEC == 1002.0
+
+
 def test_lock_validate_success() -> None:
     """Pre-exec validation passes for valid lock."""
     lm = LockManager("instance-1")
@@ -203,8 +376,10 @@ def test_paper_submit_order() -> None:
     """Paper order is recorded."""
     eng = PaperExecutionEngine()
     order = eng.submit_order("oid-1", "mkt-001", "YES", 2.0, 0.50, "dec-1")
-    assert order["status"] == "OPEN"
+    assert order.status == "OPEN"
     assert len(eng.open_orders) == 1
+    assert order.to_dict()["decision_id_hex"] == "dec-1"
+    assert order.to_dict()["fills"] == []
 
 
 def test_paper_cancel() -> None:
@@ -231,3 +406,54 @@ def test_paper_fill_requires_through() -> None:
     # Price through by 1 tick (0.49) — pending but not sustained yet
     fill = tracker.check_fill("oid-1", "YES", limit_price=0.50, current_price=0.49)
     assert fill is None  # Need to sustain for 3s
+
+
+def test_paper_book_update_only_touches_market(monkeypatch) -> None:
+    """Fills come only from the updated market's open orders; closed orders drop out."""
+    from polyedge import execution
+
+    clock = [1000.0]
+    monkeypatch.setattr(execution.time, "time", lambda: clock[0])
+    eng = PaperExecutionEngine()
+    eng.submit_order("a", "mkt-A", "YES", 2.0, 0.50, "dec-a")
+    eng.submit_order("b", "mkt-B", "YES", 2.0, 0.50, "dec-b")
+    eng.submit_order("c", "mkt-A", "YES", 2.0, 0.50, "dec-c")
+    eng.cancel_order("c")
+
+    assert eng.process_book_update("mkt-A", best_ask=0.48, best_bid=0.47) == []
+    clock[0] += 3.0
+    fills = eng.process_book_update("mkt-A", best_ask=0.48, best_bid=0.47)
+    assert [f.order_id for f in fills] == ["a"]
+    assert eng._orders["b"].status == "OPEN"
+    assert eng._orders["c"].status == "CANCELLED"
+    assert eng.process_book_update("mkt-A", best_ask=0.40, best_bid=0.39) == []
+    assert [o.client_order_id for o in eng.open_orders] == ["b"]
+
+
+def test_paper_book_update_fills_several_orders_at_once(monkeypatch) -> None:
+    """Several orders in one market can fill on the same update."""
+    from polyedge import execution
+
+    clock = [1000.0]
+    monkeypatch.setattr(execution.time, "time", lambda: clock[0])
+    eng = PaperExecutionEngine()
+    for oid in ("a", "b", "c"):
+        eng.submit_order(oid, "mkt-A", "YES", 2.0, 0.50, "dec-" + oid)
+    eng.process_book_update("mkt-A", best_ask=0.48, best_bid=0.47)
+    clock[0] += 3.0
+    fills = eng.process_book_update("mkt-A", best_ask=0.48, best_bid=0.47)
+    assert [f.order_id for f in fills] == ["a", "b", "c"]
+    assert fills[0].fee_usd > 0
+    assert eng._orders["a"].to_dict()["fills"] == [fills[0].to_dict()]
+    assert eng.stats["open_orders"] == 0
+    assert eng.stats["total_fills"] == 3
+
+
+def test_paper_fill_uses_caller_clock() -> None:
+    """check_fill measures the sustain window on the caller-supplied clock."""
+    tracker = PaperFillTracker()
+    assert tracker.check_fill("oid-1", "YES", 0.50, 0.48, now=100.0) is None
+    assert tracker.check_fill("oid-1", "YES", 0.50, 0.48, now=102.9) is None
+    fill = tracker.check_fill("oid-1", "YES", 0.50, 0.48, now=103.0)
+    assert fill is not None
+    assert fill.fill_time == 103.0
@@ -1,13 +1,18 @@
 """Tests for Evidence Service (spec §10)."""
 
+import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 
+from polyedge import evidence
 from polyedge.evidence import (
     EvidenceFetchRateLimiter,
     EvidenceItem,
     build_evidence_bundle,
     compute_bundle_hash,
     detect_conflict,
+    fetch_evidence,
+    fetch_evidence_bundle,
     is_evidence_ttl_valid,
     is_high_stakes,
     is_thesis_required,
@@ -150,6 +155,35 @@ def test_bundle_hash_deterministic() -> None:
     assert h1 == h2
 
 
+def test_bundle_hash_frozen_vector() -> None:
+    """v2 streamed bundle hash is stable and field boundaries are unambiguous."""
+    ts = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    items = [
+        EvidenceItem("src-1", "https://example.com/a", "Title", "Body text é", ts, 1, "p", "1.0"),
+        EvidenceItem("src-2", "https://example.com/b", "T2", "x", None, 2, "p", "1.0"),
+    ]
+    assert compute_bundle_hash(items) == (
+        "b97b6a43d0fa52aac23b721b06c0468bdaf02465253e0faa7bdfbfc40748b5e7"
+    )
+    a = EvidenceItem("s", "u", "ab", "c", ts, 1, "p", "1")
+    b = EvidenceItem("s", "u", "a", "bc", ts, 1, "p", "1")
+    assert compute_bundle_hash([a]) != compute_bundle_hash([b])
+    assert compute_bundle_hash([a, b]) != compute_bundle_hash([b, a])
+
+
+def test_item_text_bytes_cached_and_invalidated() -> None:
+    """text_bytes/text_lower are derived once and refreshed when text is reassigned."""
+    item = _make_item(text="caf\u00e9")
+    assert item.text_byte_len == 5
+    assert item.text_bytes is item.text_bytes
+    assert item.text_lower is item.text_lower
+    item.text = "ABC"
+    assert item.text_bytes == b"ABC"
+    assert item.text_lower == "abc"
+    item.text = "abc"
+    assert item.to_dict()["text"] == "abc"
+
+
 def test_bundle_excludes_expired() -> None:
     items = [_make_item(source_id="old", age_seconds=7200)]
     bundle, _ = build_evidence_bundle(items, source_ttls={"old": 3600})
@@ -196,3 +230,133 @@ def test_rate_limiter_blocks_at_cap() -> None:
     for _ in range(60):
         rl.record_fetch()
     assert rl.can_fetch() is False
+
+
+def test_rate_limiter_window_expires(monkeypatch) -> None:
+    """Fetches older than an hour (monotonic clock) stop counting."""
+    import time
+
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    rl = EvidenceFetchRateLimiter()
+    for _ in range(60):
+        rl.record_fetch()
+    assert rl.can_fetch() is False
+    clock[0] += 3600.0
+    assert rl.can_fetch() is True
+    assert len(rl._timestamps) == 0
+
+
+# ── Fetching ──────────────────────────────────────────────────────────────────
+
+class _FakeResponse:
+    def __init__(self, status: int, body: bytes) -> None:
+        self.status = status
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+class _FakeSession:
+    """Serves queued (status, body) replies per URL; tracks peak concurrency."""
+
+    def __init__(self, replies) -> None:
+        self.replies = {url: list(r) for url, r in replies.items()}
+        self.calls = []  # type: list
+        self.in_flight = 0
+        self.peak = 0
+
+    @asynccontextmanager
+    async def get(self, url: str):
+        self.calls.append(url)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            yield _FakeResponse(*self.replies[url].pop(0))
+        finally:
+            self.in_flight -= 1
+
+
+def _parse(source, url, body):
+    return EvidenceItem(
+        source_id=source["source_id"],
+        url=url,
+        title="t",
+        text=body.decode("utf-8"),
+        published_at_utc=datetime.now(timezone.utc),
+        reliability_tier=source["reliability_tier"],
+        parser_name="test_parser",
+        parser_version="1.0",
+    )
+
+
+async def test_fetch_evidence_concurrent_bounded_and_ordered() -> None:
+    urls = ["https://example.com/{}".format(i) for i in range(10)]
+    session = _FakeSession({u: [(200, u.encode())] for u in urls})
+    targets = [({"source_id": "s{}".format(i), "reliability_tier": 1}, u)
+               for i, u in enumerate(urls)]
+
+    items = await fetch_evidence(session, targets, _parse, max_concurrent=4)
+    assert [i.text for i in items] == urls
+    assert session.peak == 4
+
+
+async def test_fetch_evidence_retries_and_drops_failures(monkeypatch) -> None:
+    monkeypatch.setattr(evidence, "EVIDENCE_FETCH_BACKOFF_SEC", 0.0)
+    session = _FakeSession({
+        "https://a": [(503, b""), (429, b""), (200, b"ok")],
+        "https://b": [(404, b"")],
+        "https://c": [(500, b"")] * 3,
+    })
+    src = {"source_id": "s", "reliability_tier": 1}
+    items = await fetch_evidence(
+        session, [(src, "https://a"), (src, "https://b"), (src, "https://c")], _parse,
+    )
+    assert [i.text for i in items] == ["ok"]
+    assert session.calls.count("https://a") == 3
+    assert session.calls.count("https://b") == 1  # not retryable
+    assert session.calls.count("https://c") == 3
+
+
+async def test_fetch_evidence_drops_parser_errors() -> None:
+    """A parser that raises drops that item only; the bundle still completes."""
+    session = _FakeSession({"https://a": [(200, b"ok")], "https://b": [(200, b"bad")]})
+    src = {"source_id": "s", "reliability_tier": 1}
+
+    def _picky_parse(source, url, body):
+        if body == b"bad":
+            raise ValueError("malformed")
+        return _parse(source, url, body)
+
+    items = await fetch_evidence(session, [(src, "https://a"), (src, "https://b")], _picky_parse)
+    assert [i.text for i in items] == ["ok"]
+
+
+async def test_fetch_evidence_backoff_releases_slot(monkeypatch) -> None:
+    """A source sleeping between retries does not hold a concurrency slot."""
+    monkeypatch.setattr(evidence, "EVIDENCE_FETCH_BACKOFF_SEC", 0.05)
+    session = _FakeSession({"https://a": [(503, b""), (200, b"a")], "https://b": [(200, b"b")]})
+    src = {"source_id": "s", "reliability_tier": 1}
+
+    items = await fetch_evidence(
+        session, [(src, "https://a"), (src, "https://b")], _parse, max_concurrent=1,
+    )
+    assert [i.text for i in items] == ["a", "b"]
+    assert session.calls == ["https://a", "https://b", "https://a"]
+
+
+async def test_fetch_evidence_bundle_respects_rate_limit() -> None:
+    rl = EvidenceFetchRateLimiter()
+    for _ in range(59):
+        rl.record_fetch()
+    session = _FakeSession({"https://a": [(200, b"one")], "https://b": [(200, b"two")]})
+    src = {"source_id": "s", "reliability_tier": 1}
+
+    items, bundle_hash = await fetch_evidence_bundle(
+        session, [(src, "https://a"), (src, "https://b")], _parse, rate_limiter=rl,
+    )
+    assert [i.text for i in items] == ["one"]
+    assert session.calls == ["https://a"]
+    assert bundle_hash == compute_bundle_hash(items)
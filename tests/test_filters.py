@@ -172,6 +172,14 @@ def test_filter_depth_too_thin() -> None:
     assert filter_depth(snap) == REASON_DEPTH_TOO_THIN
 
 
+def test_filter_depth_counts_top_levels_only() -> None:
+    """Size beyond the top BOOK_LEVELS_REQUIRED levels does not count."""
+    snap = _make_snapshot(
+        depth_yes=[[0.44, 10], [0.43, 10], [0.42, 10], [0.41, 1000]],
+    )
+    assert filter_depth(snap) == REASON_DEPTH_TOO_THIN
+
+
 # ── run_all_filters integration ──────────────────────────────────────────────
 
 def test_all_filters_pass() -> None:
@@ -204,3 +212,56 @@ def test_all_filters_fail_market() -> None:
     passed, reason = run_all_filters(c, m, snap)
     assert passed is False
     assert reason == REASON_MARKET_NOT_ELIGIBLE
+
+
+def test_all_filters_match_individual_filters() -> None:
+    """The fused run_all_filters agrees with the filter_* functions in order."""
+    import random
+
+    from polyedge.filters import filter_ask_sum_anomaly
+
+    rng = random.Random(11)
+    now = datetime.now(timezone.utc)
+    for _ in range(400):
+        c = _make_candidate(created_at_utc=rng.choice([
+            now - timedelta(seconds=rng.uniform(0, 200)),
+            (now - timedelta(seconds=rng.uniform(0, 200))).isoformat().replace("+00:00", "Z"),
+            "not-a-date",
+            None,
+        ]))
+        m = _make_market(
+            is_binary_eligible=rng.random() < 0.9,
+            end_date_utc=rng.choice([
+                (now + timedelta(hours=rng.uniform(-2, 24 * 60))).isoformat(),
+                "garbage",
+                None,
+            ]),
+            volume_24h_usd=rng.choice([0, None, 500, 5000]),
+            liquidity_usd=rng.choice([0, None, 1000, 10000]),
+        )
+        bid_yes, bid_no = rng.uniform(0.3, 0.6), rng.uniform(0.3, 0.6)
+        snap = _make_snapshot(
+            best_bid_yes=bid_yes, best_ask_yes=bid_yes + rng.uniform(0, 0.08),
+            best_bid_no=rng.choice([None, bid_no]), best_ask_no=bid_no + rng.uniform(0, 0.08),
+            depth_yes=[[0.4, rng.uniform(0, 300)] for _ in range(rng.randint(0, 4))],
+            depth_no=[[0.4, rng.uniform(0, 300)] for _ in range(rng.randint(0, 4))],
+            ask_sum_anomaly=rng.random() < 0.05,
+            invalid_book_anomaly=rng.random() < 0.05,
+        )
+
+        expected = (True, None)
+        for reason in (
+            filter_candidate_age(c, now),
+            filter_market_eligible(m),
+            filter_time_to_resolution(m, now),
+            filter_volume(m),
+            filter_liquidity(m),
+            filter_invalid_book(snap),
+            filter_ask_sum_anomaly(snap),
+            filter_spread(snap),
+            filter_depth(snap),
+        ):
+            if reason:
+                expected = (False, reason)
+                break
+        assert run_all_filters(c, m, snap, now_utc=now) == expected
@@ -83,6 +83,25 @@ def test_load_invalid_version() -> None:
         os.unlink(path)
 
 
+def test_load_version_parsed_once() -> None:
+    """Version is parsed at load; malformed versions are invalid."""
+    path = _write_patterns([], version="1.2")
+    try:
+        defence = InjectionDefence(path)
+        assert defence.valid is True
+        assert defence.parsed_version == (1, 2)
+    finally:
+        os.unlink(path)
+
+    path = _write_patterns([], version="1.x")
+    try:
+        defence = InjectionDefence(path)
+        assert defence.valid is False
+        assert defence.parsed_version is None
+    finally:
+        os.unlink(path)
+
+
 def test_load_missing_file() -> None:
     """Missing file marks defence as invalid."""
     defence = InjectionDefence("/nonexistent/patterns.json")
@@ -28,6 +28,19 @@ def test_classify_mismatch_levels() -> None:
     assert classify_mismatch(2.00, 100.0) == LEVEL_3   # 2%
 
 
+def test_engine_classify_uses_current_wallet() -> None:
+    """Engine thresholds follow wallet_usd and agree with classify_mismatch."""
+    eng = ReconcileEngine(wallet_usd=100.0)
+    for delta in (0.0, 0.05, 0.1, 0.3, 0.5, 2.0, float("nan")):
+        assert eng.classify(delta) == classify_mismatch(delta, 100.0)
+    assert classify_mismatch(float("nan"), 100.0) == LEVEL_3
+    assert eng.classify(0.30) == LEVEL_2
+    eng.wallet_usd = 1000.0
+    assert eng.classify(0.30) == LEVEL_1
+    eng.wallet_usd = 0.0
+    assert eng.classify(0.0) == LEVEL_3
+
+
 def test_reconcile_no_mismatches() -> None:
     eng = ReconcileEngine(wallet_usd=100.0)
     local = {"mkt-1": {"notional_usd": 10.0}}
@@ -45,6 +58,32 @@ def test_reconcile_position_missing_remote() -> None:
     assert mm[0].level == LEVEL_3
 
 
+def test_reconcile_positions_one_sided_and_deltas(monkeypatch) -> None:
+    """Vectorized and plain diffs flag the same positions with the same levels."""
+    from polyedge import reconcile
+
+    local = {"m{}".format(i): {"notional_usd": 10.0 + i} for i in range(200)}
+    remote = {k: dict(v) for k, v in local.items()}
+    remote["m3"]["notional_usd"] += 0.5   # below MIN_RECONCILE_THRESHOLD_USD
+    remote["m7"]["notional_usd"] += 1.5   # Level-3 on a $100 wallet (1.5%)
+    remote["m9"]["notional_usd"] -= 1.2
+    del remote["m11"]                     # local only
+    remote["extra"] = {"notional_usd": 4}  # remote only
+    local["m12"] = {}                      # empty local counts as missing
+
+    def _summary(mms):
+        return sorted((m.field, m.local_value, m.remote_value, m.level) for m in mms)
+
+    vec = _summary(ReconcileEngine(wallet_usd=100.0).reconcile_positions(local, remote))
+    monkeypatch.setattr(reconcile, "np", None)
+    plain = _summary(ReconcileEngine(wallet_usd=100.0).reconcile_positions(local, remote))
+    assert vec == plain
+    assert [f for f, _, _, _ in vec] == [
+        "position_extra", "position_m11", "position_m12", "position_m7", "position_m9",
+    ]
+    assert all(level == LEVEL_3 for _, _, _, level in vec)
+
+
 def test_reconcile_green_no_data() -> None:
     eng = ReconcileEngine(wallet_usd=100.0)
     green, reasons = eng.reconcile_green()
@@ -132,6 +171,28 @@ def test_arming_wrong_process() -> None:
     assert "different process" in msg
 
 
+def test_arming_verify_rereads_changed_file() -> None:
+    tmpdir = tempfile.mkdtemp()
+    ac = ArmingCeremony(
+        process_start_unix_ms=5000,
+        local_state_secret="test-secret-5",
+        arming_dir=tmpdir,
+    )
+    ac.step2_confirm(ac.step1_totp("333333"))
+    assert ac.verify_arming_file() == (True, "Armed")
+    assert ac.verify_arming_file() == (True, "Armed")  # served from cache
+
+    # Tampering with the file invalidates the cached verification
+    path = os.path.join(tmpdir, "arming.json")
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content.replace('"arming_signature": "', '"arming_signature": "00'))
+    valid, msg = ac.verify_arming_file()
+    assert valid is False
+    assert "signature" in msg
+
+
 def test_arming_nonce_mismatch() -> None:
     tmpdir = tempfile.mkdtemp()
     ac = ArmingCeremony(
@@ -222,3 +283,7 @@ def test_event_log_recent() -> None:
     for i in range(150):
         log.log_event("TEST", market_id="mkt-{}".format(i))
     assert len(log.recent_events) == 100  # Capped at 100
+    assert log.recent_events[0]["market_id"] == "mkt-50"
+    assert log.recent_events[-1]["market_id"] == "mkt-149"
+    assert len(log._events) == 100  # older events are not retained
+    assert log.stats["total_events"] == 150
@@ -1,6 +1,7 @@
 """Tests for snapshot creation, canonical hashing, and anomaly detection."""
 
 import json
+import math
 
 from polyedge.snapshots import (
     canonical_orderbook_json,
@@ -34,6 +35,16 @@ def test_canonical_orderbook_json_no_whitespace() -> None:
     assert " " not in j
 
 
+def test_canonical_orderbook_json_matches_stdlib_form() -> None:
+    """Output is byte-identical to the stdlib canonical form (hash-stable)."""
+    j = canonical_orderbook_json(0.45, None, 0.52, 0.55, [[0.44, 100]], [[0.51, 200.5]])
+    expected = json.dumps(
+        json.loads(j), sort_keys=True, ensure_ascii=True, separators=(",", ":"),
+    )
+    assert j == expected
+    assert '"best_ask_yes":null' in j
+
+
 def test_orderbook_hash_deterministic() -> None:
     """Same canonical JSON produces same hash."""
     j = canonical_orderbook_json(0.45, 0.48, 0.52, 0.55, [], [])
@@ -139,3 +150,24 @@ def test_create_snapshot_fields() -> None:
     assert len(snap.orderbook_hash) == 32
     assert snap.ask_sum_anomaly is False  # 0.48 + 0.55 = 1.03
     assert snap.invalid_book_anomaly is False
+
+
+def test_snapshot_derived_fields() -> None:
+    """Spread, mid and top-3 depth are precomputed; missing sides are NaN."""
+    book = {
+        "best_bid_yes": 0.45,
+        "best_ask_yes": 0.49,
+        "depth_yes": [[0.44, 100], [0.43, 200], [0.42, 300], [0.41, 400]],
+        "depth_no": [[0.50, 25.5]],
+    }
+    snap = create_snapshot("mkt-001", book)
+    assert abs(snap.spread_yes - 0.04) < 1e-12
+    assert abs(snap.mid_yes - 0.47) < 1e-12
+    assert snap.top3_depth_yes == 600
+    assert snap.top3_depth_no == 25.5
+
+    empty = create_snapshot("mkt-001", {})
+    assert math.isnan(empty.spread_yes)
+    assert math.isnan(empty.mid_yes)
+    assert empty.top3_depth_yes == 0.0
+    assert empty.top3_depth_no == 0.0
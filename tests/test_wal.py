@@ -190,3 +190,31 @@ async def test_wal_replay_db_failure(wal_path: Path) -> None:
 
     with pytest.raises(WALSyncError, match="DB insert failed"):
         await replay_wal(wal_path, pool)
+
+
+def test_wal_write_batch_single_fsync(wal_path: Path) -> None:
+    """write_batch appends every record in order under one fsync."""
+    real_fsync = os.fsync
+    calls = []
+
+    def _counting_fsync(fd: int) -> None:
+        calls.append(fd)
+        real_fsync(fd)
+
+    with patch("polyedge.wal.os.fsync", side_effect=_counting_fsync):
+        with WALWriter(wal_path) as writer:
+            records = writer.write_batch("STATE_CHANGED", [{"n": i} for i in range(5)])
+            assert writer.write_batch("STATE_CHANGED", []) == []
+
+    assert len(calls) == 1
+    read = WALReader(wal_path).read_all()
+    assert [r["payload"]["n"] for r in read] == [0, 1, 2, 3, 4]
+    assert [r["event_id"] for r in read] == [r["event_id"] for r in records]
+
+
+def test_wal_write_batch_invalid_type(wal_path: Path) -> None:
+    """An invalid type rejects the whole batch before anything is written."""
+    with WALWriter(wal_path) as writer:
+        with pytest.raises(ValueError, match="Invalid WAL record type"):
+            writer.write_batch("INVALID_TYPE", [{"n": 1}])
+    assert WALReader(wal_path).read_all() == []